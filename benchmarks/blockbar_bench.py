@@ -0,0 +1,236 @@
+"""
+benchmarks/blockbar_bench.py
+============================
+Micro-benchmark of the ``BlockBar`` render path.
+
+For each bar width this script renders a fixed set of bars through
+``Console.render`` in three modes:
+
+    - text     — the previous implementation, building a ``Text`` per render
+    - uncached — the segment path with the bar cache cleared before each
+      render (every render is a cache miss)
+    - cached   — the segment path with a warm bar cache
+
+and reports median / p95 / mean time per bar in microseconds, the speed-up
+of the cached path over the ``Text`` path, and the cache hit rate as JSON.
+
+Typical usage::
+
+    python -m benchmarks.blockbar_bench
+    python -m benchmarks.blockbar_bench --widths 20,60 --rounds 50 --output bars.json
+"""
+
+import argparse
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+from importlib.metadata import version
+
+from rich.console import Console, ConsoleOptions, RenderResult
+from rich.text import Text
+
+from ui.node_panel import BlockBar, get_bar_cache, severity_style
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Default bar widths (in cells) covered by a run.
+DEFAULT_WIDTHS: tuple[int, ...] = (12, 30, 60)
+
+#: Default number of measured rounds per width and mode.
+DEFAULT_ROUNDS: int = 30
+
+#: Bar values rendered per round (every percentage, both bar variants).
+BAR_VALUES: tuple[int, ...] = tuple(range(101))
+
+#: Rounds run before measuring, to warm caches.
+WARMUP_ROUNDS: int = 2
+
+
+# ---------------------------------------------------------------------------
+# Reference implementation
+# ---------------------------------------------------------------------------
+
+
+class _TextBlockBar(BlockBar):
+    """``BlockBar`` rendered the way it was before the segment cache."""
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        max_width = options.max_width or 0
+        bracket_width = 2 if self.show_brackets else 0
+        inner_width = max(1, max_width - bracket_width)
+
+        filled = int(round(inner_width * self.value / 100))
+        empty = max(0, inner_width - filled)
+
+        bar = Text()
+        if self.show_brackets:
+            bar.append("[", style="grey70")
+        if filled:
+            bar.append(self.fill * filled, style=self.fill_style)
+        if empty:
+            bar.append(self.empty * empty, style=self.empty_style)
+        if self.show_brackets:
+            bar.append("]", style="grey70")
+        yield bar
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_bars(bar_class: type) -> list[BlockBar]:
+    """Return one bracketed and one metric-row style bar per value."""
+    bars = []
+    for value in BAR_VALUES:
+        bars.append(bar_class(value))
+        bars.append(
+            bar_class(
+                value,
+                show_brackets=False,
+                fill_style=severity_style(value),
+                empty_style="grey35",
+            )
+        )
+    return bars
+
+
+def _stats(samples: list[float]) -> dict:
+    """Summarize per-bar timing samples (seconds) in microseconds."""
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        "median_us": round(statistics.median(ordered) * 1e6, 3),
+        "p95_us": round(ordered[p95_index] * 1e6, 3),
+        "mean_us": round(statistics.fmean(ordered) * 1e6, 3),
+    }
+
+
+def _time_round(console: Console, options: ConsoleOptions, bars: list, clear: bool) -> float:
+    """Render every bar once and return the mean time per bar in seconds."""
+    cache = get_bar_cache()
+    render = console.render
+    started = time.perf_counter()
+    for bar in bars:
+        if clear:
+            cache.clear()
+        for _segment in render(bar, options):
+            pass
+    return (time.perf_counter() - started) / len(bars)
+
+
+def _run_mode(
+    console: Console,
+    options: ConsoleOptions,
+    bars: list,
+    rounds: int,
+    clear: bool,
+) -> list[float]:
+    """Return the per-bar timing of *rounds* measured rounds."""
+    for _ in range(WARMUP_ROUNDS):
+        _time_round(console, options, bars, clear)
+    return [_time_round(console, options, bars, clear) for _ in range(rounds)]
+
+
+# ---------------------------------------------------------------------------
+# Benchmark runner
+# ---------------------------------------------------------------------------
+
+
+def run_case(width: int, rounds: int) -> dict:
+    """Benchmark every render mode at one bar *width*."""
+    console = Console(
+        file=io.StringIO(),
+        width=width,
+        force_terminal=True,
+        color_system="truecolor",
+    )
+    options = console.options.update_width(width)
+    cache = get_bar_cache()
+
+    text = _run_mode(console, options, _make_bars(_TextBlockBar), rounds, clear=False)
+    uncached = _run_mode(console, options, _make_bars(BlockBar), rounds, clear=True)
+
+    cache.clear()
+    cache.hits = cache.misses = 0
+    cached = _run_mode(console, options, _make_bars(BlockBar), rounds, clear=False)
+    lookups = cache.hits + cache.misses
+
+    result = {
+        "width": width,
+        "bars_per_round": len(BAR_VALUES) * 2,
+        "rounds": rounds,
+        "text": _stats(text),
+        "uncached": _stats(uncached),
+        "cached": _stats(cached),
+        "cache_hit_rate": round(cache.hits / lookups, 4) if lookups else 0.0,
+    }
+    result["speedup_cached_vs_text"] = round(
+        result["text"]["median_us"] / max(result["cached"]["median_us"], 1e-9), 2
+    )
+    return result
+
+
+def run_benchmarks(widths: tuple[int, ...], rounds: int) -> dict:
+    """Run every width and return the JSON-ready report."""
+    results = []
+    for width in widths:
+        results.append(run_case(width, rounds))
+        print(
+            f"width={width:<4} text={results[-1]['text']['median_us']}us "
+            f"cached={results[-1]['cached']['median_us']}us "
+            f"x{results[-1]['speedup_cached_vs_text']}",
+            file=sys.stderr,
+        )
+
+    return {
+        "python": platform.python_version(),
+        "rich": version("rich"),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse arguments, run the benchmark and write the JSON report."""
+    parser = argparse.ArgumentParser(description="Benchmark BlockBar rendering.")
+    parser.add_argument(
+        "--widths",
+        default=",".join(str(width) for width in DEFAULT_WIDTHS),
+        help="comma-separated bar widths in cells",
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=DEFAULT_ROUNDS,
+        help="measured rounds per width and mode",
+    )
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        tuple(int(width) for width in args.widths.split(",")),
+        max(1, args.rounds),
+    )
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(payload + "\n")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""
+benchmarks/render_bench.py
+==========================
+Render-path benchmark harness for the dashboard.
+
+For each combination of node count, grid preset and terminal size this
+script times three stages over a number of frames:
+
+    - fetch  — one ``get_cluster_state()`` call of the cluster provider
+    - build  — ``build_content_page("nodes", {"cluster": cluster})``
+    - render — a full Rich render of the ``build_layout()`` tree into an
+      off-screen ``Console``
+
+and reports median / p95 / mean timings in milliseconds plus allocation
+figures (traced peak bytes and net live blocks) per frame as JSON.
+
+Four nodes use the fake demo provider; larger clusters use the seeded
+synthetic provider, so runs are comparable between builds.
+
+Typical usage::
+
+    python -m benchmarks.render_bench --output bench.json
+    python -m benchmarks.render_bench --nodes 4,1000 --sizes 120x40 --frames 10
+"""
+
+import argparse
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from importlib.metadata import version
+
+from rich.console import Console
+
+import ui.nodes_page as nodes_page
+from dashboard import MENU_ITEMS, render_footer, render_header
+from data.fake_cluster import get_cluster_state
+from data.synthetic_cluster import MIN_SYNTHETIC_NODES, SyntheticCluster
+from ui.layout import build_layout
+from ui.pages import build_content_page
+from ui.sidebar import build_sidebar
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Default node counts covered by a run.
+DEFAULT_NODE_COUNTS: tuple[int, ...] = (4, 100, 1000, 5000, 20000, 50000)
+
+#: Default terminal sizes covered by a run, as ``(width, height)``.
+DEFAULT_SIZES: tuple[tuple[int, int], ...] = ((80, 24), (120, 40), (200, 60))
+
+#: Default number of measured frames per combination.
+DEFAULT_FRAMES: int = 20
+
+#: Frames run before measuring, to warm caches.
+WARMUP_FRAMES: int = 2
+
+#: Seed used for synthetic clusters.
+BENCH_SEED: int = 1234
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_provider(node_count: int):
+    """Return a cluster-state provider for *node_count* nodes."""
+    if node_count < MIN_SYNTHETIC_NODES:
+        return get_cluster_state
+    return SyntheticCluster(node_count, seed=BENCH_SEED).get_cluster_state
+
+
+@contextmanager
+def _grid_preset(preset: str):
+    """Temporarily select a node-grid preset for the nodes page."""
+    previous = nodes_page.GRID_PRESET
+    nodes_page.GRID_PRESET = preset
+    try:
+        yield
+    finally:
+        nodes_page.GRID_PRESET = previous
+
+
+def _stats(samples: list[float]) -> dict:
+    """Summarize timing samples (seconds) in milliseconds."""
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        "median_ms": round(statistics.median(ordered) * 1000, 3),
+        "p95_ms": round(ordered[p95_index] * 1000, 3),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+    }
+
+
+def _timed(func, *args):
+    """Call ``func(*args)`` and return ``(result, elapsed_seconds)``."""
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def _render(console: Console, layout) -> None:
+    """Render *layout* into the off-screen *console* and discard the output."""
+    console.file.seek(0)
+    console.file.truncate()
+    console.print(layout)
+
+
+def _run_frame(
+    provider,
+    layout,
+    console: Console,
+    start_time: float,
+) -> tuple[float, float, float]:
+    """Run one fetch → build → render frame and return the stage timings."""
+    cluster, fetch = _timed(provider)
+    page, build = _timed(build_content_page, "nodes", {"cluster": cluster})
+
+    layout["header"].update(render_header())
+    layout["sidebar"].update(build_sidebar(MENU_ITEMS, "nodes"))
+    layout["footer"].update(render_footer(start_time))
+    layout["content"].update(page)
+
+    _, render = _timed(_render, console, layout)
+    return fetch, build, render
+
+
+def _measure_allocations(
+    provider,
+    layout,
+    console: Console,
+    start_time: float,
+    frames: int,
+) -> dict:
+    """Return average traced peak bytes and net live blocks per frame."""
+    peaks: list[int] = []
+    blocks: list[int] = []
+
+    tracemalloc.start()
+    try:
+        for _ in range(frames):
+            tracemalloc.reset_peak()
+            before_blocks = sys.getallocatedblocks()
+            before_bytes, _ = tracemalloc.get_traced_memory()
+            _run_frame(provider, layout, console, start_time)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before_bytes)
+            blocks.append(sys.getallocatedblocks() - before_blocks)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "alloc_peak_bytes": int(statistics.fmean(peaks)),
+        "alloc_net_blocks": int(statistics.fmean(blocks)),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Benchmark runner
+# ---------------------------------------------------------------------------
+
+
+def run_case(node_count: int, preset: str, size: tuple[int, int], frames: int) -> dict:
+    """Benchmark one ``(node_count, preset, size)`` combination."""
+    width, height = size
+    provider = _make_provider(node_count)
+    layout = build_layout()
+    console = Console(
+        file=io.StringIO(),
+        width=width,
+        height=height,
+        force_terminal=True,
+        color_system="truecolor",
+    )
+    start_time = time.time()
+
+    fetch: list[float] = []
+    build: list[float] = []
+    render: list[float] = []
+
+    with _grid_preset(preset):
+        for _ in range(WARMUP_FRAMES):
+            _run_frame(provider, layout, console, start_time)
+
+        for _ in range(frames):
+            fetch_s, build_s, render_s = _run_frame(provider, layout, console, start_time)
+            fetch.append(fetch_s)
+            build.append(build_s)
+            render.append(render_s)
+
+        allocations = _measure_allocations(
+            provider, layout, console, start_time, max(1, frames // 4)
+        )
+
+    return {
+        "nodes": node_count,
+        "preset": preset,
+        "size": f"{width}x{height}",
+        "frames": frames,
+        "fetch": _stats(fetch),
+        "build": _stats(build),
+        "render": _stats(render),
+        "frame": _stats([f + b + r for f, b, r in zip(fetch, build, render)]),
+        **allocations,
+    }
+
+
+def run_benchmarks(
+    node_counts: tuple[int, ...],
+    presets: tuple[str, ...],
+    sizes: tuple[tuple[int, int], ...],
+    frames: int,
+) -> dict:
+    """Run every benchmark combination and return the JSON-ready report."""
+    results = []
+    for node_count in node_counts:
+        for preset in presets:
+            for size in sizes:
+                results.append(run_case(node_count, preset, size, frames))
+                print(
+                    f"nodes={node_count:<6} preset={preset} size={size[0]}x{size[1]} "
+                    f"frame p50={results[-1]['frame']['median_ms']}ms",
+                    file=sys.stderr,
+                )
+
+    return {
+        "python": platform.python_version(),
+        "rich": version("rich"),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+
+def _parse_sizes(value: str) -> tuple[tuple[int, int], ...]:
+    """Parse ``"80x24,120x40"`` into ``((80, 24), (120, 40))``."""
+    sizes = []
+    for item in value.split(","):
+        width, height = item.lower().split("x")
+        sizes.append((int(width), int(height)))
+    return tuple(sizes)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse arguments, run the benchmarks and write the JSON report."""
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard render path.")
+    parser.add_argument(
+        "--nodes",
+        default=",".join(str(count) for count in DEFAULT_NODE_COUNTS),
+        help="comma-separated node counts",
+    )
+    parser.add_argument(
+        "--presets",
+        default=",".join(nodes_page._GRID_PRESETS),
+        help="comma-separated grid presets",
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(f"{w}x{h}" for w, h in DEFAULT_SIZES),
+        help="comma-separated terminal sizes, e.g. 120x40",
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=DEFAULT_FRAMES,
+        help="measured frames per case",
+    )
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        tuple(int(count) for count in args.nodes.split(",")),
+        tuple(args.presets.split(",")),
+        _parse_sizes(args.sizes),
+        max(1, args.frames),
+    )
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(payload + "\n")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
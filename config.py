@@ -1,2 +1,54 @@
 # config.py
 GRID_PRESET = "3x3"  # options: "2x2", "3x2", "3x3"
+THEME = "default"  # options: "default", "light", "mono"; cycle at runtime with "c"
+
+# Cluster data provider
+DATA_PROVIDER = "fake"  # options: "fake", "synthetic", "replay", "multi"
+
+# Synthetic provider settings (used when DATA_PROVIDER = "synthetic")
+SYNTHETIC_NODE_COUNT = 1000
+SYNTHETIC_SEED = 42
+SYNTHETIC_FLAP_RATE = 0.5
+SYNTHETIC_JOIN_RATE = 0.0
+SYNTHETIC_LEAVE_RATE = 0.0
+SYNTHETIC_TICK_INTERVAL = 1.0  # simulated seconds per tick (node uptime)
+
+# Multi-cluster fleet (used when DATA_PROVIDER = "multi"). One entry per
+# cluster, in display order: "provider" is "synthetic" (options "nodes",
+# "seed") or "replay" (options "path", "speed", "loop"). Node names are
+# shown as "<cluster>/<node>".
+CLUSTERS = {
+    "eu-west": {"provider": "synthetic", "nodes": 300, "seed": 1},
+    "us-east": {"provider": "synthetic", "nodes": 300, "seed": 2},
+    "ap-south": {"provider": "synthetic", "nodes": 300, "seed": 3},
+}
+MULTI_CLUSTER_MAX_WORKERS = None  # fetch threads; None = one per cluster
+MULTI_CLUSTER_TIMEOUT = 5.0  # seconds one refresh waits for the slowest cluster
+
+# Recording / replay of cluster-state streams
+RECORD_PATH = None  # e.g. "recordings/cluster.rec" to record the active provider
+REPLAY_PATH = "recordings/cluster.rec"  # used when DATA_PROVIDER = "replay"
+REPLAY_SPEED = 1.0  # playback speed factor; None steps one record per fetch
+REPLAY_LOOP = False
+
+# Alert history (SQLite). Every alert firing / resolving is stored and the
+# Nodes alerts panel lists the latest events; None (default) disables the
+# store and the panel lists the firing alerts instead.
+ALERT_HISTORY_PATH = None  # e.g. "/var/lib/tui-monitor/alert_history.db"
+ALERT_HISTORY_RETENTION = 30 * 24 * 3600  # seconds events are kept
+
+# Prometheus provider (None disables the Prometheus page and health check)
+PROMETHEUS_URL = None  # e.g. "http://localhost:9090"
+PROMETHEUS_TIMEOUT = 2.0  # per-query timeout in seconds
+PROMETHEUS_MAX_WORKERS = 8  # concurrent queries / pooled connections
+
+# Refresh scheduling (seconds). Views not listed use the dashboard default;
+# unchanged refreshes back off up to MAX_REFRESH_INTERVAL.
+VIEW_REFRESH_INTERVALS = {
+    "nodes": 1.0,
+    "prometheus": 5.0,
+    "cluster": 5.0,
+    "gateway": 5.0,
+    "app": 5.0,
+}
+MAX_REFRESH_INTERVAL = 8.0
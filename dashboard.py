@@ -9,6 +9,10 @@ This module is responsible for the full lifecycle of the dashboard:
     - Running the main live-update loop
     - Graceful shutdown
 
+Startup cost is kept off the path to the first frame: providers that are
+not configured, pages that are not visible and the ``Live`` renderer are
+imported only when they are first needed.
+
 Typical usage::
 
     from dashboard import run_dashboard
@@ -16,30 +20,96 @@ Typical usage::
 """
 
 import time
+from typing import TYPE_CHECKING
 
 from rich.align import Align
 from rich.columns import Columns
-from rich.live import Live
+from rich.console import Group
 from rich.panel import Panel
+from rich.table import Table
 from rich.text import Text
 
-from data.fake_cluster import get_cluster_state
+from config import (
+    ALERT_HISTORY_PATH,
+    ALERT_HISTORY_RETENTION,
+    CLUSTERS,
+    DATA_PROVIDER,
+    MAX_REFRESH_INTERVAL,
+    MULTI_CLUSTER_MAX_WORKERS,
+    MULTI_CLUSTER_TIMEOUT,
+    PROMETHEUS_MAX_WORKERS,
+    PROMETHEUS_TIMEOUT,
+    PROMETHEUS_URL,
+    RECORD_PATH,
+    REPLAY_LOOP,
+    REPLAY_PATH,
+    REPLAY_SPEED,
+    SYNTHETIC_FLAP_RATE,
+    SYNTHETIC_JOIN_RATE,
+    SYNTHETIC_LEAVE_RATE,
+    SYNTHETIC_NODE_COUNT,
+    SYNTHETIC_SEED,
+    SYNTHETIC_TICK_INTERVAL,
+    THEME,
+    VIEW_REFRESH_INTERVALS,
+)
+from data.providers import DataSource, ProviderRegistry
+from frame_timing import StageTimer
+from refresh_scheduler import RefreshScheduler
+from startup_timing import StartupTimer
 from terminal_input import TerminalKeyReader
-from ui.pages import build_content_page
+from ui.pages import build_content_page, load_page, view_sources
+from ui.regions import RegionTracker
 from ui.sidebar import build_sidebar
-from ui.layout import build_layout
+from ui.theme import get_theme, next_theme_name, set_theme
+from ui.layout import FOOTER_HEIGHT, build_layout
+
+if TYPE_CHECKING:
+    from rich.live import Live
+
+    from data.prometheus import PrometheusProvider
 
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
-#: How often (in seconds) the dashboard state is refreshed.
+#: Base refresh interval (in seconds) for views without an entry in
+#: ``VIEW_REFRESH_INTERVALS``.
 UPDATE_INTERVAL: float = 1.0
 
-#: Rich ``Live`` refresh rate derived from UPDATE_INTERVAL so the two stay
-#: in sync and never diverge silently.
-REFRESH_PER_SECOND: float = 1.0 / UPDATE_INTERVAL
+#: Interval (in seconds) of the clock tick redrawing the header clock and the
+#: footer uptime; independent of the backed-off content refresh.
+CLOCK_INTERVAL: float = 1.0
+
+#: Delay (in seconds) of a clock tick after the wall-clock boundary, so the
+#: tick never lands just before the displayed second changes.
+CLOCK_TICK_DELAY: float = 0.01
+
+#: Key toggling the frame-timing overlay in the footer.
+TIMING_OVERLAY_KEY: str = "t"
+
+#: Footer height while the timing overlay is visible (header row + three
+#: statistic rows on top of the regular footer line).
+TIMING_FOOTER_HEIGHT: int = FOOTER_HEIGHT + 4
+
+#: Relative page steps of the node-grid paging keys.
+NODE_PAGE_STEPS: dict[str, int] = {
+    "pagedown": 1,
+    "n": 1,
+    "pageup": -1,
+    "p": -1,
+}
+
+#: Node-grid paging keys jumping to the first / last page.
+NODE_PAGE_FIRST_KEY: str = "home"
+NODE_PAGE_LAST_KEY: str = "end"
+
+#: Key cycling the node-grid sort mode on the nodes view.
+NODE_SORT_KEY: str = "s"
+
+#: Key cycling the colour theme (see :mod:`ui.theme`).
+THEME_KEY: str = "c"
 
 #: Default initial view shown in the main content area.
 DEFAULT_VIEW: str = "nodes"
@@ -60,21 +130,184 @@ MENU_ITEMS: tuple[tuple[str, str, str], ...] = (
 # ---------------------------------------------------------------------------
 
 
-def create_context() -> dict:
+def _build_cluster_member(name: str, spec: dict):
+    """Return the provider of one fleet cluster from its ``CLUSTERS`` entry.
+
+    Raises:
+        ValueError: If the entry names an unsupported provider.
+    """
+    kind = spec.get("provider", "synthetic")
+    if kind == "replay":
+        from data.recording import ReplayProvider
+
+        return ReplayProvider(
+            spec["path"],
+            speed=spec.get("speed", REPLAY_SPEED),
+            loop=spec.get("loop", REPLAY_LOOP),
+        )
+    if kind == "synthetic":
+        from data.synthetic_cluster import SyntheticCluster
+
+        cluster = SyntheticCluster(
+            spec.get("nodes", SYNTHETIC_NODE_COUNT),
+            seed=spec.get("seed", SYNTHETIC_SEED),
+            flap_rate=SYNTHETIC_FLAP_RATE,
+            join_rate=SYNTHETIC_JOIN_RATE,
+            leave_rate=SYNTHETIC_LEAVE_RATE,
+            tick_interval=SYNTHETIC_TICK_INTERVAL,
+        )
+        return cluster.get_cluster_state
+    raise ValueError(f"unsupported provider {kind!r} for cluster {name!r}")
+
+
+def _resolve_live_provider():
+    """Return the ``DATA_PROVIDER`` provider, wrapped for ``RECORD_PATH``."""
+    # Provider modules are imported here so only the selected one is loaded.
+    if DATA_PROVIDER == "replay":
+        from data.recording import ReplayProvider
+
+        return ReplayProvider(REPLAY_PATH, speed=REPLAY_SPEED, loop=REPLAY_LOOP)
+
+    if DATA_PROVIDER == "multi":
+        from data.multi_cluster import MultiClusterProvider
+
+        provider = MultiClusterProvider(
+            {name: _build_cluster_member(name, spec) for name, spec in CLUSTERS.items()},
+            max_workers=MULTI_CLUSTER_MAX_WORKERS,
+            timeout=MULTI_CLUSTER_TIMEOUT,
+        )
+    elif DATA_PROVIDER == "synthetic":
+        from data.synthetic_cluster import SyntheticCluster
+
+        cluster = SyntheticCluster(
+            SYNTHETIC_NODE_COUNT,
+            seed=SYNTHETIC_SEED,
+            flap_rate=SYNTHETIC_FLAP_RATE,
+            join_rate=SYNTHETIC_JOIN_RATE,
+            leave_rate=SYNTHETIC_LEAVE_RATE,
+            tick_interval=SYNTHETIC_TICK_INTERVAL,
+        )
+        provider = cluster.get_cluster_state
+    else:
+        from data.fake_cluster import get_cluster_state
+
+        provider = get_cluster_state
+
+    if RECORD_PATH:
+        from data.recording import RecordingProvider
+
+        return RecordingProvider(provider, RECORD_PATH)
+    return provider
+
+
+def resolve_cluster_provider():
+    """Return the cluster-state provider selected by ``DATA_PROVIDER``.
+
+    When ``RECORD_PATH`` is set, the live provider is wrapped so every
+    snapshot is also appended to that recording. When
+    ``ALERT_HISTORY_PATH`` is set, alert events are stored in that database
+    and published as ``alert_history``.
+
+    Returns:
+        A zero-argument callable returning one cluster-state dictionary.
+    """
+    provider = _resolve_live_provider()
+
+    if ALERT_HISTORY_PATH:
+        from data.alert_history import AlertHistoryProvider
+
+        return AlertHistoryProvider(
+            provider,
+            ALERT_HISTORY_PATH,
+            retention=ALERT_HISTORY_RETENTION,
+        )
+    return provider
+
+
+def resolve_prometheus_provider() -> "PrometheusProvider | None":
+    """Return the Prometheus provider for ``PROMETHEUS_URL``, or ``None`` if unset."""
+    if PROMETHEUS_URL is None:
+        return None
+
+    # The HTTP stack is only imported when a server is configured.
+    from data.prometheus import PrometheusClient, PrometheusProvider
+
+    client = PrometheusClient(
+        PROMETHEUS_URL,
+        max_workers=PROMETHEUS_MAX_WORKERS,
+        timeout=PROMETHEUS_TIMEOUT,
+    )
+    return PrometheusProvider(client)
+
+
+def build_provider_registry() -> ProviderRegistry:
+    """Register every configured data source; all start paused.
+
+    Returns:
+        A :class:`ProviderRegistry` with a ``cluster`` source and, when
+        ``PROMETHEUS_URL`` is set, a ``prometheus`` source.
+    """
+    registry = ProviderRegistry()
+    registry.register(
+        DataSource(
+            "cluster",
+            resolve_cluster_provider(),
+            differs=snapshot_differs,
+            interval=UPDATE_INTERVAL,
+            prefetch=True,
+        )
+    )
+
+    prometheus = resolve_prometheus_provider()
+    if prometheus is not None:
+        registry.register(
+            DataSource(
+                "prometheus",
+                prometheus,
+                differs=prometheus_differs,
+                interval=UPDATE_INTERVAL,
+            )
+        )
+    return registry
+
+
+def create_context(initial_view: str = DEFAULT_VIEW) -> dict:
     """Create and return the initial runtime context for the dashboard.
 
     The context dictionary is a lightweight container for mutable state that
     must survive across frames but does not belong to any single component.
 
+    Args:
+        initial_view: Identifier of the view shown first.
+
     Returns:
         A dictionary with the following keys:
 
         - ``start_time`` (*float*): ``time.time()`` at dashboard launch, used to compute uptime.
         - ``current_view`` (*str*): Identifier of the currently active content page.
+        - ``sources`` (*ProviderRegistry*): Data sources; only those read by
+          the active view are fetched, all others stay paused.
+        - ``scheduler`` (*RefreshScheduler*): Per-view adaptive refresh deadlines.
+        - ``node_page`` (*int*): 0-based page of the node grid.
+        - ``node_sort`` (*str*): Node-grid sort mode.
+        - ``regions`` (*RegionTracker*): Added by :func:`initialize`; tracks
+          which layout regions need rebuilding.
+        - ``timings`` (*StageTimer*): Rolling per-stage frame timings.
+        - ``show_timings`` (*bool*): Whether the timing overlay is visible.
     """
     return {
         "start_time": time.time(),
-        "current_view": DEFAULT_VIEW,
+        "current_view": initial_view,
+        "sources": build_provider_registry(),
+        "scheduler": RefreshScheduler(
+            VIEW_REFRESH_INTERVALS,
+            default_interval=UPDATE_INTERVAL,
+            max_interval=MAX_REFRESH_INTERVAL,
+        ),
+        "node_page": 0,
+        "node_sort": "provider",
+        "timings": StageTimer(),
+        "show_timings": False,
     }
 
 
@@ -83,15 +316,93 @@ def create_context() -> dict:
 # ---------------------------------------------------------------------------
 
 
-def update_sidebar(layout, ctx: dict) -> None:
-    """Render the navigation sidebar for the currently active view.
+def _update_region(ctx: dict, stage: str, region: str, key, builder, *args) -> bool:
+    """Rebuild *region* if *key* changed and record the build time under *stage*."""
+    started = time.perf_counter()
+    if not ctx["regions"].update(region, key, builder, *args):
+        return False
+    ctx["timings"].record(stage, time.perf_counter() - started)
+    return True
+
+
+def update_header(ctx: dict) -> None:
+    """Rebuild the header when the displayed wall-clock second changed.
+
+    Args:
+        ctx: Runtime context dictionary.
+    """
+    _update_region(ctx, "header", "header", int(time.time()), render_header)
+
+
+def update_sidebar(ctx: dict) -> None:
+    """Rebuild the navigation sidebar when the active view changed.
 
     Args:
-        layout: The active Rich ``Layout`` tree.
         ctx: Runtime context dictionary containing navigation state.
     """
-    layout["sidebar"].update(
-        build_sidebar(MENU_ITEMS, ctx["current_view"])
+    _update_region(
+        ctx,
+        "sidebar",
+        "sidebar",
+        ctx["current_view"],
+        build_sidebar,
+        MENU_ITEMS,
+        ctx["current_view"],
+    )
+
+
+def update_content(ctx: dict) -> bool:
+    """Rebuild the content page when the view or its displayed data changed.
+
+    Static views ignore new snapshots entirely.
+
+    Args:
+        ctx: Runtime context dictionary.
+
+    Returns:
+        ``True`` if the content page was rebuilt.
+    """
+    view = ctx["current_view"]
+    names = view_sources(view)
+    sources = ctx["sources"]
+    return _update_region(
+        ctx,
+        "page",
+        "content",
+        (view, sources.data_key(names), ctx["node_page"], ctx["node_sort"]),
+        build_content_page,
+        view,
+        sources.snapshots(names),
+        ctx["node_page"],
+        ctx["node_sort"],
+    )
+
+
+def update_footer(ctx: dict) -> None:
+    """Rebuild the footer when the uptime, frame statistics or timings changed.
+
+    The footer reports region statistics of the previous completed frame
+    and, while enabled, the frame-timing overlay. Timing percentiles are
+    only computed while the overlay is visible.
+
+    Args:
+        ctx: Runtime context dictionary.
+    """
+    regions = ctx["regions"]
+    uptime = format_uptime(ctx["start_time"])
+    frame_stats = (regions.last_skipped, regions.region_count)
+    timings = ctx["timings"].summary() if ctx["show_timings"] else None
+
+    regions.set_size("footer", TIMING_FOOTER_HEIGHT if ctx["show_timings"] else FOOTER_HEIGHT)
+    _update_region(
+        ctx,
+        "footer",
+        "footer",
+        (uptime, frame_stats, timings),
+        render_footer,
+        ctx["start_time"],
+        frame_stats,
+        timings,
     )
 
 
@@ -111,6 +422,152 @@ def resolve_view_from_key(key: str) -> str | None:
     return None
 
 
+def snapshot_differs(previous: dict | None, snapshot: dict) -> bool:
+    """Return ``True`` if *snapshot* would display differently from *previous*.
+
+    Args:
+        previous: Previously displayed cluster snapshot, or ``None``.
+        snapshot: Newly fetched cluster snapshot.
+    """
+    if previous is None:
+        return True
+    return (
+        previous["summary"] != snapshot["summary"]
+        or previous["alerts"] != snapshot["alerts"]
+        or previous.get("alert_history") != snapshot.get("alert_history")
+        or not previous["nodes"].same_values(snapshot["nodes"])
+    )
+
+
+def _same_query_value(old: float | None, new: float | None) -> bool:
+    """Return ``True`` if two query values display the same (``NaN`` equals ``NaN``)."""
+    return old == new or (old != old and new != new)
+
+
+def prometheus_differs(previous: dict | None, snapshot: dict) -> bool:
+    """Return ``True`` if a Prometheus state changed health or any query outcome.
+
+    Query durations are ignored, so an idle Prometheus page lets the refresh
+    scheduler back off. ``NaN`` values (e.g. from ``0/0``) compare equal to
+    each other, so a query stuck at ``NaN`` does not count as a change.
+    """
+    if previous is None:
+        return True
+    if previous["health"] != snapshot["health"]:
+        return True
+
+    old, new = previous["results"], snapshot["results"]
+    return old.keys() != new.keys() or any(
+        (old[key]["series"], old[key]["error"]) != (result["series"], result["error"])
+        or not _same_query_value(old[key]["value"], result["value"])
+        for key, result in new.items()
+    )
+
+
+def swap_snapshots(ctx: dict) -> bool:
+    """Activate the active view's data sources and swap in their snapshots.
+
+    Sources the active view does not read are paused, so they issue no
+    fetches. This never blocks on data I/O: it only reads the fetchers'
+    front buffers (apart from the one-time prefetch of a source that has
+    never been fetched).
+
+    Args:
+        ctx: Runtime context dictionary.
+
+    Returns:
+        ``True`` if any source swapped in a different snapshot.
+    """
+    names = view_sources(ctx["current_view"])
+    sources = ctx["sources"]
+    sources.activate_only(names)
+
+    changed = sources.swap(names)
+    for source in changed:
+        ctx["timings"].record("fetch", source.fetcher.last_fetch_duration)
+    return bool(changed)
+
+
+def apply_control_input(ctx: dict, key: str) -> bool:
+    """Apply one non-navigation control key to the runtime context.
+
+    Args:
+        ctx: Runtime context dictionary.
+        key: Key event (a single character or a named key).
+
+    Returns:
+        ``True`` if the key changed any state, otherwise ``False``.
+    """
+    if key == TIMING_OVERLAY_KEY:
+        ctx["show_timings"] = not ctx["show_timings"]
+        return True
+    if key == THEME_KEY:
+        # Theme listeners drop cached panels and bars; every region is
+        # rebuilt with the new styles on the next frame.
+        set_theme(next_theme_name())
+        ctx["regions"].invalidate()
+        return True
+    return False
+
+
+def apply_paging_input(ctx: dict, key: str) -> bool:
+    """Apply one node-grid paging key to the runtime context.
+
+    Paging is only active on the nodes view. The target page is clamped to
+    the pages available for the current snapshot.
+
+    Args:
+        ctx: Runtime context dictionary.
+        key: Key event (a single character or a named key).
+
+    Returns:
+        ``True`` if the visible node page changed, otherwise ``False``.
+    """
+    is_paging_key = key in NODE_PAGE_STEPS or key in (NODE_PAGE_FIRST_KEY, NODE_PAGE_LAST_KEY)
+    cluster = ctx["sources"].snapshot("cluster")
+    if not is_paging_key or ctx["current_view"] != "nodes" or cluster is None:
+        return False
+
+    last_page = load_page("nodes").count_node_pages(len(cluster["nodes"])) - 1
+    page = min(ctx["node_page"], last_page)
+
+    if key == NODE_PAGE_FIRST_KEY:
+        target = 0
+    elif key == NODE_PAGE_LAST_KEY:
+        target = last_page
+    else:
+        target = min(max(page + NODE_PAGE_STEPS[key], 0), last_page)
+
+    if target == ctx["node_page"]:
+        return False
+
+    ctx["node_page"] = target
+    return True
+
+
+def apply_sort_input(ctx: dict, key: str) -> bool:
+    """Cycle the node-grid sort mode on :data:`NODE_SORT_KEY`.
+
+    Sorting is only active on the nodes view. A new sort mode starts at the
+    first page, so the worst-ranked nodes are on screen.
+
+    Args:
+        ctx: Runtime context dictionary.
+        key: Key event (a single character or a named key).
+
+    Returns:
+        ``True`` if the sort mode changed, otherwise ``False``.
+    """
+    if key != NODE_SORT_KEY or ctx["current_view"] != "nodes":
+        return False
+
+    modes = tuple(load_page("nodes").SORT_MODE_LABELS)
+    position = modes.index(ctx["node_sort"]) if ctx["node_sort"] in modes else -1
+    ctx["node_sort"] = modes[(position + 1) % len(modes)]
+    ctx["node_page"] = 0
+    return True
+
+
 def apply_navigation_input(ctx: dict, key: str) -> bool:
     """Apply one navigation key to the runtime context.
 
@@ -135,6 +592,31 @@ def apply_navigation_input(ctx: dict, key: str) -> bool:
     return True
 
 
+def apply_key_batch(ctx: dict, keys: list[str]) -> bool:
+    """Apply a batch of key events to the runtime context.
+
+    Every key in the batch is applied in order, so a burst of input results
+    in a single redraw by the caller.
+
+    Args:
+        ctx: Runtime context dictionary.
+        keys: Key events as returned by ``TerminalKeyReader.read_keys()``.
+
+    Returns:
+        ``True`` if any key changed state, otherwise ``False``.
+    """
+    changed = False
+    for key in keys:
+        if (
+            apply_navigation_input(ctx, key)
+            or apply_paging_input(ctx, key)
+            or apply_sort_input(ctx, key)
+            or apply_control_input(ctx, key)
+        ):
+            changed = True
+    return changed
+
+
 # ---------------------------------------------------------------------------
 # Formatting helpers
 # ---------------------------------------------------------------------------
@@ -175,25 +657,74 @@ def render_header() -> Panel:
     Returns:
         A :class:`rich.panel.Panel` ready to be passed to ``Layout.update()``.
     """
-    left = Text("TUI Monitor", style="bold cyan")
-    right = Align.right(Text(f"Time: {time.strftime('%H:%M:%S')}", style="cyan"))
+    theme = get_theme()
+    left = Text("TUI Monitor", style=theme["accent"])
+    right = Align.right(Text(f"Time: {time.strftime('%H:%M:%S')}", style=theme["label"]))
     content = Columns([left, right], expand=True)
-    return Panel(content, border_style="cyan")
+    return Panel(content, border_style=theme["border.header"])
+
 
+def render_timing_overlay(timings: dict[str, tuple[float, float, float]]) -> Table:
+    """Build the frame-timing overlay table.
+
+    Args:
+        timings: ``{stage: (last, p50, p99)}`` durations in seconds, as
+            returned by :meth:`frame_timing.StageTimer.summary`.
+
+    Returns:
+        A Rich ``Table`` with one column per stage and rows for last, p50
+        and p99 in milliseconds.
+    """
+    theme = get_theme()
+    muted, label_style, subtle = theme["muted"], theme["label"], theme["subtle"]
+
+    grid = Table.grid(expand=True, padding=(0, 1))
+    grid.add_column(width=5)
+    for _stage in timings:
+        grid.add_column(justify="right", ratio=1)
+
+    grid.add_row(Text("ms", style=muted), *[Text(stage, style=label_style) for stage in timings])
+    for row, label in enumerate(("last", "p50", "p99")):
+        grid.add_row(
+            Text(label, style=muted),
+            *[Text(f"{values[row] * 1000:.2f}", style=subtle) for values in timings.values()],
+        )
+    return grid
 
-def render_footer(start_time: float) -> Panel:
+
+def render_footer(
+    start_time: float,
+    frame_stats: tuple[int, int] | None = None,
+    timings: dict[str, tuple[float, float, float]] | None = None,
+) -> Panel:
     """Build and return the bottom footer panel showing uptime and exit hint.
 
     Args:
         start_time: Dashboard launch epoch used to compute the uptime string.
+        frame_stats: Optional ``(skipped_regions, total_regions)`` of the
+            previous frame, shown next to the uptime.
+        timings: Optional per-stage timing summary; when given, the timing
+            overlay is shown above the status line.
 
     Returns:
         A :class:`rich.panel.Panel` ready to be passed to ``Layout.update()``.
     """
-    left = Text("Press Ctrl+C to exit", style="grey70")
-    right = Align.right(Text(f"Uptime: {format_uptime(start_time)}", style="grey70"))
+    theme = get_theme()
+    left = Text(
+        f"Press Ctrl+C to exit | {TIMING_OVERLAY_KEY}: timings | {THEME_KEY}: theme ({theme.name})",
+        style=theme["subtle"],
+    )
+    status = f"Uptime: {format_uptime(start_time)}"
+    if frame_stats is not None:
+        skipped, total = frame_stats
+        status = f"Skipped: {skipped}/{total} | {status}"
+    right = Align.right(Text(status, style=theme["subtle"]))
     content = Columns([left, right], expand=True)
-    return Panel(content, border_style="grey50")
+
+    if timings is not None:
+        content = Group(render_timing_overlay(timings), content)
+
+    return Panel(content, border_style=theme["border.muted"])
 
 
 # ---------------------------------------------------------------------------
@@ -213,111 +744,206 @@ def build():
     return build_layout()
 
 
-def initialize(layout) -> dict:
+def initialize(layout, initial_view: str = DEFAULT_VIEW) -> dict:
     """Fully populate every layout section before the Live renderer starts.
 
     Pre-rendering all sections prevents the initial frame from showing blank
-    or partially-drawn panels (visual flicker).
+    or partially-drawn panels (visual flicker). The first frame activates the
+    data sources of the initial view; sources marked for prefetch (the
+    cluster provider) fetch their first snapshot synchronously, afterwards
+    background fetchers take over.
 
     Args:
         layout: The Rich ``Layout`` returned by :func:`build`.
+        initial_view: Identifier of the view shown first.
 
     Returns:
         The runtime context dictionary created by :func:`create_context`.
     """
-    ctx = create_context()
+    set_theme(THEME)
+    ctx = create_context(initial_view)
+    ctx["regions"] = RegionTracker(layout)
 
-    layout["header"].update(render_header())
-    layout["footer"].update(render_footer(ctx["start_time"]))
-    update_sidebar(layout, ctx)
-
-    cluster = get_cluster_state()
-
-    layout["content"].update(
-        build_content_page(
-            ctx["current_view"],
-            cluster,
-        )
-    )
+    update_frame(layout, ctx)
 
     return ctx
 
 
-def update_frame(layout, ctx: dict) -> None:
-    """Fetch fresh data and redraw all dynamic layout sections.
+def update_frame(layout, ctx: dict) -> bool:
+    """Swap in the latest snapshots and redraw the layout sections that changed.
 
-    Called once per :data:`UPDATE_INTERVAL` inside the main render loop.
+    Called on every refresh deadline of the render loop and after
+    navigation. Data is fetched by background fetchers, so this
+    never blocks on I/O, and each region builder only runs when its inputs
+    changed (see :class:`ui.regions.RegionTracker`).
 
     Args:
         layout: The active Rich ``Layout`` being rendered by ``Live``.
         ctx: The runtime context dictionary produced by :func:`create_context`.
+
+    Returns:
+        ``True`` if the content page was rebuilt.
     """
-    layout["header"].update(render_header())
-    layout["footer"].update(render_footer(ctx["start_time"]))
-    update_sidebar(layout, ctx)
+    ctx["regions"].begin_frame()
+    swap_snapshots(ctx)
 
-    cluster = get_cluster_state()
+    update_header(ctx)
+    update_sidebar(ctx)
+    changed = update_content(ctx)
+    update_footer(ctx)
+    return changed
+
+
+def update_clock_frame(ctx: dict) -> bool:
+    """Redraw the header clock and footer uptime without touching the data.
+
+    No snapshots are swapped in, so the content page keeps its key and is
+    skipped; only the wall-clock driven regions are rebuilt.
+
+    Args:
+        ctx: The runtime context dictionary.
+
+    Returns:
+        ``True`` if any region was rebuilt.
+    """
+    regions = ctx["regions"]
+    regions.begin_frame()
+
+    update_header(ctx)
+    update_sidebar(ctx)
+    update_content(ctx)
+    update_footer(ctx)
+    return regions.built > 0
+
+
+def next_clock_tick() -> float:
+    """Return the ``time.monotonic()`` deadline of the next clock tick.
+
+    Ticks fall just after wall-clock :data:`CLOCK_INTERVAL` boundaries, so
+    the header clock changes right after the displayed second does.
+    """
+    until_boundary = CLOCK_INTERVAL - time.time() % CLOCK_INTERVAL
+    return time.monotonic() + until_boundary + CLOCK_TICK_DELAY
 
-    layout["content"].update(
-        build_content_page(
-            ctx["current_view"],
-            cluster,
-        )
-    )
 
+def redraw(layout, ctx: dict, live: "Live") -> bool:
+    """Update changed layout sections and write one frame to the terminal.
 
-def run(layout, ctx: dict) -> None:
+    Args:
+        layout: The active Rich ``Layout``.
+        ctx: The runtime context dictionary.
+        live: The running ``Live`` display, refreshed explicitly.
+
+    Returns:
+        ``True`` if the content page was rebuilt.
+    """
+    changed = update_frame(layout, ctx)
+    ctx["timings"].measure("write", live.refresh)
+    return changed
+
+
+def apply_refresh_schedule(ctx: dict) -> None:
+    """Align the scheduler and the fetchers with the active view.
+
+    The fetchers poll at the scheduler's current interval, so a backed-off
+    view also stops producing snapshots nobody looks at.
+
+    Args:
+        ctx: Runtime context dictionary.
+    """
+    ctx["scheduler"].set_view(ctx["current_view"])
+    apply_fetch_interval(ctx)
+
+
+def apply_fetch_interval(ctx: dict) -> None:
+    """Make every background fetcher poll at the scheduler's current interval."""
+    ctx["sources"].set_interval(ctx["scheduler"].interval)
+
+
+def run(layout, ctx: dict, startup: StartupTimer | None = None) -> None:
     """Start the blocking Live render loop.
 
     The loop reacts to two kinds of events:
-        - periodic refresh deadlines
-        - numeric navigation key presses
-
-    At this stage, only simple menu switching is supported. Valid shortcut
-    keys are defined centrally in ``MENU_ITEMS``.
+        - refresh deadlines from the :class:`RefreshScheduler`
+        - navigation and control key presses
+
+    Each view refreshes at its own base interval (``VIEW_REFRESH_INTERVALS``);
+    while timed refreshes leave the content page unchanged, the interval
+    backs off up to ``MAX_REFRESH_INTERVAL`` and snaps back as soon as data
+    moves again or the view changes. The backoff only throttles fetching
+    and content rebuilds: a separate :data:`CLOCK_INTERVAL` tick keeps the
+    header clock and footer uptime live (see :func:`update_clock_frame`).
+
+    Valid navigation keys are defined centrally in ``MENU_ITEMS``; the
+    timing overlay is toggled with :data:`TIMING_OVERLAY_KEY`, the colour
+    theme is cycled with :data:`THEME_KEY` and the node
+    grid is paged with :data:`NODE_PAGE_STEPS` and Home/End and re-sorted
+    with :data:`NODE_SORT_KEY`. Keys arrive in batches per wakeup and a
+    whole batch causes at most one redraw.
+    ``Live`` auto refresh is disabled, so the terminal is only written after
+    a frame update and the write can be timed.
 
     Args:
         layout: The fully-initialized Rich ``Layout``.
         ctx: The runtime context dictionary.
+        startup: Optional startup timer; its ``first_paint`` stage is marked
+            once ``Live`` has drawn the first frame.
 
     Raises:
         KeyboardInterrupt: Propagated to the caller (:func:`run_dashboard`)
             so shutdown logic can be executed there.
     """
-    next_update_at = time.monotonic() + UPDATE_INTERVAL
+    from rich.live import Live
+
+    scheduler = ctx["scheduler"]
+    apply_refresh_schedule(ctx)
+    scheduler.schedule()
 
     with TerminalKeyReader() as key_reader, Live(
         layout,
-        refresh_per_second=REFRESH_PER_SECOND,
+        auto_refresh=False,
         screen=True,
         transient=True,
-    ):
+    ) as live:
+        # Entering ``Live`` draws the pre-rendered layout once.
+        if startup is not None:
+            startup.mark("first_paint")
+
+        clock_at = next_clock_tick()
         while True:
-            timeout = max(0.0, next_update_at - time.monotonic())
-            key = key_reader.read_key(timeout=timeout)
+            timeout = max(0.0, min(scheduler.next_at, clock_at) - time.monotonic())
+            keys = key_reader.read_keys(timeout=timeout)
 
-            if key is not None and apply_navigation_input(ctx, key):
-                update_frame(layout, ctx)
-                next_update_at = time.monotonic() + UPDATE_INTERVAL
+            if apply_key_batch(ctx, keys):
+                apply_refresh_schedule(ctx)
+                redraw(layout, ctx, live)
+                scheduler.schedule()
                 continue
 
             now = time.monotonic()
-            if now >= next_update_at:
-                update_frame(layout, ctx)
-                next_update_at = now + UPDATE_INTERVAL
+            if now >= scheduler.next_at:
+                scheduler.observe(redraw(layout, ctx, live))
+                apply_fetch_interval(ctx)
+                scheduler.schedule(now)
+            elif now >= clock_at and update_clock_frame(ctx):
+                ctx["timings"].measure("write", live.refresh)
+            if now >= clock_at:
+                clock_at = next_clock_tick()
 
 
-def shutdown() -> None:
+def shutdown(ctx: dict) -> None:
     """Execute graceful shutdown tasks before the process exits.
 
-    Currently limited to flushing log handlers.  Add resource-cleanup logic
-    (e.g. closing network connections, persisting state) here as the
-    application grows.
+    Stops every background fetcher and closes providers that hold
+    resources (e.g. a recording file or HTTP connections).
+
+    Args:
+        ctx: The runtime context dictionary.
     """
-    return
+    ctx["sources"].close()
 
 
-def run_dashboard() -> None:
+def run_dashboard(startup: StartupTimer | None = None) -> None:
     """Build, initialise, and run the TUI dashboard until interrupted.
 
     This is the single public entry-point for the module.  It wires together
@@ -327,11 +953,22 @@ def run_dashboard() -> None:
 
     A :exc:`KeyboardInterrupt` (Ctrl-C) triggers a clean exit via
     :func:`shutdown` without printing a traceback.
+
+    Args:
+        startup: Optional startup timer receiving the ``build``,
+            ``initialize`` and ``first_paint`` stages.
     """
     layout = build()
+    if startup is not None:
+        startup.mark("build")
+
     ctx = initialize(layout)
+    if startup is not None:
+        startup.mark("initialize")
 
     try:
-        run(layout, ctx)
+        run(layout, ctx, startup)
     except KeyboardInterrupt:
-        shutdown()
+        pass
+    finally:
+        shutdown(ctx)
@@ -0,0 +1,179 @@
+"""
+data/aggregator.py
+==================
+Incremental cluster-summary aggregation over a columnar node table.
+
+The aggregator keeps running sums, a Ready counter, a NotReady index set and
+lazy max-heaps (:class:`data.topk.LazyMaxHeap`) for CPU and memory. When
+only a few nodes change between scrapes, :meth:`SummaryAggregator.apply` updates the summary in
+O(changed nodes) instead of rescanning the whole table.
+
+The produced dictionary carries the node-derived keys consumed by
+:func:`ui.components.build_cluster_summary`; alert counters and health are
+added by the data provider.
+"""
+
+from array import array
+from typing import Iterable
+
+from data.node_table import NodeTable
+from data.topk import LazyMaxHeap
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Columns whose running sums are tracked.
+SUM_COLUMNS: tuple[str, ...] = (
+    "cpu",
+    "memory",
+    "pods",
+    "cpu_cores",
+    "mem_gb",
+    "pods_capacity",
+)
+
+
+# ---------------------------------------------------------------------------
+# Aggregator
+# ---------------------------------------------------------------------------
+
+
+class SummaryAggregator:
+    """Maintain cluster summary values incrementally from node-table deltas.
+
+    Typical usage::
+
+        changed = table.take_changes()
+        aggregator.apply(table, changed)
+        summary = aggregator.summary()
+    """
+
+    def __init__(self) -> None:
+        self._table: NodeTable | None = None
+        self._structure_version: int = -1
+        self._seen: dict[str, array] = {}
+        self._seen_ready: array = array("B")
+        self._sums: dict[str, int] = {}
+        self._used_cores_x100: int = 0
+        self._used_mem_x100: int = 0
+        self._ready_count: int = 0
+        self._notready: set[int] = set()
+        self._max_cpu: LazyMaxHeap | None = None
+        self._max_memory: LazyMaxHeap | None = None
+
+    # -----------------------------------------------------------------------
+    # Updates
+    # -----------------------------------------------------------------------
+
+    def rebuild(self, table: NodeTable) -> None:
+        """Recompute every running value from scratch (O(n))."""
+        self._table = table
+        self._structure_version = table.structure_version
+
+        self._seen = {
+            column: array(table.column(column).typecode, table.column(column))
+            for column in SUM_COLUMNS
+        }
+        self._seen_ready = array("B", table.ready)
+
+        self._sums = {column: sum(self._seen[column]) for column in SUM_COLUMNS}
+        self._used_cores_x100 = table.weighted_total("cpu", "cpu_cores")
+        self._used_mem_x100 = table.weighted_total("memory", "mem_gb")
+        self._ready_count = table.ready_count()
+        self._notready = set(table.notready_indices())
+
+        self._max_cpu = LazyMaxHeap(self._seen["cpu"])
+        self._max_memory = LazyMaxHeap(self._seen["memory"])
+
+    def apply(self, table: NodeTable, changed: Iterable[int] | None) -> None:
+        """Fold changed rows of *table* into the running summary.
+
+        Args:
+            table: The node table the changes were made to.
+            changed: Indices of rows whose fields changed, or ``None`` to
+                request a full rescan (e.g. after rows were added or removed).
+        """
+        if (
+            changed is None
+            or table is not self._table
+            or table.structure_version != self._structure_version
+        ):
+            self.rebuild(table)
+            return
+
+        seen = self._seen
+        sums = self._sums
+        columns = {column: table.column(column) for column in SUM_COLUMNS}
+
+        for index in changed:
+            old_cpu = seen["cpu"][index]
+            old_memory = seen["memory"][index]
+            old_cores = seen["cpu_cores"][index]
+            old_mem_gb = seen["mem_gb"][index]
+
+            for column in SUM_COLUMNS:
+                value = columns[column][index]
+                sums[column] += value - seen[column][index]
+                seen[column][index] = value
+
+            self._used_cores_x100 += (
+                seen["cpu"][index] * seen["cpu_cores"][index] - old_cpu * old_cores
+            )
+            self._used_mem_x100 += (
+                seen["memory"][index] * seen["mem_gb"][index] - old_memory * old_mem_gb
+            )
+
+            ready = table.ready[index]
+            if ready != self._seen_ready[index]:
+                self._seen_ready[index] = ready
+                self._ready_count += 1 if ready else -1
+                if ready:
+                    self._notready.discard(index)
+                else:
+                    self._notready.add(index)
+
+            if seen["cpu"][index] != old_cpu:
+                self._max_cpu.push(index)
+            if seen["memory"][index] != old_memory:
+                self._max_memory.push(index)
+
+    # -----------------------------------------------------------------------
+    # Output
+    # -----------------------------------------------------------------------
+
+    def summary(self) -> dict:
+        """Return the node-derived summary dictionary.
+
+        Returns:
+            A dictionary with ``total_nodes``, ``ready_nodes``, ``avg_cpu``,
+            ``avg_memory``, ``total_pods``, ``notready_names``, ``max_cpu``,
+            ``max_cpu_node``, ``max_memory``, ``max_memory_node``,
+            ``used_cores``, ``total_cores``, ``used_mem_gb``, ``total_mem_gb``
+            and ``pods_capacity``.
+        """
+        names = self._table.names if self._table is not None else []
+        total_nodes = len(names)
+        sums = self._sums
+
+        max_cpu_index = self._max_cpu.top() if self._max_cpu else -1
+        max_mem_index = self._max_memory.top() if self._max_memory else -1
+
+        return {
+            "total_nodes": total_nodes,
+            "ready_nodes": self._ready_count,
+            "avg_cpu": sums.get("cpu", 0) // total_nodes if total_nodes else 0,
+            "avg_memory": sums.get("memory", 0) // total_nodes if total_nodes else 0,
+            "total_pods": sums.get("pods", 0),
+            "notready_names": [names[index] for index in sorted(self._notready)],
+            "max_cpu": self._seen["cpu"][max_cpu_index] if max_cpu_index >= 0 else 0,
+            "max_cpu_node": names[max_cpu_index] if max_cpu_index >= 0 else "-",
+            "max_memory": self._seen["memory"][max_mem_index] if max_mem_index >= 0 else 0,
+            "max_memory_node": names[max_mem_index] if max_mem_index >= 0 else "-",
+            "used_cores": round(self._used_cores_x100 / 100, 1),
+            "total_cores": sums.get("cpu_cores", 0),
+            "used_mem_gb": round(self._used_mem_x100 / 100, 1),
+            "total_mem_gb": sums.get("mem_gb", 0),
+            "pods_capacity": sums.get("pods_capacity", 0),
+        }
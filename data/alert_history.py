@@ -0,0 +1,396 @@
+"""
+data/alert_history.py
+=====================
+Persistent alert history backed by an embedded SQLite database.
+
+:class:`AlertHistoryStore` keeps one row per alert event:
+
+    - ``firing``   — an alert started firing or changed severity
+    - ``resolved`` — a firing alert cleared
+
+Events of one tick are written with a single ``executemany`` in one
+transaction. Rows are indexed on ``(node, severity, ts)`` so per-node
+questions such as "what fired on worker-7 in the last hour" are answered
+from the index without scanning the table, on ``(node, ts)`` for per-node
+queries of any severity, and on ``ts`` for recent-event listings and
+retention pruning. Rows older than the retention window are deleted at
+most once per :data:`PRUNE_INTERVAL`, in batches of :data:`PRUNE_BATCH`.
+
+The store also keeps the set of open alerts (whose latest event is
+``firing``) in a small keyed table, updated in the same transaction, so a
+restarted process knows what was firing at shutdown without scanning the
+event log.
+
+:class:`AlertHistoryProvider` wraps any cluster-state provider, derives the
+events from consecutive ``alerts`` lists, stores them and publishes the most
+recent events as the snapshot's ``alert_history`` key. It starts from the
+stored open alerts, so alerts still firing after a restart are not recorded
+again and alerts that cleared while it was down are recorded as resolved.
+
+Typical usage::
+
+    store = AlertHistoryStore("alert_history.db")
+    store.query(node="worker-7", since=time.time() - 3600)
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Iterable
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Alert event kinds.
+EVENT_FIRING: str = "firing"
+EVENT_RESOLVED: str = "resolved"
+
+#: Default time (in seconds) events are kept: 30 days.
+DEFAULT_RETENTION: float = 30 * 24 * 3600.0
+
+#: Minimum time (in seconds) between two retention prunes.
+PRUNE_INTERVAL: float = 60.0
+
+#: Maximum rows deleted per prune; a backlog (e.g. after a long downtime)
+#: is worked off over the following ticks instead of stalling one.
+PRUNE_BATCH: int = 2_000
+
+#: Default row limit of :meth:`AlertHistoryStore.query`.
+DEFAULT_QUERY_LIMIT: int = 100
+
+#: Number of recent events published with every snapshot.
+RECENT_EVENTS: int = 20
+
+#: Columns of an event row, in table order.
+EVENT_COLUMNS: tuple[str, ...] = ("ts", "node", "rule", "severity", "event", "message")
+
+_SCHEMA: tuple[str, ...] = (
+    """
+    CREATE TABLE IF NOT EXISTS alert_events (
+        ts       REAL NOT NULL,
+        node     TEXT NOT NULL,
+        rule     TEXT NOT NULL,
+        severity TEXT NOT NULL,
+        event    TEXT NOT NULL,
+        message  TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS alert_events_node_severity_ts"
+    " ON alert_events (node, severity, ts)",
+    # Node queries without a severity filter would otherwise read every
+    # event of the node to sort them by time.
+    "CREATE INDEX IF NOT EXISTS alert_events_node_ts ON alert_events (node, ts)",
+    "CREATE INDEX IF NOT EXISTS alert_events_ts ON alert_events (ts)",
+    """
+    CREATE TABLE IF NOT EXISTS alert_open (
+        node     TEXT NOT NULL,
+        rule     TEXT NOT NULL,
+        severity TEXT NOT NULL,
+        message  TEXT NOT NULL,
+        ts       REAL NOT NULL,
+        PRIMARY KEY (node, rule)
+    )
+    """,
+)
+
+#: Fills ``alert_open`` from the latest event per ``(node, rule)`` for
+#: databases written before the table existed.
+_SEED_OPEN: str = """
+    INSERT INTO alert_open (node, rule, severity, message, ts)
+    SELECT node, rule, severity, message, ts FROM (
+        SELECT node, rule, severity, message, event, MAX(ts) AS ts
+        FROM alert_events GROUP BY node, rule
+    ) WHERE event = 'firing'
+"""
+
+_OPEN: str = (
+    "INSERT OR REPLACE INTO alert_open (node, rule, severity, message, ts)"
+    " VALUES (?, ?, ?, ?, ?)"
+)
+
+_CLOSE: str = "DELETE FROM alert_open WHERE node = ? AND rule = ?"
+
+_PRUNE: str = (
+    "DELETE FROM alert_events WHERE rowid IN"
+    " (SELECT rowid FROM alert_events WHERE ts < ? LIMIT ?)"
+)
+
+_INSERT: str = (
+    "INSERT INTO alert_events (ts, node, rule, severity, event, message)"
+    " VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _alert_key(alert: dict) -> tuple[str, str]:
+    """Return the ``(node, rule)`` identity of an alert."""
+    return alert["node"], alert["rule"]
+
+
+def alert_events(old: list[dict], new: list[dict]) -> list[tuple[str, dict]]:
+    """Return the ``(event, alert)`` pairs turning firing list *old* into *new*.
+
+    New alerts and severity changes are ``firing`` events; alerts missing
+    from *new* are ``resolved`` events carrying their last payload.
+    """
+    old_by_key = {_alert_key(alert): alert for alert in old}
+    events = []
+    for alert in new:
+        previous = old_by_key.pop(_alert_key(alert), None)
+        if previous is None or previous["severity"] != alert["severity"]:
+            events.append((EVENT_FIRING, alert))
+    events.extend((EVENT_RESOLVED, alert) for alert in old_by_key.values())
+    return events
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+
+class AlertHistoryStore:
+    """SQLite-backed alert event log with indexed node / severity / time queries.
+
+    One connection is shared by every thread; calls are serialized with a
+    lock, so the background fetcher can write while other threads query.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        retention: float = DEFAULT_RETENTION,
+        prune_interval: float = PRUNE_INTERVAL,
+    ) -> None:
+        """Open (or create) the database at *path*.
+
+        Args:
+            path: Database file path, or ``":memory:"``.
+            retention: Time (in seconds) events are kept.
+            prune_interval: Minimum time (in seconds) between two prunes.
+        """
+        self.path = path
+        self.retention = retention
+        self.prune_interval = prune_interval
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        # WAL keeps readers off the writer's lock; NORMAL sync is durable
+        # across application crashes and only fsyncs on checkpoints.
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            has_open_table = self._connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'alert_open'"
+            ).fetchone()
+            for statement in _SCHEMA:
+                self._connection.execute(statement)
+            if not has_open_table:
+                self._connection.execute(_SEED_OPEN)
+
+        self._pruned_at: float = 0.0
+
+    def record(self, events: Iterable[tuple[str, dict]], timestamp: float | None = None) -> int:
+        """Append one tick of events in a single transaction.
+
+        Args:
+            events: ``(event, alert)`` pairs, e.g. from :func:`alert_events`.
+            timestamp: Event time; defaults to ``time.time()``.
+
+        Returns:
+            The number of rows written.
+        """
+        stamp = time.time() if timestamp is None else timestamp
+        rows = [
+            (stamp, alert["node"], alert["rule"], alert["severity"], event, alert["message"])
+            for event, alert in events
+        ]
+        opened = [
+            (node, rule, severity, message, ts)
+            for ts, node, rule, severity, event, message in rows
+            if event == EVENT_FIRING
+        ]
+        closed = [(node, rule) for _, node, rule, _, event, _ in rows if event == EVENT_RESOLVED]
+
+        with self._lock:
+            if rows:
+                with self._connection:
+                    self._connection.executemany(_INSERT, rows)
+                    self._connection.executemany(_OPEN, opened)
+                    self._connection.executemany(_CLOSE, closed)
+            if stamp - self._pruned_at >= self.prune_interval:
+                self._prune(stamp)
+        return len(rows)
+
+    def _prune(self, now: float) -> int:
+        """Delete up to :data:`PRUNE_BATCH` expired events (lock held).
+
+        A full batch leaves the prune due, so the next tick continues.
+        """
+        with self._connection:
+            deleted = self._connection.execute(
+                _PRUNE, (now - self.retention, PRUNE_BATCH)
+            ).rowcount
+        if deleted < PRUNE_BATCH:
+            self._pruned_at = now
+        return deleted
+
+    def prune(self, now: float | None = None) -> int:
+        """Delete every event older than the retention window now.
+
+        Returns:
+            The number of rows deleted.
+        """
+        stamp = time.time() if now is None else now
+        total = 0
+        with self._lock:
+            while True:
+                deleted = self._prune(stamp)
+                total += deleted
+                if deleted < PRUNE_BATCH:
+                    return total
+
+    def query(
+        self,
+        *,
+        node: str | None = None,
+        severity: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int = DEFAULT_QUERY_LIMIT,
+    ) -> list[dict]:
+        """Return matching events, newest first.
+
+        Args:
+            node: Only events of this node.
+            severity: Only events of this severity (``"WARN"`` / ``"CRIT"``).
+            since: Only events at or after this time.
+            until: Only events before this time.
+            limit: Maximum number of rows.
+
+        Returns:
+            One dictionary per event with the keys of :data:`EVENT_COLUMNS`.
+        """
+        clauses = []
+        params: list = []
+        for clause, value in (
+            ("node = ?", node),
+            ("severity = ?", severity),
+            ("ts >= ?", since),
+            ("ts < ?", until),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+
+        sql = "SELECT ts, node, rule, severity, event, message FROM alert_events"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY ts DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+        return [dict(zip(EVENT_COLUMNS, row)) for row in rows]
+
+    def open_alerts(self) -> list[dict]:
+        """Return the alerts whose latest event is ``firing``.
+
+        Returns:
+            One dictionary per alert with ``node``, ``rule``, ``severity``,
+            ``message`` and ``since`` (time of its latest firing event).
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT node, rule, severity, message, ts FROM alert_open"
+            ).fetchall()
+        return [
+            {"node": node, "rule": rule, "severity": severity, "message": message, "since": ts}
+            for node, rule, severity, message, ts in rows
+        ]
+
+    def count(self) -> int:
+        """Return the number of stored events."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM alert_events").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "AlertHistoryStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+# ---------------------------------------------------------------------------
+# Provider wrapper
+# ---------------------------------------------------------------------------
+
+
+class AlertHistoryProvider:
+    """Provider wrapper storing the alert events of every snapshot.
+
+    Each snapshot gains an ``alert_history`` key with the
+    :data:`RECENT_EVENTS` newest events; the list is only re-queried after
+    a tick that wrote events.
+    """
+
+    def __init__(
+        self,
+        provider: Callable[[], dict],
+        path: str,
+        *,
+        recent: int = RECENT_EVENTS,
+        **options,
+    ) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            provider: Zero-argument cluster-state provider.
+            path: Database file path (appended to if it exists).
+            recent: Number of recent events published per snapshot.
+            **options: Extra keyword arguments for :class:`AlertHistoryStore`.
+        """
+        self._provider = provider
+        self.store = AlertHistoryStore(path, **options)
+        self.recent = recent
+        # Alerts firing when the previous run stopped; the first tick turns
+        # them into resolved events or leaves them untouched.
+        self._alerts: list[dict] = self.store.open_alerts()
+        self._recent: list[dict] = self.store.query(limit=recent)
+
+    def __call__(self) -> dict:
+        snapshot = self._provider()
+        alerts = snapshot["alerts"]
+        # Providers hand back the same list object while nothing changed.
+        events = alert_events(self._alerts, alerts) if alerts is not self._alerts else ()
+        self._alerts = alerts
+
+        # Recording runs every tick, so the retention window is also applied
+        # while no alert changes.
+        if self.store.record(events):
+            self._recent = self.store.query(limit=self.recent)
+        snapshot["alert_history"] = self._recent
+        return snapshot
+
+    def close(self) -> None:
+        """Close the database and the wrapped provider if it holds resources."""
+        self.store.close()
+        close = getattr(self._provider, "close", None)
+        if close is not None:
+            close()
@@ -0,0 +1,313 @@
+"""
+data/alert_rules.py
+===================
+Compiled, stateful threshold alert engine over a columnar node table.
+
+Threshold rules are compiled once into bound comparison predicates and are
+evaluated column-by-column: a full scan walks each column with C-level
+iteration, while a delta scan only looks at the rows reported as changed.
+
+Alert state is tracked across ticks per ``(node, rule)`` pair:
+
+    - ``pending``  — the condition holds but has not lasted ``for_ticks`` yet
+    - ``firing``   — the condition has held long enough to be reported
+    - ``resolved`` — the condition cleared; kept briefly, then dropped
+
+Alert dictionaries are only re-allocated when their severity or value
+changes, and WARN/CRIT counters of firing alerts are maintained in place so
+cluster health can be derived without rescanning the alert list.
+"""
+
+import time
+from itertools import compress
+from typing import Iterable
+
+from data.node_table import NodeTable
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Alert lifecycle states.
+STATE_PENDING: str = "pending"
+STATE_FIRING: str = "firing"
+STATE_RESOLVED: str = "resolved"
+
+#: Alert severities.
+SEVERITY_WARN: str = "WARN"
+SEVERITY_CRIT: str = "CRIT"
+
+#: Number of ticks a resolved alert is retained before being dropped.
+RESOLVED_RETENTION_TICKS: int = 5
+
+
+# ---------------------------------------------------------------------------
+# Rules
+# ---------------------------------------------------------------------------
+
+
+class ThresholdRule:
+    """One threshold rule over a single node-table column.
+
+    A rule triggers when the column value reaches ``warn`` (or ``crit`` when
+    no warning level exists). With ``below=True`` the comparison is inverted,
+    i.e. the rule triggers when the value drops to the threshold or lower.
+
+    The ``column`` may be any numeric column of the table or ``"ready"``.
+    """
+
+    __slots__ = (
+        "rule_id",
+        "column",
+        "warn",
+        "crit",
+        "below",
+        "message",
+        "for_ticks",
+        "trigger",
+        "is_crit",
+    )
+
+    def __init__(
+        self,
+        rule_id: str,
+        column: str,
+        *,
+        warn: int | None = None,
+        crit: int | None = None,
+        below: bool = False,
+        message: str,
+        for_ticks: int = 0,
+    ) -> None:
+        """Create and compile a rule.
+
+        Args:
+            rule_id: Stable identifier, unique within an engine.
+            column: Node-table column the rule reads.
+            warn: Threshold for a ``WARN`` alert, if any.
+            crit: Threshold for a ``CRIT`` alert, if any.
+            below: Trigger on values at or below the thresholds instead of at
+                or above them.
+            message: ``str.format`` template; ``{value}`` is the column value.
+            for_ticks: Ticks the condition must hold before the alert fires.
+        """
+        if warn is None and crit is None:
+            raise ValueError(f"rule {rule_id!r} needs a warn or crit threshold")
+
+        self.rule_id = rule_id
+        self.column = column
+        self.warn = warn
+        self.crit = crit
+        self.below = below
+        self.message = message
+        self.for_ticks = for_ticks
+
+        # Compile thresholds into bound int comparisons, which ``map()`` can
+        # drive over a whole column without a Python-level lambda.
+        trigger_at = warn if warn is not None else crit
+        self.trigger = int(trigger_at).__ge__ if below else int(trigger_at).__le__
+        if crit is None:
+            self.is_crit = None
+        else:
+            self.is_crit = int(crit).__ge__ if below else int(crit).__le__
+
+    def severity_for(self, value: int) -> str:
+        """Return the severity of a triggering *value*."""
+        if self.is_crit is not None and self.is_crit(value):
+            return SEVERITY_CRIT
+        return SEVERITY_WARN
+
+    def values(self, table: NodeTable):
+        """Return the column this rule reads from *table*."""
+        return table.ready if self.column == "ready" else table.column(self.column)
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+class _AlertRecord:
+    """Mutable lifecycle record behind one ``(node, rule)`` alert."""
+
+    __slots__ = ("rule", "state", "severity", "value", "started_tick", "resolved_tick", "payload")
+
+    def __init__(self, rule: ThresholdRule, tick: int) -> None:
+        self.rule = rule
+        self.state = STATE_PENDING
+        self.severity = ""
+        self.value: int | None = None
+        self.started_tick = tick
+        self.resolved_tick = 0
+        self.payload: dict = {}
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+
+class AlertRuleEngine:
+    """Evaluate compiled threshold rules and track alert state across ticks.
+
+    Typical usage::
+
+        engine = AlertRuleEngine(rules)
+        engine.evaluate(table, table.take_changes())
+        alerts = engine.alerts()
+        warn_count, crit_count = engine.counts()
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[ThresholdRule],
+        *,
+        resolved_retention: int = RESOLVED_RETENTION_TICKS,
+    ) -> None:
+        self.rules: tuple[ThresholdRule, ...] = tuple(rules)
+        self.resolved_retention = resolved_retention
+
+        self._tick: int = 0
+        self._records: dict[tuple[str, str], _AlertRecord] = {}
+        self._pending: set[tuple[str, str]] = set()
+        self._resolved: set[tuple[str, str]] = set()
+        self._firing: dict[tuple[str, str], dict] = {}
+        self._firing_list: list[dict] = []
+        self._firing_dirty: bool = False
+        self._counts: dict[str, int] = {SEVERITY_WARN: 0, SEVERITY_CRIT: 0}
+
+        #: ``(state, alert)`` transitions produced by the last evaluation.
+        self.transitions: list[tuple[str, dict]] = []
+
+    # -----------------------------------------------------------------------
+    # Evaluation
+    # -----------------------------------------------------------------------
+
+    def evaluate(self, table: NodeTable, changed: Iterable[int] | None) -> None:
+        """Advance alert state by one tick.
+
+        Args:
+            table: Current node table.
+            changed: Indices of rows changed since the previous evaluation,
+                or ``None`` to rescan every row (e.g. after membership
+                changes).
+        """
+        self._tick += 1
+        self.transitions = []
+        names = table.names
+
+        if changed is None:
+            breached: dict[tuple[str, str], tuple[ThresholdRule, int]] = {}
+            for rule in self.rules:
+                values = rule.values(table)
+                for index in compress(range(len(values)), map(rule.trigger, values)):
+                    breached[(names[index], rule.rule_id)] = (rule, values[index])
+
+            for key in [key for key in self._records if key not in breached]:
+                self._clear(key)
+            for key, (rule, value) in breached.items():
+                self._observe(key, rule, value)
+        else:
+            changed = tuple(changed)
+            for rule in self.rules:
+                values = rule.values(table)
+                trigger = rule.trigger
+                for index in changed:
+                    value = values[index]
+                    key = (names[index], rule.rule_id)
+                    if trigger(value):
+                        self._observe(key, rule, value)
+                    elif key in self._records:
+                        self._clear(key)
+
+        self._promote_pending()
+        self._expire_resolved()
+
+    def _observe(self, key: tuple[str, str], rule: ThresholdRule, value: int) -> None:
+        """Record that *rule* currently triggers for the node in *key*."""
+        record = self._records.get(key)
+        if record is None or record.state == STATE_RESOLVED:
+            self._resolved.discard(key)
+            record = _AlertRecord(rule, self._tick)
+            self._records[key] = record
+            self._pending.add(key)
+
+        if record.value == value:
+            return
+
+        severity = rule.severity_for(value)
+        if record.state == STATE_FIRING and severity != record.severity:
+            self._counts[record.severity] -= 1
+            self._counts[severity] += 1
+
+        record.value = value
+        record.severity = severity
+        record.payload = {
+            "node": key[0],
+            "rule": rule.rule_id,
+            "severity": severity,
+            "message": rule.message.format(value=value),
+            "since": record.payload.get("since", time.time()),
+        }
+
+        if record.state == STATE_FIRING:
+            self._firing[key] = record.payload
+            self._firing_dirty = True
+
+    def _clear(self, key: tuple[str, str]) -> None:
+        """Record that the condition behind *key* no longer holds."""
+        record = self._records[key]
+
+        if record.state == STATE_PENDING:
+            self._pending.discard(key)
+            del self._records[key]
+        elif record.state == STATE_FIRING:
+            record.state = STATE_RESOLVED
+            record.resolved_tick = self._tick
+            self._counts[record.severity] -= 1
+            del self._firing[key]
+            self._firing_dirty = True
+            self._resolved.add(key)
+            self.transitions.append((STATE_RESOLVED, record.payload))
+
+    def _promote_pending(self) -> None:
+        """Move pending alerts that held for long enough to ``firing``."""
+        for key in list(self._pending):
+            record = self._records[key]
+            if self._tick - record.started_tick < record.rule.for_ticks:
+                continue
+
+            self._pending.discard(key)
+            record.state = STATE_FIRING
+            self._counts[record.severity] += 1
+            self._firing[key] = record.payload
+            self._firing_dirty = True
+            self.transitions.append((STATE_FIRING, record.payload))
+
+    def _expire_resolved(self) -> None:
+        """Drop resolved alerts older than the retention window."""
+        for key in list(self._resolved):
+            record = self._records[key]
+            if self._tick - record.resolved_tick >= self.resolved_retention:
+                self._resolved.discard(key)
+                del self._records[key]
+
+    # -----------------------------------------------------------------------
+    # Output
+    # -----------------------------------------------------------------------
+
+    def alerts(self) -> list[dict]:
+        """Return firing alerts; the list is only rebuilt after changes."""
+        if self._firing_dirty:
+            self._firing_list = list(self._firing.values())
+            self._firing_dirty = False
+        return self._firing_list
+
+    def resolved(self) -> list[dict]:
+        """Return recently resolved alerts still within the retention window."""
+        return [self._records[key].payload for key in self._resolved]
+
+    def counts(self) -> tuple[int, int]:
+        """Return ``(warn_count, crit_count)`` of firing alerts."""
+        return self._counts[SEVERITY_WARN], self._counts[SEVERITY_CRIT]
@@ -7,14 +7,19 @@ This module generates a synthetic cluster state suitable for UI development,
 layout testing, and demo rendering. It is intentionally non-deterministic and
 does not attempt to model real cluster behavior with high fidelity.
 
-The returned cluster state has three top-level sections:
+The returned cluster state has four top-level sections:
     - summary
-    - nodes
+    - nodes (a columnar :class:`~data.node_table.NodeTable`)
     - alerts
+    - history (a shared :class:`~data.timeseries.MetricHistory`)
 """
 
 import random
 
+from data.alert_rules import ThresholdRule
+from data.node_table import NodeTable
+from data.pipeline import ClusterPipeline
+
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -50,6 +55,32 @@ CRIT_MEM_THRESHOLD: int = 95
 WARN_DISK_THRESHOLD: int = 90
 WARN_LATENCY_THRESHOLD: int = 15
 
+#: Default alert rules compiled from the thresholds above.
+DEFAULT_ALERT_RULES: tuple[ThresholdRule, ...] = (
+    ThresholdRule("node_not_ready", "ready", crit=0, below=True, message="Node NotReady"),
+    ThresholdRule(
+        "high_cpu",
+        "cpu",
+        warn=WARN_CPU_THRESHOLD,
+        crit=CRIT_CPU_THRESHOLD,
+        message="High CPU ({value}%)",
+    ),
+    ThresholdRule(
+        "high_memory",
+        "memory",
+        warn=WARN_MEM_THRESHOLD,
+        crit=CRIT_MEM_THRESHOLD,
+        message="High MEM ({value}%)",
+    ),
+    ThresholdRule("high_disk", "disk", warn=WARN_DISK_THRESHOLD, message="High Disk ({value}%)"),
+    ThresholdRule(
+        "high_latency",
+        "latency_ms",
+        warn=WARN_LATENCY_THRESHOLD,
+        message="High Latency ({value}ms)",
+    ),
+)
+
 
 #: Role-based capacity presets.
 ROLE_CAPACITY = {
@@ -68,6 +99,23 @@ ROLE_CAPACITY = {
 }
 
 
+#: Fixed demo node inventory as ``(name, role)`` pairs.
+FAKE_NODES: tuple[tuple[str, str], ...] = (
+    ("master-1", "master"),
+    ("worker-1", "worker"),
+    ("worker-2", "worker"),
+    ("worker-3", "worker"),
+)
+
+
+# ---------------------------------------------------------------------------
+# Provider state
+# ---------------------------------------------------------------------------
+
+#: Persistent node table, aggregator, alert engine and history.
+_PIPELINE: ClusterPipeline = ClusterPipeline(DEFAULT_ALERT_RULES)
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
@@ -79,73 +127,6 @@ def _status_for(role: str) -> str:
     return random.choices(["Ready", "NotReady"], weights=weights, k=1)[0]
 
 
-def _make_alerts(nodes: list[dict]) -> list[dict]:
-    """Generate alert objects from node-state dictionaries."""
-    alerts: list[dict] = []
-
-    for node in nodes:
-        if node["status"] != "Ready":
-            alerts.append(
-                {
-                    "node": node["name"],
-                    "severity": "CRIT",
-                    "message": "Node NotReady",
-                }
-            )
-
-        if node["cpu"] >= WARN_CPU_THRESHOLD:
-            severity = "CRIT" if node["cpu"] >= CRIT_CPU_THRESHOLD else "WARN"
-            alerts.append(
-                {
-                    "node": node["name"],
-                    "severity": severity,
-                    "message": f"High CPU ({node['cpu']}%)",
-                }
-            )
-
-        if node["memory"] >= WARN_MEM_THRESHOLD:
-            severity = "CRIT" if node["memory"] >= CRIT_MEM_THRESHOLD else "WARN"
-            alerts.append(
-                {
-                    "node": node["name"],
-                    "severity": severity,
-                    "message": f"High MEM ({node['memory']}%)",
-                }
-            )
-
-        if node["disk"] >= WARN_DISK_THRESHOLD:
-            alerts.append(
-                {
-                    "node": node["name"],
-                    "severity": "WARN",
-                    "message": f"High Disk ({node['disk']}%)",
-                }
-            )
-
-        if node["latency_ms"] >= WARN_LATENCY_THRESHOLD:
-            alerts.append(
-                {
-                    "node": node["name"],
-                    "severity": "WARN",
-                    "message": f"High Latency ({node['latency_ms']}ms)",
-                }
-            )
-
-    return alerts
-
-
-def _derive_cluster_health(alerts: list[dict]) -> str:
-    """Derive overall cluster health from alert severities."""
-    crit_count = sum(1 for alert in alerts if alert["severity"] == "CRIT")
-    warn_count = sum(1 for alert in alerts if alert["severity"] == "WARN")
-
-    if crit_count > 0:
-        return "CRITICAL"
-    if warn_count > 0:
-        return "DEGRADED"
-    return "HEALTHY"
-
-
 # ---------------------------------------------------------------------------
 # Public builders
 # ---------------------------------------------------------------------------
@@ -172,69 +153,67 @@ def generate_node(name: str, role: str) -> dict:
     }
 
 
-def get_cluster_state() -> dict:
-    """Generate a full fake cluster state for the dashboard."""
-    nodes = [
-        generate_node("master-1", "master"),
-        generate_node("worker-1", "worker"),
-        generate_node("worker-2", "worker"),
-        generate_node("worker-3", "worker"),
-    ]
-
-    total_nodes = len(nodes)
-    ready_nodes = sum(1 for node in nodes if node["status"] == "Ready")
-    notready_names = [node["name"] for node in nodes if node["status"] != "Ready"]
-
-    avg_cpu = sum(node["cpu"] for node in nodes) // total_nodes
-    avg_memory = sum(node["memory"] for node in nodes) // total_nodes
-
-    max_cpu_node = max(nodes, key=lambda node: node["cpu"])
-    max_mem_node = max(nodes, key=lambda node: node["memory"])
-
-    total_pods = sum(node["pods"] for node in nodes)
-
-    total_cores = sum(node["cpu_cores"] for node in nodes)
-    used_cores = round(
-        sum((node["cpu"] / 100) * node["cpu_cores"] for node in nodes),
-        1,
+def append_fake_node(table: NodeTable, name: str, role: str) -> int:
+    """Append one fake node row directly into a columnar node table.
+
+    This is the column-oriented counterpart of :func:`generate_node` and
+    avoids building an intermediate dictionary.
+
+    Returns:
+        The index of the new row.
+    """
+    capacity = ROLE_CAPACITY[role]
+
+    return table.append(
+        name,
+        role,
+        _status_for(role),
+        cpu=random.randint(MIN_UTILIZATION, MAX_UTILIZATION),
+        memory=random.randint(MIN_UTILIZATION, MAX_UTILIZATION),
+        disk=random.randint(MIN_UTILIZATION, MAX_UTILIZATION),
+        pods=random.randint(MIN_PODS, min(MAX_DEMO_PODS, capacity["pods_capacity"])),
+        latency_ms=random.randint(MIN_LATENCY_MS, MAX_LATENCY_MS),
+        uptime=random.randint(MIN_UPTIME_SEC, MAX_UPTIME_SEC),
+        cpu_cores=capacity["cpu_cores"],
+        mem_gb=capacity["mem_gb"],
+        disk_gb=capacity["disk_gb"],
+        pods_capacity=capacity["pods_capacity"],
     )
 
-    total_mem_gb = sum(node["mem_gb"] for node in nodes)
-    used_mem_gb = round(
-        sum((node["memory"] / 100) * node["mem_gb"] for node in nodes),
-        1,
+
+def refresh_fake_node(table: NodeTable, index: int) -> None:
+    """Re-randomize the dynamic fields of one existing fake node row in place."""
+    role = table.roles[index]
+    capacity = ROLE_CAPACITY[role]
+
+    table.update(
+        index,
+        status=_status_for(role),
+        cpu=random.randint(MIN_UTILIZATION, MAX_UTILIZATION),
+        memory=random.randint(MIN_UTILIZATION, MAX_UTILIZATION),
+        disk=random.randint(MIN_UTILIZATION, MAX_UTILIZATION),
+        pods=random.randint(MIN_PODS, min(MAX_DEMO_PODS, capacity["pods_capacity"])),
+        latency_ms=random.randint(MIN_LATENCY_MS, MAX_LATENCY_MS),
+        uptime=random.randint(MIN_UPTIME_SEC, MAX_UPTIME_SEC),
     )
 
-    total_pods_capacity = sum(node["pods_capacity"] for node in nodes)
-
-    alerts = _make_alerts(nodes)
-    warn_count = sum(1 for alert in alerts if alert["severity"] == "WARN")
-    crit_count = sum(1 for alert in alerts if alert["severity"] == "CRIT")
-
-    summary = {
-        "total_nodes": total_nodes,
-        "ready_nodes": ready_nodes,
-        "avg_cpu": avg_cpu,
-        "avg_memory": avg_memory,
-        "total_pods": total_pods,
-        "notready_names": notready_names,
-        "health": _derive_cluster_health(alerts),
-        "max_cpu": max_cpu_node["cpu"],
-        "max_cpu_node": max_cpu_node["name"],
-        "max_memory": max_mem_node["memory"],
-        "max_memory_node": max_mem_node["name"],
-        "used_cores": used_cores,
-        "total_cores": total_cores,
-        "used_mem_gb": used_mem_gb,
-        "total_mem_gb": total_mem_gb,
-        "pods_capacity": total_pods_capacity,
-        "alerts_total": len(alerts),
-        "alerts_warn": warn_count,
-        "alerts_crit": crit_count,
-    }
 
-    return {
-        "summary": summary,
-        "nodes": nodes,
-        "alerts": alerts,
-    }
\ No newline at end of file
+def get_cluster_state() -> dict:
+    """Generate a full fake cluster state for the dashboard.
+
+    Node data lives in a persistent :class:`~data.node_table.NodeTable` that
+    is updated in place each call; a :class:`~data.pipeline.ClusterPipeline`
+    turns the changed rows into the summary, alerts and metric history. The
+    ``nodes`` entry is an independent copy of the table, so published
+    snapshots are never mutated afterwards.
+    """
+    table = _PIPELINE.table
+
+    if len(table) == 0:
+        for name, role in FAKE_NODES:
+            append_fake_node(table, name, role)
+    else:
+        for index in range(len(table)):
+            refresh_fake_node(table, index)
+
+    return _PIPELINE.publish()
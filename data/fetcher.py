@@ -0,0 +1,206 @@
+"""
+data/fetcher.py
+===============
+Background snapshot fetcher for dashboard data providers.
+
+This module runs a data provider on a worker thread and publishes every
+completed snapshot into a double buffer. The render loop only swaps in the
+most recently finished snapshot and never waits for provider I/O.
+
+Design goals:
+    - slow providers never stall the render loop
+    - readers only ever observe complete snapshots
+    - provider failures keep the last good snapshot on screen
+    - paused fetchers issue no provider calls at all
+
+Notes:
+    - A provider is any zero-argument callable returning a snapshot, such as
+      :func:`data.fake_cluster.get_cluster_state`.
+    - Snapshots are treated as immutable once published.
+"""
+
+import threading
+import time
+from typing import Any, Callable
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Default delay (in seconds) between the start of two consecutive fetches.
+DEFAULT_FETCH_INTERVAL: float = 1.0
+
+#: Maximum time (in seconds) ``stop()`` waits for the worker to exit.
+STOP_JOIN_TIMEOUT: float = 2.0
+
+
+# ---------------------------------------------------------------------------
+# Fetcher
+# ---------------------------------------------------------------------------
+
+
+class SnapshotFetcher:
+    """Run a data provider in the background and double-buffer its output.
+
+    The worker thread writes each new snapshot into the back buffer and then
+    flips the front/back indices under a lock, so :meth:`latest` always
+    returns a complete snapshot together with its version number.
+    """
+
+    def __init__(
+        self,
+        provider: Callable[[], Any],
+        *,
+        interval: float = DEFAULT_FETCH_INTERVAL,
+        name: str = "snapshot-fetcher",
+    ) -> None:
+        """Initialize the fetcher.
+
+        Args:
+            provider: Zero-argument callable returning one snapshot.
+            interval: Delay between the start of two consecutive fetches,
+                in seconds.
+            name: Name given to the worker thread.
+        """
+        self._provider = provider
+        self._interval = interval
+        self._name = name
+
+        self._lock = threading.Lock()
+        self._buffers: list[Any] = [None, None]
+        self._front: int = 0
+        self._version: int = 0
+
+        self._stop_event = threading.Event()
+        self._wake = threading.Event()
+        self._paused: bool = False
+        self._thread: threading.Thread | None = None
+
+        #: Last exception raised by the provider, or ``None`` after a success.
+        self.last_error: BaseException | None = None
+
+        #: Wall-clock duration (in seconds) of the last completed fetch.
+        self.last_fetch_duration: float = 0.0
+
+    # -----------------------------------------------------------------------
+    # Buffer access
+    # -----------------------------------------------------------------------
+
+    def _publish(self, snapshot: Any) -> None:
+        """Write *snapshot* into the back buffer and make it the front one."""
+        with self._lock:
+            back = 1 - self._front
+            self._buffers[back] = snapshot
+            self._front = back
+            self._version += 1
+
+    def latest(self) -> tuple[Any, int]:
+        """Return the most recently published snapshot and its version.
+
+        Returns:
+            A tuple of ``(snapshot, version)``. ``snapshot`` is ``None`` and
+            ``version`` is ``0`` until the first fetch completes.
+        """
+        with self._lock:
+            return self._buffers[self._front], self._version
+
+    # -----------------------------------------------------------------------
+    # Fetching
+    # -----------------------------------------------------------------------
+
+    def fetch_now(self) -> Any:
+        """Run the provider once on the calling thread and publish the result.
+
+        This is intended for the initial pre-render, before the render loop
+        starts. Provider errors are recorded in :attr:`last_error` and the
+        previous snapshot is kept.
+
+        Returns:
+            The current front snapshot after the fetch attempt.
+        """
+        started = time.monotonic()
+        try:
+            snapshot = self._provider()
+        except Exception as exc:  # noqa: BLE001 - keep the last good snapshot
+            self.last_error = exc
+        else:
+            self.last_error = None
+            self._publish(snapshot)
+        finally:
+            self.last_fetch_duration = time.monotonic() - started
+
+        return self.latest()[0]
+
+    def _run(self) -> None:
+        """Worker-thread loop: fetch, publish, then wait for the next slot."""
+        # A snapshot pre-fetched by ``fetch_now()`` counts as the first slot.
+        last_started = time.monotonic() if self.latest()[1] > 0 else None
+
+        while not self._stop_event.is_set():
+            if self._paused:
+                self._wake.wait()
+                self._wake.clear()
+                continue
+
+            if last_started is not None:
+                delay = self._interval - (time.monotonic() - last_started)
+                if delay > 0:
+                    # Woken early by ``set_interval()``, ``resume()`` or
+                    # ``stop()``: recheck.
+                    if self._wake.wait(delay):
+                        self._wake.clear()
+                    continue
+
+            last_started = time.monotonic()
+            self.fetch_now()
+
+    @property
+    def interval(self) -> float:
+        """Delay (in seconds) between the start of two consecutive fetches."""
+        return self._interval
+
+    def set_interval(self, interval: float) -> None:
+        """Change the fetch interval; a waiting worker picks it up at once."""
+        if interval == self._interval:
+            return
+        self._interval = interval
+        self._wake.set()
+
+    # -----------------------------------------------------------------------
+    # Lifecycle
+    # -----------------------------------------------------------------------
+
+    @property
+    def paused(self) -> bool:
+        """``True`` while the worker is paused and issues no fetches."""
+        return self._paused
+
+    def pause(self) -> None:
+        """Stop issuing fetches until :meth:`resume`; the front snapshot is kept."""
+        self._paused = True
+
+    def resume(self) -> None:
+        """Resume fetching; a fetch overdue by the interval starts at once."""
+        if not self._paused:
+            return
+        self._paused = False
+        self._wake.set()
+
+    def start(self) -> None:
+        """Start the background worker thread if it is not already running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._wake.clear()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Signal the worker thread to exit and wait briefly for it."""
+        self._stop_event.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=STOP_JOIN_TIMEOUT)
+            self._thread = None
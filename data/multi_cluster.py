@@ -0,0 +1,310 @@
+"""
+data/multi_cluster.py
+=====================
+Fleet-level cluster-state provider merging several clusters.
+
+:class:`MultiClusterProvider` wraps one cluster-state provider per cluster,
+fetches all of them concurrently on a shared worker pool, and merges the
+results into a single cluster-state dictionary with the usual sections:
+
+    - summary (fleet-wide, same keys as a single-cluster summary)
+    - nodes (one :class:`~data.node_table.NodeTable` with every node,
+      named ``<cluster>/<node>``)
+    - alerts (node names prefixed the same way)
+    - history (view of the fleet-level history, see
+      :class:`~data.timeseries.HistoryView`)
+    - rankings (top row indices per node sort mode, see :mod:`data.topk`)
+
+plus a ``clusters`` section with the per-cluster breakdown.
+
+Design goals:
+    - fetch wall time bounded by the slowest cluster, not the sum
+    - a slow or failing cluster never blocks or blanks the others
+    - no coupling to Rich or to dashboard state
+
+Typical usage::
+
+    provider = MultiClusterProvider({"eu-1": eu.get_cluster_state, "us-1": us.get_cluster_state})
+    state = provider()
+"""
+
+import time
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable
+
+from data.node_table import NUMERIC_COLUMNS, NodeTable
+from data.pipeline import TREND_WINDOW
+from data.timeseries import DEFAULT_HISTORY_DEPTH, MetricHistory
+from data.topk import NodeRanker
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Separator between cluster and node name in merged node names.
+NODE_NAME_SEPARATOR: str = "/"
+
+#: Default time (in seconds) one refresh waits for the slowest cluster.
+DEFAULT_CLUSTER_TIMEOUT: float = 5.0
+
+#: Summary keys that are plain sums over clusters.
+SUM_KEYS: tuple[str, ...] = (
+    "total_nodes",
+    "ready_nodes",
+    "total_pods",
+    "total_cores",
+    "total_mem_gb",
+    "pods_capacity",
+    "alerts_total",
+    "alerts_warn",
+    "alerts_crit",
+)
+
+#: Summary keys that are sums of rounded floats.
+FLOAT_SUM_KEYS: tuple[str, ...] = ("used_cores", "used_mem_gb")
+
+#: Cluster health values from best to worst; the fleet takes the worst.
+HEALTH_ORDER: tuple[str, ...] = ("HEALTHY", "DEGRADED", "CRITICAL")
+
+#: Fleet health floor while any cluster has no fresh data.
+STALE_CLUSTER_HEALTH: str = "DEGRADED"
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _worst_health(healths) -> str:
+    """Return the worst of *healths* according to :data:`HEALTH_ORDER`."""
+    rank = max((HEALTH_ORDER.index(h) for h in healths if h in HEALTH_ORDER), default=0)
+    return HEALTH_ORDER[rank]
+
+
+def _error_text(error: BaseException) -> str:
+    """Return a one-line description of a provider failure."""
+    return str(error) or type(error).__name__
+
+
+# ---------------------------------------------------------------------------
+# Provider
+# ---------------------------------------------------------------------------
+
+
+class MultiClusterProvider:
+    """Fetch several clusters in parallel and merge them into one fleet state."""
+
+    def __init__(
+        self,
+        clusters: dict[str, Callable[[], dict]],
+        *,
+        max_workers: int | None = None,
+        timeout: float = DEFAULT_CLUSTER_TIMEOUT,
+        history_depth: int = DEFAULT_HISTORY_DEPTH,
+        trend_window: int = TREND_WINDOW,
+    ) -> None:
+        """Create the worker pool; no cluster is fetched yet.
+
+        Args:
+            clusters: Cluster-state provider per cluster name, in display
+                order. Each provider is only ever called by one worker at a
+                time.
+            max_workers: Worker threads; defaults to one per cluster.
+            timeout: Time one refresh waits for outstanding clusters, in
+                seconds. Clusters still running afterwards keep their last
+                snapshot and are reported as stale.
+            history_depth: Samples retained per fleet history series.
+            trend_window: Samples published as ``cpu_trend`` / ``mem_trend``.
+
+        Raises:
+            ValueError: If *clusters* is empty.
+        """
+        if not clusters:
+            raise ValueError("at least one cluster is required")
+
+        self.clusters = dict(clusters)
+        self.timeout = timeout
+        self.trend_window = trend_window
+        self.history = MetricHistory(history_depth)
+        self.ranker = NodeRanker()
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or len(self.clusters),
+            thread_name_prefix="cluster-fetch",
+        )
+        #: In-flight fetch per cluster; a straggler is never submitted twice.
+        self._pending: dict[str, Future] = {}
+        #: Last good snapshot per cluster.
+        self._latest: dict[str, dict] = {}
+        #: ``(structure key, prefixed names)`` per cluster.
+        self._prefixed: dict[str, tuple[tuple[int, int], list[str]]] = {}
+        self._structure_key: tuple = ()
+        self._structure_version = 0
+
+    # -----------------------------------------------------------------------
+    # Fetching
+    # -----------------------------------------------------------------------
+
+    def _fetch(self, name: str) -> tuple[dict, float]:
+        """Call the provider of *name*; runs on a worker thread."""
+        started = time.perf_counter()
+        snapshot = self.clusters[name]()
+        return snapshot, time.perf_counter() - started
+
+    def _submit(self, name: str) -> Future:
+        """Return the in-flight fetch of *name*, starting one if needed."""
+        future = self._pending.get(name)
+        if future is None:
+            future = self._executor.submit(self._fetch, name)
+            self._pending[name] = future
+        return future
+
+    def fetch_all(self) -> dict[str, dict]:
+        """Fetch every cluster concurrently.
+
+        Returns:
+            One breakdown entry per cluster, in configuration order, with
+            ``error`` (``None`` on success), ``stale`` (no fresh snapshot
+            this refresh) and ``duration`` (fetch time in seconds, ``None``
+            unless it succeeded). Fresh snapshots are stored as the
+            clusters' latest.
+        """
+        pending = {name: self._submit(name) for name in self.clusters}
+        wait(pending.values(), timeout=self.timeout)
+
+        breakdown = {}
+        for name, future in pending.items():
+            entry = {"error": None, "stale": True, "duration": None}
+            if future.done():
+                del self._pending[name]
+                error = future.exception()
+                if error is None:
+                    self._latest[name], entry["duration"] = future.result()
+                    entry["stale"] = False
+                else:
+                    entry["error"] = _error_text(error)
+            else:
+                entry["error"] = f"no response after {self.timeout:g}s"
+            breakdown[name] = entry
+        return breakdown
+
+    # -----------------------------------------------------------------------
+    # Merging
+    # -----------------------------------------------------------------------
+
+    def _prefixed_names(self, name: str, nodes: NodeTable) -> list[str]:
+        """Return ``<cluster>/<node>`` names, rebuilt only on structure changes."""
+        key = (nodes.structure_version, len(nodes))
+        cached = self._prefixed.get(name)
+        if cached is None or cached[0] != key:
+            prefix = name + NODE_NAME_SEPARATOR
+            cached = (key, [prefix + node for node in nodes.names])
+            self._prefixed[name] = cached
+        return cached[1]
+
+    def _merge_nodes(self, snapshots: dict[str, dict]) -> NodeTable:
+        """Concatenate the clusters' node tables column by column."""
+        names: list[str] = []
+        roles: list[str] = []
+        ready = array("B")
+        columns = {column: array(typecode) for column, typecode in NUMERIC_COLUMNS.items()}
+
+        for name, snapshot in snapshots.items():
+            nodes = snapshot["nodes"]
+            names += self._prefixed_names(name, nodes)
+            roles += nodes.roles
+            ready += nodes.ready
+            for column, data in columns.items():
+                data += nodes.column_values(column)
+
+        table = NodeTable.from_columns(names, roles, ready, columns)
+
+        # Bump the structure version only when a cluster's node set changed,
+        # so per-node history survives ordinary refreshes.
+        structure_key = tuple(
+            (name, snapshot["nodes"].structure_version, len(snapshot["nodes"]))
+            for name, snapshot in snapshots.items()
+        )
+        if structure_key != self._structure_key:
+            self._structure_key = structure_key
+            self._structure_version += 1
+        table.structure_version = self._structure_version
+        return table
+
+    def _merge_summary(self, snapshots: dict[str, dict], table: NodeTable, stale: bool) -> dict:
+        """Combine the clusters' summaries into a fleet summary."""
+        summaries = {name: snapshot["summary"] for name, snapshot in snapshots.items()}
+        summary = {key: sum(s.get(key, 0) for s in summaries.values()) for key in SUM_KEYS}
+        for key in FLOAT_SUM_KEYS:
+            summary[key] = round(sum(s.get(key, 0) for s in summaries.values()), 1)
+
+        node_count = len(table)
+        summary["avg_cpu"] = table.total("cpu") // node_count if node_count else 0
+        summary["avg_memory"] = table.total("memory") // node_count if node_count else 0
+        summary["notready_names"] = [
+            name + NODE_NAME_SEPARATOR + node
+            for name, s in summaries.items()
+            for node in s.get("notready_names", ())
+        ]
+
+        for metric in ("cpu", "memory"):
+            best_name, best = None, None
+            for name, s in summaries.items():
+                if s.get(f"max_{metric}_node", "-") != "-" and (
+                    best is None or s[f"max_{metric}"] > best[f"max_{metric}"]
+                ):
+                    best_name, best = name, s
+            summary[f"max_{metric}"] = best[f"max_{metric}"] if best else 0
+            summary[f"max_{metric}_node"] = (
+                best_name + NODE_NAME_SEPARATOR + best[f"max_{metric}_node"] if best else "-"
+            )
+
+        healths = [s.get("health") for s in summaries.values()]
+        if stale:
+            healths.append(STALE_CLUSTER_HEALTH)
+        summary["health"] = _worst_health(healths)
+        return summary
+
+    def __call__(self) -> dict:
+        """Fetch every cluster and return the merged fleet state."""
+        breakdown = self.fetch_all()
+        snapshots = {name: self._latest[name] for name in self.clusters if name in self._latest}
+
+        for name, entry in breakdown.items():
+            snapshot = snapshots.get(name)
+            entry["summary"] = snapshot["summary"] if snapshot else None
+
+        table = self._merge_nodes(snapshots)
+        stale = any(entry["stale"] for entry in breakdown.values())
+        summary = self._merge_summary(snapshots, table, stale)
+        alerts = [
+            {**alert, "node": name + NODE_NAME_SEPARATOR + alert["node"], "cluster": name}
+            for name, snapshot in snapshots.items()
+            for alert in snapshot["alerts"]
+        ]
+
+        self.history.record(summary, table)
+        # The merged table is new every refresh, so the heaps are re-heapified
+        # (O(n)); still cheaper than sorting per sort mode.
+        self.ranker.apply(table, None)
+        summary["cpu_trend"] = self.history.cluster_window("cpu", self.trend_window)
+        summary["mem_trend"] = self.history.cluster_window("memory", self.trend_window)
+
+        return {
+            "summary": summary,
+            "nodes": table,
+            "alerts": alerts,
+            "history": self.history.view(),
+            "rankings": self.ranker.rankings(),
+            "clusters": breakdown,
+        }
+
+    def close(self) -> None:
+        """Stop the worker pool and close member providers that hold resources."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for provider in self.clusters.values():
+            close = getattr(provider, "close", None)
+            if close is not None:
+                close()
@@ -0,0 +1,366 @@
+"""
+data/node_table.py
+==================
+Columnar node-state table for data providers.
+
+Node metrics are stored as a struct of arrays: one compact ``array.array``
+column per numeric field plus plain lists for names and roles. Cluster-wide
+reductions (sums, maxima, weighted usage) run over whole columns with C-level
+builtins instead of walking per-node dictionaries.
+
+The table still behaves like a read-only sequence of node dictionaries, so
+UI builders can index or slice it exactly as they would a ``list[dict]``.
+Only the rows that are actually accessed are materialized.
+
+In-place updates through :meth:`NodeTable.update` record the touched row
+indices, so downstream consumers (e.g. the summary aggregator) can process
+only the rows that changed since the last :meth:`NodeTable.take_changes`.
+
+Uptime can advance with a provider clock without rewriting the column:
+rows started with :meth:`NodeTable.start_uptime` remember the
+:attr:`NodeTable.clock` value at which their stored uptime was taken, and
+their uptime is worked out when a row or column is read, so advancing the
+clock is O(1). :meth:`NodeTable.same_values` ignores uptime, which would
+otherwise make every snapshot of a running cluster differ.
+
+Notes:
+    - Percentage metrics (cpu, memory, disk) are stored as unsigned bytes and
+      clamped to ``0..100`` on write.
+    - Readiness is stored as a ``0``/``1`` byte column; row dictionaries expose
+      it as the usual ``"Ready"``/``"NotReady"`` status string.
+"""
+
+from array import array
+from itertools import compress
+from operator import mul, not_
+from typing import Iterator
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Numeric columns and their ``array`` type codes.
+NUMERIC_COLUMNS: dict[str, str] = {
+    "cpu": "B",
+    "memory": "B",
+    "disk": "B",
+    "pods": "I",
+    "latency_ms": "I",
+    "uptime": "L",
+    "cpu_cores": "I",
+    "mem_gb": "I",
+    "disk_gb": "I",
+    "pods_capacity": "I",
+}
+
+#: Numeric columns holding clamped percentages.
+PERCENT_COLUMNS: frozenset[str] = frozenset({"cpu", "memory", "disk"})
+
+#: Boot-clock value of rows whose stored uptime does not advance.
+NO_BOOT: int = -1
+
+#: Status strings used in row dictionaries.
+STATUS_READY: str = "Ready"
+STATUS_NOT_READY: str = "NotReady"
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _clamp_percent(value: int) -> int:
+    """Clamp a percentage metric into ``0..100``."""
+    return max(0, min(100, int(value)))
+
+
+# ---------------------------------------------------------------------------
+# Node table
+# ---------------------------------------------------------------------------
+
+
+class NodeTable:
+    """Struct-of-arrays container for per-node state.
+
+    Rows are addressed by integer index. Numeric fields live in typed
+    ``array`` columns (see :data:`NUMERIC_COLUMNS`), readiness in a byte
+    column, and names/roles in plain lists.
+    """
+
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self.roles: list[str] = []
+        self.ready: array = array("B")
+        self.columns: dict[str, array] = {
+            column: array(typecode) for column, typecode in NUMERIC_COLUMNS.items()
+        }
+        #: Provider clock in whole seconds; advancing uptimes follow it.
+        self.clock: int = 0
+        #: Per row, the clock value at which its stored uptime was taken, or
+        #: :data:`NO_BOOT` if the stored uptime is static.
+        self.boot: array = array("q")
+
+        #: Incremented whenever rows are added or removed.
+        self.structure_version: int = 0
+        self._changed: set[int] = set()
+        self._structure_changed: bool = False
+
+    # -----------------------------------------------------------------------
+    # Construction
+    # -----------------------------------------------------------------------
+
+    @classmethod
+    def from_nodes(cls, nodes) -> "NodeTable":
+        """Build a table from an iterable of node-state dictionaries."""
+        table = cls()
+        for node in nodes:
+            table.append_node(node)
+        return table
+
+    @classmethod
+    def from_columns(cls, names, roles, ready, columns: dict) -> "NodeTable":
+        """Build a table directly from column data.
+
+        Args:
+            names: Node names.
+            roles: Node roles, in row order.
+            ready: Readiness flags (``0``/``1``), in row order.
+            columns: One sequence per entry in :data:`NUMERIC_COLUMNS`; values
+                are stored as given, without clamping.
+        """
+        table = cls()
+        table.names = list(names)
+        table.roles = list(roles)
+        table.ready = array("B", ready)
+        table.columns = {
+            column: array(typecode, columns[column])
+            for column, typecode in NUMERIC_COLUMNS.items()
+        }
+        table.boot = array("q", [NO_BOOT]) * len(table.names)
+        table.structure_version = 1
+        table._structure_changed = True
+        return table
+
+    def append(self, name: str, role: str, status: str, **values: int) -> int:
+        """Append one node row.
+
+        Args:
+            name: Node name.
+            role: Node role, e.g. ``"master"`` or ``"worker"``.
+            status: ``"Ready"`` or any other readiness string.
+            **values: One keyword per entry in :data:`NUMERIC_COLUMNS`.
+
+        Returns:
+            The index of the new row.
+        """
+        self.names.append(name)
+        self.roles.append(role)
+        self.ready.append(1 if status == STATUS_READY else 0)
+        self.boot.append(NO_BOOT)
+
+        for column, data in self.columns.items():
+            value = values[column]
+            data.append(_clamp_percent(value) if column in PERCENT_COLUMNS else int(value))
+
+        self.structure_version += 1
+        self._structure_changed = True
+        return len(self.names) - 1
+
+    def remove(self, index: int) -> None:
+        """Remove one row; later rows shift down by one index."""
+        del self.names[index]
+        del self.roles[index]
+        del self.ready[index]
+        del self.boot[index]
+        for data in self.columns.values():
+            del data[index]
+
+        self.structure_version += 1
+        self._structure_changed = True
+
+    def append_node(self, node: dict) -> int:
+        """Append one row from a node-state dictionary."""
+        return self.append(
+            node["name"],
+            node["role"],
+            node["status"],
+            **{column: node[column] for column in NUMERIC_COLUMNS},
+        )
+
+    def copy(self) -> "NodeTable":
+        """Return an independent copy of the table (column-wise memcpy)."""
+        clone = NodeTable.__new__(NodeTable)
+        clone.names = self.names.copy()
+        clone.roles = self.roles.copy()
+        clone.ready = array("B", self.ready)
+        clone.columns = {
+            column: array(data.typecode, data) for column, data in self.columns.items()
+        }
+        clone.clock = self.clock
+        clone.boot = array("q", self.boot)
+        clone.structure_version = self.structure_version
+        clone._changed = set()
+        clone._structure_changed = False
+        return clone
+
+    def same_values(self, other: "NodeTable") -> bool:
+        """Return ``True`` if *other* holds exactly the same rows and values.
+
+        Uptime is not compared: it changes with every clock tick.
+        """
+        return (
+            self.names == other.names
+            and self.roles == other.roles
+            and self.ready == other.ready
+            and all(
+                data == other.columns[column]
+                for column, data in self.columns.items()
+                if column != "uptime"
+            )
+        )
+
+    # -----------------------------------------------------------------------
+    # In-place updates and change tracking
+    # -----------------------------------------------------------------------
+
+    def update(self, index: int, *, status: str | None = None, **values: int) -> None:
+        """Overwrite fields of one existing row and mark it as changed.
+
+        Args:
+            index: Row index to update.
+            status: Optional new readiness status string.
+            **values: New values for any subset of :data:`NUMERIC_COLUMNS`.
+        """
+        if status is not None:
+            self.ready[index] = 1 if status == STATUS_READY else 0
+
+        for column, value in values.items():
+            self.columns[column][index] = (
+                _clamp_percent(value) if column in PERCENT_COLUMNS else int(value)
+            )
+        if "uptime" in values and self.boot[index] != NO_BOOT:
+            self.boot[index] = self.clock
+
+        self._changed.add(index)
+
+    def uptime(self, index: int) -> int:
+        """Return the uptime of row *index* as of the current clock."""
+        boot = self.boot[index]
+        uptime = self.columns["uptime"][index]
+        return uptime if boot == NO_BOOT else uptime + self.clock - boot
+
+    def start_uptime(self, index: int, uptime: int | None = None) -> None:
+        """Let the uptime of row *index* advance with the clock from now on.
+
+        Args:
+            index: Row index.
+            uptime: Optional new current uptime; defaults to the current one.
+        """
+        self.columns["uptime"][index] = self.uptime(index) if uptime is None else int(uptime)
+        self.boot[index] = self.clock
+
+    def stop_uptime(self, index: int) -> None:
+        """Freeze the uptime of row *index* at its current value."""
+        self.columns["uptime"][index] = self.uptime(index)
+        self.boot[index] = NO_BOOT
+
+    def take_changes(self) -> set[int] | None:
+        """Return and reset the set of rows changed since the last call.
+
+        Returns:
+            The changed row indices, or ``None`` if rows were added or removed
+            since the last call (consumers must then rescan the whole table).
+        """
+        changed = None if self._structure_changed else self._changed
+        self._changed = set()
+        self._structure_changed = False
+        return changed
+
+    # -----------------------------------------------------------------------
+    # Sequence protocol (row dictionaries)
+    # -----------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def row(self, index: int) -> dict:
+        """Materialize one row as a node-state dictionary."""
+        node = {
+            "name": self.names[index],
+            "role": self.roles[index],
+            "status": STATUS_READY if self.ready[index] else STATUS_NOT_READY,
+        }
+        for column, data in self.columns.items():
+            node[column] = data[index]
+        node["uptime"] = self.uptime(index)
+        return node
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("node index out of range")
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[dict]:
+        for index in range(len(self)):
+            yield self.row(index)
+
+    # -----------------------------------------------------------------------
+    # Column access and reductions
+    # -----------------------------------------------------------------------
+
+    def column(self, name: str) -> array:
+        """Return the raw ``array`` backing numeric column *name*."""
+        return self.columns[name]
+
+    def column_values(self, name: str) -> array:
+        """Return column *name* as of the current clock.
+
+        Equal to :meth:`column` except for ``uptime`` while rows advance
+        with the clock; that column is then evaluated into a new array.
+        """
+        data = self.columns[name]
+        if name != "uptime" or max(self.boot, default=NO_BOOT) == NO_BOOT:
+            return data
+        clock = self.clock
+        return array(
+            data.typecode,
+            [
+                value if boot == NO_BOOT else value + clock - boot
+                for value, boot in zip(data, self.boot)
+            ],
+        )
+
+    def total(self, name: str) -> int:
+        """Return the sum of numeric column *name*."""
+        return sum(self.columns[name])
+
+    def argmax(self, name: str) -> int:
+        """Return the index of the first maximum in column *name*, or ``-1``."""
+        data = self.columns[name]
+        if not data:
+            return -1
+        return data.index(max(data))
+
+    def weighted_total(self, percent_column: str, capacity_column: str) -> int:
+        """Return ``sum(percent * capacity)`` over two columns.
+
+        Divide the result by 100 to get absolute usage in capacity units.
+        """
+        return sum(map(mul, self.columns[percent_column], self.columns[capacity_column]))
+
+    def ready_count(self) -> int:
+        """Return the number of Ready nodes."""
+        return sum(self.ready)
+
+    def notready_indices(self) -> list[int]:
+        """Return row indices of nodes that are not Ready, in table order."""
+        return list(compress(range(len(self)), map(not_, self.ready)))
+
+    def notready_names(self) -> list[str]:
+        """Return names of nodes that are not Ready, in table order."""
+        return [self.names[index] for index in self.notready_indices()]
@@ -0,0 +1,112 @@
+"""
+data/pipeline.py
+================
+Shared snapshot assembly for table-backed cluster providers.
+
+A provider owns a :class:`ClusterPipeline`, mutates ``pipeline.table`` in
+place, and calls :meth:`ClusterPipeline.publish` once per tick. The pipeline
+feeds the changed rows to the summary aggregator, the alert engine and the
+node ranker, records metric history, and returns a complete cluster-state
+dictionary:
+
+    - summary
+    - nodes (an independent copy of the node table)
+    - alerts
+    - history (a read-only view of the metric history, see
+      :class:`~data.timeseries.HistoryView`)
+    - rankings (top row indices per node sort mode, see :mod:`data.topk`)
+"""
+
+from typing import Iterable
+
+from data.aggregator import SummaryAggregator
+from data.alert_rules import AlertRuleEngine, ThresholdRule
+from data.node_table import NodeTable
+from data.timeseries import DEFAULT_HISTORY_DEPTH, MetricHistory
+from data.topk import NodeRanker
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Number of recent samples published as ``cpu_trend`` / ``mem_trend``.
+TREND_WINDOW: int = 30
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _derive_cluster_health(warn_count: int, crit_count: int) -> str:
+    """Derive overall cluster health from firing alert counts."""
+    if crit_count > 0:
+        return "CRITICAL"
+    if warn_count > 0:
+        return "DEGRADED"
+    return "HEALTHY"
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+
+class ClusterPipeline:
+    """Turn in-place node-table updates into published cluster snapshots."""
+
+    def __init__(
+        self,
+        rules: Iterable[ThresholdRule],
+        *,
+        history_depth: int = DEFAULT_HISTORY_DEPTH,
+        trend_window: int = TREND_WINDOW,
+    ) -> None:
+        """Create an empty pipeline.
+
+        Args:
+            rules: Alert rules evaluated against the node table.
+            history_depth: Samples retained per metric-history series.
+            trend_window: Samples published as ``cpu_trend`` / ``mem_trend``.
+        """
+        self.table = NodeTable()
+        self.aggregator = SummaryAggregator()
+        self.alert_engine = AlertRuleEngine(rules)
+        self.history = MetricHistory(history_depth)
+        self.ranker = NodeRanker()
+        self.trend_window = trend_window
+
+    def publish(self) -> dict:
+        """Fold pending table changes and return a complete cluster state."""
+        table = self.table
+        changed = table.take_changes()
+
+        self.aggregator.apply(table, changed)
+        self.alert_engine.evaluate(table, changed)
+        self.ranker.apply(table, changed)
+
+        alerts = self.alert_engine.alerts()
+        warn_count, crit_count = self.alert_engine.counts()
+
+        summary = self.aggregator.summary()
+        self.history.record(summary, table)
+
+        summary.update(
+            {
+                "health": _derive_cluster_health(warn_count, crit_count),
+                "alerts_total": len(alerts),
+                "alerts_warn": warn_count,
+                "alerts_crit": crit_count,
+                "cpu_trend": self.history.cluster_window("cpu", self.trend_window),
+                "mem_trend": self.history.cluster_window("memory", self.trend_window),
+            }
+        )
+
+        return {
+            "summary": summary,
+            "nodes": table.copy(),
+            "alerts": alerts,
+            "history": self.history.view(),
+            "rankings": self.ranker.rankings(),
+        }
@@ -0,0 +1,488 @@
+"""
+data/prometheus.py
+==================
+Pooled, concurrent Prometheus HTTP query provider.
+
+This module queries the Prometheus HTTP API (``/api/v1/query`` and
+``/api/v1/query_range``) for a fixed list of queries per refresh and turns
+the responses into compact, UI-friendly result dictionaries.
+
+Design goals:
+    - keep-alive HTTP connections reused across queries and refreshes
+    - queries of one refresh run concurrently on a small thread pool
+    - every query has its own timeout, counted from when it starts; a slow
+      query never delays the others beyond that timeout
+    - identical queries are sent only once per refresh, and a query still
+      running from an earlier refresh is not sent again
+
+Notes:
+    - Only the standard library is used (``http.client``), so the client can
+      be exercised against any local stand-in HTTP server.
+    - Query failures are reported per query; the provider itself only raises
+      for programming errors, so the fetcher keeps publishing snapshots.
+
+Typical usage::
+
+    provider = PrometheusProvider(PrometheusClient("http://localhost:9090"))
+    state = provider()
+"""
+
+import http.client
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Iterable
+from urllib.parse import urlencode, urlsplit
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Query kinds.
+KIND_INSTANT: str = "instant"
+KIND_RANGE: str = "range"
+
+#: Default per-query timeout, in seconds.
+DEFAULT_QUERY_TIMEOUT: float = 2.0
+
+#: Default number of concurrent query workers (and pooled connections).
+DEFAULT_MAX_WORKERS: int = 8
+
+#: Default lookback and resolution of range queries, in seconds.
+DEFAULT_RANGE_SECONDS: int = 900
+DEFAULT_RANGE_STEP: int = 30
+
+#: Provider health values.
+HEALTH_HEALTHY: str = "Healthy"
+HEALTH_DEGRADED: str = "Degraded"
+HEALTH_DOWN: str = "Down"
+
+#: Errors that indicate a pooled keep-alive connection was closed by the peer.
+_STALE_CONNECTION_ERRORS: tuple[type[BaseException], ...] = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+
+class PrometheusQuery:
+    """One named PromQL query issued on every refresh."""
+
+    __slots__ = ("query_id", "expr", "kind", "range_seconds", "step", "timeout")
+
+    def __init__(
+        self,
+        query_id: str,
+        expr: str,
+        *,
+        kind: str = KIND_INSTANT,
+        range_seconds: int = DEFAULT_RANGE_SECONDS,
+        step: int = DEFAULT_RANGE_STEP,
+        timeout: float | None = None,
+    ) -> None:
+        """Initialize the query.
+
+        Args:
+            query_id: Unique identifier used as the result key.
+            expr: PromQL expression.
+            kind: :data:`KIND_INSTANT` or :data:`KIND_RANGE`.
+            range_seconds: Lookback window of range queries.
+            step: Resolution of range queries, in seconds.
+            timeout: Per-query timeout, in seconds; ``None`` uses the
+                client's timeout.
+        """
+        if kind not in (KIND_INSTANT, KIND_RANGE):
+            raise ValueError(f"unknown query kind: {kind!r}")
+
+        self.query_id = query_id
+        self.expr = expr
+        self.kind = kind
+        self.range_seconds = range_seconds
+        self.step = step
+        self.timeout = timeout
+
+    @property
+    def dedup_key(self) -> tuple:
+        """Identity of the HTTP request this query results in."""
+        if self.kind == KIND_INSTANT:
+            return (self.kind, self.expr)
+        return (self.kind, self.expr, self.range_seconds, self.step)
+
+
+#: Queries issued by default on every Prometheus refresh.
+DEFAULT_PROMETHEUS_QUERIES: tuple[PrometheusQuery, ...] = (
+    PrometheusQuery("targets_up", "sum(up)"),
+    PrometheusQuery("targets_total", "count(up)"),
+    PrometheusQuery(
+        "cpu_usage",
+        '100 * (1 - avg(rate(node_cpu_seconds_total{mode="idle"}[5m])))',
+    ),
+    PrometheusQuery(
+        "memory_usage",
+        "100 * (1 - sum(node_memory_MemAvailable_bytes) / sum(node_memory_MemTotal_bytes))",
+    ),
+    PrometheusQuery("firing_alerts", 'count(ALERTS{alertstate="firing"}) or vector(0)'),
+    PrometheusQuery("scrape_duration", "avg(scrape_duration_seconds)"),
+    PrometheusQuery("tsdb_series", "prometheus_tsdb_head_series"),
+    PrometheusQuery(
+        "cpu_usage_range",
+        '100 * (1 - avg(rate(node_cpu_seconds_total{mode="idle"}[5m])))',
+        kind=KIND_RANGE,
+    ),
+)
+
+
+class PrometheusError(Exception):
+    """Raised when Prometheus answers with an error or an unexpected payload."""
+
+
+# ---------------------------------------------------------------------------
+# Connection pool
+# ---------------------------------------------------------------------------
+
+
+class _ConnectionPool:
+    """Bounded LIFO pool of keep-alive HTTP connections to one host."""
+
+    def __init__(self, base_url: str, size: int) -> None:
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"invalid Prometheus URL: {base_url!r}")
+
+        self._connection_class = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self._host = parts.hostname
+        self._port = parts.port
+        self.path_prefix = parts.path.rstrip("/")
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=size)
+
+        #: Number of connections opened so far.
+        self.opened: int = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        """Return ``(connection, reused)`` with *timeout* applied to its socket."""
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                self.opened += 1
+            return self._connection_class(self._host, self._port, timeout=timeout), False
+
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        return connection, True
+
+    def release(self, connection: http.client.HTTPConnection) -> None:
+        """Return a healthy connection to the pool (or close it if full)."""
+        try:
+            self._idle.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+
+def _summarize(query: PrometheusQuery, data: dict) -> dict:
+    """Reduce a Prometheus ``data`` object to UI-friendly fields."""
+    result_type = data.get("resultType")
+    result = data.get("result")
+
+    if result_type == "scalar":
+        return {"series": 1, "value": float(result[1]), "samples": []}
+
+    if result_type == "vector":
+        value = float(result[0]["value"][1]) if result else None
+        return {"series": len(result), "value": value, "samples": []}
+
+    if result_type == "matrix":
+        samples = [float(point[1]) for point in result[0]["values"]] if result else []
+        return {
+            "series": len(result),
+            "value": samples[-1] if samples else None,
+            "samples": samples,
+        }
+
+    raise PrometheusError(f"unsupported result type for {query.query_id}: {result_type!r}")
+
+
+class PrometheusClient:
+    """Concurrent Prometheus HTTP API client with pooled connections."""
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: float = DEFAULT_QUERY_TIMEOUT,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            base_url: Prometheus base URL, e.g. ``"http://localhost:9090"``.
+            max_workers: Concurrent queries (and pooled connections).
+            timeout: Default timeout for requests without their own.
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self._pool = _ConnectionPool(base_url, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prom")
+        #: In-flight query per dedup key; a straggler is never submitted twice.
+        self._pending: dict[tuple, Future] = {}
+        #: ``time.perf_counter()`` at which each pending query started running.
+        self._started: dict[tuple, float] = {}
+
+    @property
+    def connections_opened(self) -> int:
+        """Number of HTTP connections opened since the client was created."""
+        return self._pool.opened
+
+    def _get(self, path: str, params: dict, timeout: float) -> dict:
+        """Send one GET request and return the decoded ``data`` object."""
+        url = f"{self._pool.path_prefix}{path}?{urlencode(params)}"
+
+        connection, reused = self._pool.acquire(timeout)
+        try:
+            try:
+                connection.request("GET", url, headers={"Accept": "application/json"})
+                response = connection.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                if not reused:
+                    raise
+                # The server closed an idle keep-alive connection: retry once.
+                connection.close()
+                connection, reused = self._pool.acquire(timeout)
+                connection.request("GET", url, headers={"Accept": "application/json"})
+                response = connection.getresponse()
+
+            body = response.read()
+        except BaseException:
+            connection.close()
+            raise
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._pool.release(connection)
+
+        try:
+            payload = json.loads(body)
+        except ValueError as exc:
+            raise PrometheusError(f"HTTP {response.status}: invalid JSON response") from exc
+
+        if payload.get("status") != "success":
+            raise PrometheusError(payload.get("error") or f"HTTP {response.status}")
+        return payload["data"]
+
+    def timeout_for(self, query: PrometheusQuery) -> float:
+        """Return the timeout of *query*, falling back to the client's."""
+        return self.timeout if query.timeout is None else query.timeout
+
+    def query(self, query: PrometheusQuery, now: float | None = None) -> dict:
+        """Run one query synchronously and return its summarized result."""
+        now = time.time() if now is None else now
+        timeout = self.timeout_for(query)
+        if query.kind == KIND_INSTANT:
+            data = self._get("/api/v1/query", {"query": query.expr, "time": now}, timeout)
+        else:
+            params = {
+                "query": query.expr,
+                "start": now - query.range_seconds,
+                "end": now,
+                "step": query.step,
+            }
+            data = self._get("/api/v1/query_range", params, timeout)
+        return _summarize(query, data)
+
+    def _timed_query(self, query: PrometheusQuery, now: float) -> dict:
+        """Run *query* and wrap its outcome into a result dictionary."""
+        started = time.perf_counter()
+        try:
+            result = self.query(query, now)
+        except Exception as exc:  # noqa: BLE001 - reported per query
+            result = {
+                "series": 0,
+                "value": None,
+                "samples": [],
+                "error": str(exc) or type(exc).__name__,
+            }
+        else:
+            result["error"] = None
+        result["duration"] = time.perf_counter() - started
+        return result
+
+    def _run_pending(self, query: PrometheusQuery, now: float) -> dict:
+        """Note the start time of *query*, then run it; runs on a worker thread."""
+        self._started[query.dedup_key] = time.perf_counter()
+        return self._timed_query(query, now)
+
+    def _submit(self, query: PrometheusQuery, now: float) -> Future:
+        """Return the in-flight run of *query*, starting one if needed.
+
+        A run that already finished belongs to an earlier refresh and is
+        replaced by a fresh one.
+        """
+        future = self._pending.get(query.dedup_key)
+        if future is not None and future.done():
+            self._forget(query.dedup_key)
+            future = None
+        if future is None:
+            future = self._executor.submit(self._run_pending, query, now)
+            self._pending[query.dedup_key] = future
+        return future
+
+    def _forget(self, key: tuple) -> None:
+        """Drop the in-flight bookkeeping of dedup key *key*."""
+        del self._pending[key]
+        self._started.pop(key, None)
+
+    def run_queries(self, queries: Iterable[PrometheusQuery]) -> dict[str, dict]:
+        """Run *queries* concurrently, sending identical requests only once.
+
+        A query still running from an earlier refresh is not sent again;
+        its result is used once it arrives. Each query's timeout counts from
+        when a worker starts it. Queries that no worker started before the
+        longest timeout of the refresh are cancelled.
+
+        Args:
+            queries: Queries of one refresh.
+
+        Returns:
+            ``{query_id: result}`` in input order. Each result holds
+            ``series``, ``value``, ``samples``, ``error`` and ``duration``.
+            Queries still running after their timeout are reported as
+            timed out, cancelled ones as not started.
+        """
+        queries = list(queries)
+        now = time.time()
+        started = time.perf_counter()
+
+        futures: dict[tuple, Future] = {}
+        timeouts: dict[tuple, float] = {}
+        for query in queries:
+            key = query.dedup_key
+            if key not in futures:
+                futures[key] = self._submit(query, now)
+            timeouts[key] = max(timeouts.get(key, 0.0), self.timeout_for(query))
+        queue_deadline = started + max(timeouts.values(), default=0.0)
+
+        def give_up_at(key: tuple) -> float:
+            run_started = self._started.get(key)
+            return queue_deadline if run_started is None else run_started + timeouts[key]
+
+        while True:
+            clock = time.perf_counter()
+            waiting = {
+                key: give_up_at(key)
+                for key, future in futures.items()
+                if not future.done() and give_up_at(key) > clock
+            }
+            if not waiting:
+                break
+            wait([futures[key] for key in waiting], timeout=min(waiting.values()) - clock)
+
+        outcomes: dict[tuple, dict] = {}
+        clock = time.perf_counter()
+        for key, future in futures.items():
+            if future.done() and not future.cancelled():
+                outcomes[key] = future.result()
+                self._forget(key)
+            elif key not in self._started and future.cancel():
+                outcomes[key] = {"error": "not started: all workers busy", "duration": 0.0}
+                self._forget(key)
+            else:
+                run_started = self._started.get(key, clock)
+                outcomes[key] = {"error": "timed out", "duration": clock - run_started}
+
+        results = {}
+        for query in queries:
+            outcome = outcomes[query.dedup_key]
+            if "series" in outcome:
+                result = dict(outcome)
+            else:
+                result = {"series": 0, "value": None, "samples": [], **outcome}
+            result.update({"expr": query.expr, "kind": query.kind})
+            results[query.query_id] = result
+        return results
+
+    def close(self) -> None:
+        """Stop the worker pool and close pooled connections."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._pool.close()
+
+
+# ---------------------------------------------------------------------------
+# Provider
+# ---------------------------------------------------------------------------
+
+
+def _derive_health(results: dict[str, dict]) -> str:
+    """Derive Prometheus health from per-query outcomes."""
+    failed = sum(1 for result in results.values() if result["error"] is not None)
+    if results and failed == len(results):
+        return HEALTH_DOWN
+    if failed:
+        return HEALTH_DEGRADED
+    return HEALTH_HEALTHY
+
+
+class PrometheusProvider:
+    """Zero-argument provider returning one Prometheus state per call."""
+
+    def __init__(
+        self,
+        client: PrometheusClient,
+        queries: Iterable[PrometheusQuery] = DEFAULT_PROMETHEUS_QUERIES,
+    ) -> None:
+        """Initialize the provider.
+
+        Args:
+            client: Client used for every refresh.
+            queries: Queries issued on every refresh.
+        """
+        self.client = client
+        self.queries = tuple(queries)
+
+    def __call__(self) -> dict[str, Any]:
+        """Run every query once and return the Prometheus state.
+
+        Returns:
+            A dictionary with ``url``, ``health``, ``results``, ``errors``,
+            ``requests`` (unique HTTP requests sent) and ``duration``.
+        """
+        started = time.perf_counter()
+        results = self.client.run_queries(self.queries)
+        return {
+            "url": self.client.base_url,
+            "health": _derive_health(results),
+            "results": results,
+            "errors": sum(1 for result in results.values() if result["error"] is not None),
+            "requests": len({query.dedup_key for query in self.queries}),
+            "duration": time.perf_counter() - started,
+        }
+
+    def close(self) -> None:
+        """Release the client's connections and threads."""
+        self.client.close()
@@ -0,0 +1,203 @@
+"""
+data/providers.py
+=================
+Registry of named, view-scoped dashboard data sources.
+
+Each data source pairs a provider with its own background
+:class:`data.fetcher.SnapshotFetcher`. Pages declare which sources they
+read; the orchestration layer then activates exactly the sources of the
+visible page and pauses all others, so inactive providers issue no fetches
+and put no load on their backends.
+
+Design goals:
+    - one fetcher per provider, paused while no visible page needs it
+    - change detection per source, so identical snapshots cause no rebuild
+    - no coupling to Rich or to page routing
+
+Typical usage::
+
+    registry = ProviderRegistry()
+    registry.register(DataSource("cluster", get_cluster_state, prefetch=True))
+    registry.activate_only(("cluster",))
+    registry.swap(("cluster",))
+    state = registry.snapshots(("cluster",))
+"""
+
+from typing import Any, Callable, Iterable
+
+from data.fetcher import DEFAULT_FETCH_INTERVAL, SnapshotFetcher
+
+
+# ---------------------------------------------------------------------------
+# Data source
+# ---------------------------------------------------------------------------
+
+
+def _always_differs(previous: Any, snapshot: Any) -> bool:
+    """Default change detector: every new snapshot counts as a change."""
+    return True
+
+
+class DataSource:
+    """One named provider with its fetcher and the last swapped-in snapshot."""
+
+    def __init__(
+        self,
+        name: str,
+        provider: Callable[[], Any],
+        *,
+        differs: Callable[[Any, Any], bool] = _always_differs,
+        interval: float = DEFAULT_FETCH_INTERVAL,
+        prefetch: bool = False,
+    ) -> None:
+        """Initialize the source; its fetcher starts paused.
+
+        Args:
+            name: Source name pages refer to, e.g. ``"cluster"``.
+            provider: Zero-argument callable returning one snapshot.
+            differs: ``differs(previous, snapshot)`` change detector;
+                ``previous`` is ``None`` before the first swap.
+            interval: Initial fetch interval, in seconds.
+            prefetch: Fetch synchronously on activation when no snapshot
+                exists yet (for cheap local providers only).
+        """
+        self.name = name
+        self.provider = provider
+        self.prefetch = prefetch
+        self._differs = differs
+
+        self.fetcher = SnapshotFetcher(provider, interval=interval, name=f"{name}-fetcher")
+        self.fetcher.pause()
+
+        #: Latest snapshot swapped in by the render loop.
+        self.snapshot: Any = None
+        #: Fetcher version of :attr:`snapshot`.
+        self.version: int = 0
+        #: Bumped only when a swapped-in snapshot differs from the previous one.
+        self.data_version: int = 0
+
+    @property
+    def ready(self) -> bool:
+        """``True`` once the fetcher has published at least one snapshot."""
+        return self.fetcher.latest()[1] > 0
+
+    @property
+    def active(self) -> bool:
+        """``True`` while the source's fetcher is running."""
+        return not self.fetcher.paused
+
+    def activate(self) -> None:
+        """Resume background fetching, prefetching once if configured."""
+        if self.prefetch and self.fetcher.latest()[1] == 0:
+            self.fetcher.fetch_now()
+        self.fetcher.resume()
+        self.fetcher.start()
+
+    def pause(self) -> None:
+        """Stop background fetching; the last snapshot stays available."""
+        self.fetcher.pause()
+
+    def swap(self) -> bool:
+        """Swap in the fetcher's latest snapshot.
+
+        Returns:
+            ``True`` if a newer, different snapshot was swapped in.
+        """
+        snapshot, version = self.fetcher.latest()
+        if snapshot is None or version == self.version:
+            return False
+
+        differs = self._differs(self.snapshot, snapshot)
+        self.snapshot = snapshot
+        self.version = version
+        if differs:
+            self.data_version += 1
+        return differs
+
+    def close(self) -> None:
+        """Stop the fetcher and close the provider if it holds resources."""
+        self.fetcher.stop()
+        close = getattr(self.provider, "close", None)
+        if close is not None:
+            close()
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+
+class ProviderRegistry:
+    """Named data sources, activated per visible page."""
+
+    def __init__(self) -> None:
+        self._sources: dict[str, DataSource] = {}
+
+    def register(self, source: DataSource) -> None:
+        """Add *source*, replacing any source registered under its name."""
+        self._sources[source.name] = source
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._sources
+
+    def __getitem__(self, name: str) -> DataSource:
+        return self._sources[name]
+
+    def get(self, name: str) -> DataSource | None:
+        """Return the source registered as *name*, or ``None``."""
+        return self._sources.get(name)
+
+    def snapshot(self, name: str) -> Any:
+        """Return the latest snapshot of *name* (``None`` if absent or not fetched yet)."""
+        source = self._sources.get(name)
+        return None if source is None else source.snapshot
+
+    def activate_only(self, names: Iterable[str]) -> None:
+        """Activate the registered sources in *names* and pause all others."""
+        wanted = set(names)
+        for name, source in self._sources.items():
+            if name in wanted:
+                if not source.active:
+                    source.activate()
+            elif source.active:
+                source.pause()
+
+    def swap(self, names: Iterable[str]) -> list[DataSource]:
+        """Swap in new snapshots of the registered sources in *names*.
+
+        Returns:
+            The sources whose snapshot changed.
+        """
+        return [
+            self._sources[name]
+            for name in names
+            if name in self._sources and self._sources[name].swap()
+        ]
+
+    def snapshots(self, names: Iterable[str]) -> dict[str, Any]:
+        """Return ``{name: snapshot}`` for the registered sources in *names*.
+
+        Unregistered names are left out, so pages can tell an unconfigured
+        source (missing key) from one still waiting for data (``None``).
+        """
+        return {name: self._sources[name].snapshot for name in names if name in self._sources}
+
+    def data_key(self, names: Iterable[str]) -> tuple[int, ...]:
+        """Return the data versions of *names* as a hashable change key."""
+        return tuple(
+            self._sources[name].data_version for name in names if name in self._sources
+        )
+
+    def ready(self, names: Iterable[str]) -> bool:
+        """Return ``True`` if every registered source in *names* has published data."""
+        return all(self._sources[name].ready for name in names if name in self._sources)
+
+    def set_interval(self, interval: float) -> None:
+        """Set the fetch interval of every source."""
+        for source in self._sources.values():
+            source.fetcher.set_interval(interval)
+
+    def close(self) -> None:
+        """Stop every fetcher and close every provider."""
+        for source in self._sources.values():
+            source.close()
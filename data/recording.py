@@ -0,0 +1,532 @@
+"""
+data/recording.py
+=================
+Record and replay of cluster-state snapshot streams.
+
+:class:`RecordingProvider` wraps any cluster-state provider and appends every
+snapshot it returns to a compact, append-only log. :class:`ReplayProvider`
+serves a recorded log back as a provider, in real time, faster or slower,
+or one record per call.
+
+On-disk format::
+
+    MAGIC
+    record*  where  record = header(payload_len: u32, kind: u8, timestamp: f64)
+                             payload(zlib-compressed JSON, payload_len bytes)
+
+Records are either keyframes (the full state) or deltas against the
+previous record: changed summary keys, removed and upserted alerts, and
+per-column ``[indices, values]`` pairs for changed node cells. A keyframe
+is written every :data:`DEFAULT_KEYFRAME_INTERVAL` records and whenever
+nodes join or leave, which bounds seek cost during replay.
+
+Design goals:
+    - append-only writes, one flush per snapshot
+    - replay memory-maps the log; only a small offset index is kept in memory
+    - a truncated trailing record (e.g. after a crash) is ignored on replay
+
+Typical usage::
+
+    provider = RecordingProvider(get_cluster_state, "incident.rec")
+    ...
+    replay = ReplayProvider("incident.rec", speed=10.0)
+    state = replay()
+"""
+
+import json
+import mmap
+import os
+import struct
+import time
+import zlib
+from array import array
+from bisect import bisect_right
+from itertools import compress
+from operator import ne
+from typing import Any, Callable, Iterator
+
+from data.node_table import NodeTable
+from data.timeseries import DEFAULT_HISTORY_DEPTH, MetricHistory
+from data.topk import NodeRanker
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: File signature written at the start of every recording.
+MAGIC: bytes = b"TUIREC\x00\x01"
+
+#: Record kinds.
+KIND_KEYFRAME: int = 1
+KIND_DELTA: int = 2
+
+#: Maximum number of records between two keyframes.
+DEFAULT_KEYFRAME_INTERVAL: int = 120
+
+#: zlib compression level for record payloads.
+COMPRESSION_LEVEL: int = 6
+
+#: Record header: payload length, record kind, capture timestamp.
+_RECORD_HEADER = struct.Struct("<IBd")
+
+
+# ---------------------------------------------------------------------------
+# Payload encoding
+# ---------------------------------------------------------------------------
+
+
+def _scan_records(buffer, size: int) -> Iterator[tuple[int, int, float, int]]:
+    """Yield ``(offset, kind, timestamp, end)`` for every complete record.
+
+    Scanning stops at the first record whose payload extends past *size*.
+    """
+    position = len(MAGIC)
+    while position + _RECORD_HEADER.size <= size:
+        length, kind, stamp = _RECORD_HEADER.unpack_from(buffer, position)
+        end = position + _RECORD_HEADER.size + length
+        if end > size:
+            return
+        yield position, kind, stamp, end
+        position = end
+
+
+def _encode_payload(payload: dict) -> bytes:
+    """Serialize and compress one record payload."""
+    text = json.dumps(payload, separators=(",", ":"))
+    return zlib.compress(text.encode("utf-8"), COMPRESSION_LEVEL)
+
+
+def _decode_payload(data: bytes) -> dict:
+    """Decompress and deserialize one record payload."""
+    return json.loads(zlib.decompress(data))
+
+
+def _encode_table(table: NodeTable) -> dict:
+    """Return the full column data of *table* as a JSON-ready dictionary."""
+    return {
+        "names": table.names,
+        "roles": table.roles,
+        "ready": table.ready.tolist(),
+        "columns": {column: table.column_values(column).tolist() for column in table.columns},
+    }
+
+
+def _decode_table(data: dict) -> NodeTable:
+    """Rebuild a :class:`NodeTable` from :func:`_encode_table` output."""
+    return NodeTable.from_columns(data["names"], data["roles"], data["ready"], data["columns"])
+
+
+def _diff_column(old: array, new: array) -> list | None:
+    """Return ``[indices, values]`` of cells that differ, or ``None`` if equal."""
+    if old == new:
+        return None
+    indices = list(compress(range(len(new)), map(ne, old, new)))
+    return [indices, [new[index] for index in indices]]
+
+
+def _apply_column(data: array, diff: list) -> None:
+    """Write a ``[indices, values]`` column diff into *data* in place."""
+    for index, value in zip(*diff):
+        data[index] = value
+
+
+def _alert_key(alert: dict) -> tuple[str, str]:
+    """Return the ``(node, rule)`` identity of an alert."""
+    return alert["node"], alert["rule"]
+
+
+def _apply_alerts(alerts: list[dict], diff: list) -> list[dict]:
+    """Apply a ``[removed_keys, upserted_alerts]`` diff and return the new list."""
+    removed, upserts = diff
+    by_key = {_alert_key(alert): alert for alert in alerts}
+    for node, rule in removed:
+        by_key.pop((node, rule), None)
+    for alert in upserts:
+        by_key[_alert_key(alert)] = alert
+    return list(by_key.values())
+
+
+def _diff_alerts(old: list[dict], new: list[dict]) -> list | None:
+    """Return a ``[removed_keys, upserted_alerts]`` diff turning *old* into *new*.
+
+    Returns ``None`` if applying the diff would not reproduce the order of
+    *new*; the caller then stores the full list instead.
+    """
+    old_by_key = {_alert_key(alert): alert for alert in old}
+    new_keys = {_alert_key(alert) for alert in new}
+    removed = [list(key) for key in old_by_key if key not in new_keys]
+    upserts = [alert for alert in new if old_by_key.get(_alert_key(alert)) != alert]
+
+    diff = [removed, upserts]
+    if _apply_alerts(old, diff) != new:
+        return None
+    return diff
+
+
+# ---------------------------------------------------------------------------
+# Recording
+# ---------------------------------------------------------------------------
+
+
+def _truncate_partial_record(path: str) -> None:
+    """Validate an existing recording and cut off an incomplete last record.
+
+    Raises:
+        ValueError: If *path* is not a recording.
+    """
+    with open(path, "r+b") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size < len(MAGIC) or handle.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"not a cluster recording: {path}")
+
+        end = len(MAGIC)
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            for _offset, _kind, _stamp, end in _scan_records(view, size):
+                pass
+
+        if end < size:
+            handle.truncate(end)
+
+
+class SnapshotRecorder:
+    """Append cluster snapshots to a delta-encoded recording file."""
+
+    def __init__(self, path: str, *, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> None:
+        """Open *path* for appending, writing the file signature if it is new.
+
+        A truncated trailing record left by an interrupted writer is cut off
+        before new records are appended.
+
+        Args:
+            path: Recording file path.
+            keyframe_interval: Maximum number of records between keyframes.
+
+        Raises:
+            ValueError: If *path* exists but is not a recording.
+        """
+        self.path = path
+        self.keyframe_interval = max(1, keyframe_interval)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        if not is_new:
+            _truncate_partial_record(path)
+
+        self._file = open(path, "ab")
+        if is_new:
+            self._file.write(MAGIC)
+            self._file.flush()
+
+        self._summary: dict | None = None
+        self._alerts: list | None = None
+        self._table: NodeTable | None = None
+        self._since_keyframe: int = 0
+
+        #: Number of records written through this recorder.
+        self.records: int = 0
+
+    def _needs_keyframe(self, table: NodeTable) -> bool:
+        """Return ``True`` if the next record must be a full keyframe."""
+        return (
+            self._table is None
+            or self._since_keyframe >= self.keyframe_interval
+            or table.names != self._table.names
+            or table.roles != self._table.roles
+        )
+
+    def _delta(self, summary: dict, alerts: list, table: NodeTable) -> dict:
+        """Build the delta payload against the previously recorded state."""
+        previous = self._summary
+        payload: dict[str, Any] = {
+            "s": {key: value for key, value in summary.items() if previous.get(key) != value},
+        }
+
+        removed = [key for key in previous if key not in summary]
+        if removed:
+            payload["x"] = removed
+        if alerts != self._alerts:
+            diff = _diff_alerts(self._alerts, alerts)
+            if diff is None:
+                payload["a"] = alerts
+            else:
+                payload["ad"] = diff
+
+        ready = _diff_column(self._table.ready, table.ready)
+        if ready is not None:
+            payload["r"] = ready
+
+        columns = {}
+        for column in table.columns:
+            diff = _diff_column(self._table.column_values(column), table.column_values(column))
+            if diff is not None:
+                columns[column] = diff
+        if columns:
+            payload["c"] = columns
+
+        return payload
+
+    def record(self, snapshot: dict, timestamp: float | None = None) -> None:
+        """Append one snapshot to the recording.
+
+        Args:
+            snapshot: Cluster-state dictionary with ``summary``, ``nodes``
+                and ``alerts`` keys.
+            timestamp: Capture time; defaults to ``time.time()``.
+        """
+        summary = snapshot["summary"]
+        alerts = snapshot["alerts"]
+        table = snapshot["nodes"]
+
+        if self._needs_keyframe(table):
+            kind = KIND_KEYFRAME
+            payload = {"s": summary, "a": alerts, "n": _encode_table(table)}
+            self._since_keyframe = 0
+        else:
+            kind = KIND_DELTA
+            payload = self._delta(summary, alerts, table)
+            self._since_keyframe += 1
+
+        data = _encode_payload(payload)
+        stamp = time.time() if timestamp is None else timestamp
+        self._file.write(_RECORD_HEADER.pack(len(data), kind, stamp))
+        self._file.write(data)
+        self._file.flush()
+
+        self._summary = dict(summary)
+        self._alerts = list(alerts)
+        self._table = table.copy()
+        self.records += 1
+
+    def close(self) -> None:
+        """Close the recording file."""
+        self._file.close()
+
+    def __enter__(self) -> "SnapshotRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class RecordingProvider:
+    """Provider wrapper recording every snapshot returned by *provider*."""
+
+    def __init__(self, provider: Callable[[], dict], path: str, **options: Any) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            provider: Zero-argument cluster-state provider.
+            path: Recording file path (appended to if it exists).
+            **options: Extra keyword arguments for :class:`SnapshotRecorder`.
+        """
+        self._provider = provider
+        self.recorder = SnapshotRecorder(path, **options)
+
+    def __call__(self) -> dict:
+        snapshot = self._provider()
+        self.recorder.record(snapshot)
+        return snapshot
+
+    def close(self) -> None:
+        """Close the underlying recording."""
+        self.recorder.close()
+
+
+# ---------------------------------------------------------------------------
+# Replay
+# ---------------------------------------------------------------------------
+
+
+class RecordingReader:
+    """Memory-mapped random access to the records of a recording file.
+
+    Opening a recording only scans record headers to build an offset index;
+    payloads are decompressed on demand straight from the mapping.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Map *path* and index its records.
+
+        Raises:
+            ValueError: If *path* is not a recording or holds no keyframe.
+        """
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < len(MAGIC):
+            self._file.close()
+            raise ValueError(f"not a cluster recording: {path}")
+
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"not a cluster recording: {path}")
+
+        self.offsets = array("Q")
+        self.kinds = array("B")
+        self.timestamps = array("d")
+
+        # A truncated trailing record is skipped by the scan.
+        for offset, kind, stamp, _end in _scan_records(self._map, size):
+            self.offsets.append(offset)
+            self.kinds.append(kind)
+            self.timestamps.append(stamp)
+
+        self.keyframes = array(
+            "Q", (index for index, kind in enumerate(self.kinds) if kind == KIND_KEYFRAME)
+        )
+        if not self.keyframes or self.keyframes[0] != 0:
+            self.close()
+            raise ValueError(f"recording does not start with a keyframe: {path}")
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def payload(self, index: int) -> dict:
+        """Decode the payload of record *index*."""
+        offset = self.offsets[index]
+        length, _kind, _stamp = _RECORD_HEADER.unpack_from(self._map, offset)
+        start = offset + _RECORD_HEADER.size
+        return _decode_payload(self._map[start : start + length])
+
+    def keyframe_before(self, index: int) -> int:
+        """Return the index of the last keyframe at or before record *index*."""
+        return self.keyframes[bisect_right(self.keyframes, index) - 1]
+
+    def close(self) -> None:
+        """Release the mapping and the file handle."""
+        self._map.close()
+        self._file.close()
+
+
+class ReplayProvider:
+    """Serve the snapshots of a recording as a cluster-state provider.
+
+    With a *speed*, each call returns the snapshot that was current at the
+    corresponding point of the recorded timeline (``speed=10`` plays ten
+    times faster than real time). With ``speed=None``, each call advances by
+    exactly one record, which makes benchmark runs reproducible.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        speed: float | None = 1.0,
+        loop: bool = False,
+        history_depth: int = DEFAULT_HISTORY_DEPTH,
+    ) -> None:
+        """Open the recording.
+
+        Args:
+            path: Recording file path.
+            speed: Playback speed factor, or ``None`` to step one record per call.
+            loop: Restart from the beginning after the last record.
+            history_depth: Number of samples kept in the replayed history.
+        """
+        self.reader = RecordingReader(path)
+        self.speed = speed
+        self.loop = loop
+        self.history = MetricHistory(history_depth)
+
+        self._position: int = -1
+        self._summary: dict = {}
+        self._alerts: list = []
+        self._table: NodeTable | None = None
+        #: Rows changed since the last served snapshot (``None``: all).
+        self._changed: set[int] | None = None
+        self._ranker = NodeRanker()
+        self._snapshot: dict | None = None
+        self._started: float = time.monotonic()
+
+    @property
+    def position(self) -> int:
+        """Index of the record currently being served (``-1`` before the first call)."""
+        return self._position
+
+    def _target_index(self) -> int:
+        """Return the record index to serve for the current call."""
+        last = len(self.reader) - 1
+
+        if self.speed is None:
+            target = self._position + 1
+            if target > last:
+                target = 0 if self.loop else last
+            return target
+
+        timestamps = self.reader.timestamps
+        now = time.monotonic()
+        point = timestamps[0] + (now - self._started) * self.speed
+        if point > timestamps[last] and self.loop and self._position == last:
+            self._started = now
+            return 0
+        return max(0, bisect_right(timestamps, point) - 1)
+
+    def _load(self, index: int) -> None:
+        """Apply record *index* on top of the current replay state."""
+        payload = self.reader.payload(index)
+
+        if self.reader.kinds[index] == KIND_KEYFRAME:
+            self._summary = payload["s"]
+            self._alerts = payload["a"]
+            self._table = _decode_table(payload["n"])
+            self._changed = None
+            return
+
+        summary = dict(self._summary)
+        summary.update(payload["s"])
+        for key in payload.get("x", ()):
+            summary.pop(key, None)
+        self._summary = summary
+
+        if "a" in payload:
+            self._alerts = payload["a"]
+        elif "ad" in payload:
+            self._alerts = _apply_alerts(self._alerts, payload["ad"])
+        if "r" in payload:
+            _apply_column(self._table.ready, payload["r"])
+            self._mark_changed(payload["r"])
+        for column, diff in payload.get("c", {}).items():
+            _apply_column(self._table.columns[column], diff)
+            self._mark_changed(diff)
+
+    def _mark_changed(self, diff: list) -> None:
+        """Remember the rows touched by a column diff for the ranker."""
+        if self._changed is not None:
+            self._changed.update(diff[0])
+
+    def _seek(self, target: int) -> None:
+        """Move the replay state to record *target*."""
+        keyframe = self.reader.keyframe_before(target)
+        start = self._position + 1
+        if target < self._position or keyframe > self._position:
+            start = keyframe
+
+        for index in range(start, target + 1):
+            self._load(index)
+        self._position = target
+
+    def __call__(self) -> dict:
+        target = self._target_index()
+        if self._snapshot is not None and target == self._position:
+            return self._snapshot
+
+        self._seek(target)
+        self.history.record(self._summary, self._table)
+        self._ranker.apply(self._table, self._changed)
+        self._changed = set()
+        self._snapshot = {
+            "summary": dict(self._summary),
+            "nodes": self._table.copy(),
+            "alerts": list(self._alerts),
+            "history": self.history.view(),
+            "rankings": self._ranker.rankings(),
+        }
+        return self._snapshot
+
+    def close(self) -> None:
+        """Close the underlying recording."""
+        self.reader.close()
@@ -0,0 +1,234 @@
+"""
+data/synthetic_cluster.py
+=========================
+Deterministic, scalable synthetic cluster provider for load testing.
+
+Unlike :mod:`data.fake_cluster`, this generator is seeded and stateful:
+metrics follow bounded random walks, a configurable fraction of nodes moves
+each tick, Ready nodes gain ``tick_interval`` seconds of uptime, nodes flap
+between Ready and NotReady, and nodes can join or leave the cluster. Given
+the same seed and parameters, the sequence of snapshots is identical from
+run to run.
+
+Node capacities come from :data:`data.fake_cluster.ROLE_CAPACITY` and alerts
+use :data:`data.fake_cluster.DEFAULT_ALERT_RULES`, so synthetic clusters
+exercise exactly the thresholds the demo provider uses.
+
+Typical usage::
+
+    cluster = SyntheticCluster(5000, seed=7, flap_rate=2.0)
+    state = cluster.get_cluster_state()
+"""
+
+import random
+
+from data.fake_cluster import (
+    DEFAULT_ALERT_RULES,
+    MASTER_READY_WEIGHTS,
+    MAX_LATENCY_MS,
+    MAX_UTILIZATION,
+    MIN_LATENCY_MS,
+    MIN_PODS,
+    MIN_UPTIME_SEC,
+    MIN_UTILIZATION,
+    ROLE_CAPACITY,
+    WORKER_READY_WEIGHTS,
+)
+from data.pipeline import ClusterPipeline
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Supported cluster size range.
+MIN_SYNTHETIC_NODES: int = 10
+MAX_SYNTHETIC_NODES: int = 100_000
+
+#: One master is generated per this many nodes (at least one, at most five).
+NODES_PER_MASTER: int = 50
+MAX_MASTERS: int = 5
+
+#: Default fraction of nodes whose metrics move each tick.
+DEFAULT_CHANGE_FRACTION: float = 0.05
+
+#: Maximum per-tick random-walk step for each metric column.
+WALK_STEPS: dict[str, int] = {
+    "cpu": 6,
+    "memory": 3,
+    "disk": 1,
+    "pods": 2,
+    "latency_ms": 2,
+}
+
+#: Upper bound for synthetic latency (ms); walks may exceed the demo range.
+MAX_SYNTHETIC_LATENCY_MS: int = 3 * MAX_LATENCY_MS
+
+#: Default simulated seconds per tick (added to the uptime of Ready nodes).
+DEFAULT_TICK_INTERVAL: float = 1.0
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _clamp(value: int, low: int, high: int) -> int:
+    """Clamp *value* into ``low..high``."""
+    return max(low, min(high, value))
+
+
+# ---------------------------------------------------------------------------
+# Generator
+# ---------------------------------------------------------------------------
+
+
+class SyntheticCluster:
+    """Seeded synthetic cluster with random-walk metrics and node churn.
+
+    Rates (``flap_rate``, ``join_rate``, ``leave_rate``) are expected events
+    per tick; fractional rates are realized with a single random draw, so the
+    per-tick cost depends on the number of events and moved nodes, not on
+    cluster size.
+    """
+
+    def __init__(
+        self,
+        node_count: int = 100,
+        *,
+        seed: int = 0,
+        change_fraction: float = DEFAULT_CHANGE_FRACTION,
+        flap_rate: float = 0.5,
+        join_rate: float = 0.0,
+        leave_rate: float = 0.0,
+        tick_interval: float = DEFAULT_TICK_INTERVAL,
+    ) -> None:
+        """Create the initial cluster.
+
+        Args:
+            node_count: Initial number of nodes (clamped to
+                :data:`MIN_SYNTHETIC_NODES` .. :data:`MAX_SYNTHETIC_NODES`).
+            seed: Seed of the private random generator.
+            change_fraction: Fraction of nodes whose metrics move each tick.
+            flap_rate: Expected Ready/NotReady flips per tick.
+            join_rate: Expected new worker nodes per tick.
+            leave_rate: Expected removed worker nodes per tick.
+            tick_interval: Simulated seconds per tick.
+        """
+        self._rng = random.Random(seed)
+        self.change_fraction = change_fraction
+        self.flap_rate = flap_rate
+        self.join_rate = join_rate
+        self.leave_rate = leave_rate
+        self.tick_interval = tick_interval
+        #: Simulated seconds since creation; uptime advances in whole seconds.
+        self._clock: float = 0.0
+
+        self.pipeline = ClusterPipeline(DEFAULT_ALERT_RULES)
+        self._next_worker = 1
+
+        node_count = _clamp(node_count, MIN_SYNTHETIC_NODES, MAX_SYNTHETIC_NODES)
+        masters = _clamp(node_count // NODES_PER_MASTER, 1, MAX_MASTERS)
+        for serial in range(1, masters + 1):
+            self._add_node(f"master-{serial}", "master")
+        for _ in range(node_count - masters):
+            self._add_worker()
+
+    # -----------------------------------------------------------------------
+    # Node lifecycle
+    # -----------------------------------------------------------------------
+
+    def _add_node(self, name: str, role: str) -> None:
+        """Append one node with randomized initial metrics."""
+        rng = self._rng
+        capacity = ROLE_CAPACITY[role]
+        weights = MASTER_READY_WEIGHTS if role == "master" else WORKER_READY_WEIGHTS
+
+        table = self.pipeline.table
+        index = table.append(
+            name,
+            role,
+            "Ready" if rng.random() < weights[0] else "NotReady",
+            cpu=rng.randint(MIN_UTILIZATION, MAX_UTILIZATION),
+            memory=rng.randint(MIN_UTILIZATION, MAX_UTILIZATION),
+            disk=rng.randint(MIN_UTILIZATION, MAX_UTILIZATION),
+            pods=rng.randint(MIN_PODS, capacity["pods_capacity"] // 2),
+            latency_ms=rng.randint(MIN_LATENCY_MS, MAX_LATENCY_MS),
+            uptime=MIN_UPTIME_SEC,
+            cpu_cores=capacity["cpu_cores"],
+            mem_gb=capacity["mem_gb"],
+            disk_gb=capacity["disk_gb"],
+            pods_capacity=capacity["pods_capacity"],
+        )
+        if table.ready[index]:
+            table.start_uptime(index)
+
+    def _add_worker(self) -> None:
+        """Append one new worker with the next free serial number."""
+        self._add_node(f"worker-{self._next_worker}", "worker")
+        self._next_worker += 1
+
+    def _draw_count(self, rate: float) -> int:
+        """Realize an expected per-tick event *rate* as an integer count."""
+        whole = int(rate)
+        return whole + (1 if self._rng.random() < rate - whole else 0)
+
+    # -----------------------------------------------------------------------
+    # Tick
+    # -----------------------------------------------------------------------
+
+    def tick(self) -> None:
+        """Advance the cluster by one tick, mutating the node table in place."""
+        rng = self._rng
+        table = self.pipeline.table
+
+        for _ in range(self._draw_count(self.leave_rate)):
+            if len(table) <= MIN_SYNTHETIC_NODES:
+                break
+            index = rng.randrange(len(table))
+            if table.roles[index] == "worker":
+                table.remove(index)
+
+        for _ in range(self._draw_count(self.join_rate)):
+            if len(table) >= MAX_SYNTHETIC_NODES:
+                break
+            self._add_worker()
+
+        node_count = len(table)
+        moved_count = min(node_count, round(node_count * self.change_fraction))
+        moved = rng.sample(range(node_count), moved_count)
+        columns = {column: table.column(column) for column in WALK_STEPS}
+        pods_capacity = table.column("pods_capacity")
+
+        for index in moved:
+            values = {}
+            for column, step in WALK_STEPS.items():
+                values[column] = columns[column][index] + rng.randint(-step, step)
+
+            values["cpu"] = _clamp(values["cpu"], 0, 100)
+            values["memory"] = _clamp(values["memory"], MIN_UTILIZATION, 100)
+            values["disk"] = _clamp(values["disk"], MIN_UTILIZATION, 100)
+            values["pods"] = _clamp(values["pods"], 0, pods_capacity[index])
+            values["latency_ms"] = _clamp(
+                values["latency_ms"], MIN_LATENCY_MS, MAX_SYNTHETIC_LATENCY_MS
+            )
+            table.update(index, **values)
+
+        # Ready rows advance with the table clock (see NodeTable.start_uptime),
+        # so no per-node work is needed here.
+        self._clock += self.tick_interval
+        table.clock = int(self._clock)
+
+        for _ in range(self._draw_count(self.flap_rate)):
+            index = rng.randrange(node_count)
+            if table.ready[index]:
+                table.update(index, status="NotReady")
+                table.stop_uptime(index)
+            else:
+                table.update(index, status="Ready")
+                table.start_uptime(index, 0)
+
+    def get_cluster_state(self) -> dict:
+        """Advance one tick and return the resulting cluster state."""
+        self.tick()
+        return self.pipeline.publish()
@@ -0,0 +1,283 @@
+"""
+data/timeseries.py
+==================
+Fixed-size ring-buffer metric history for cluster and node trends.
+
+All storage is preallocated ``array.array`` memory sized at construction
+time, so memory use stays flat no matter how long the dashboard runs.
+Appends are constant time per series and never allocate per-sample objects.
+
+This module provides:
+    - ``RingBuffer``    — one scalar series (e.g. cluster average CPU)
+    - ``NodeHistory``   — one ring of whole-column samples per metric, so a
+      tick for every node is a single slice copy
+    - ``MetricHistory`` — cluster + node history behind one lock, written
+      by the data-provider thread
+    - ``HistoryView``   — read-only view of a ``MetricHistory`` at one tick,
+      published in snapshots for UI readers
+
+Notes:
+    - Node history is indexed by table row. When rows are added or removed,
+      surviving nodes keep their history (matched by name) and only new
+      nodes start empty.
+    - Views share the node storage with the live history; the next record
+      after a view was taken copies the storage first (copy on write), so a
+      published view never changes.
+"""
+
+import threading
+from array import array
+
+from data.node_table import NodeTable
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Default number of samples kept per series.
+DEFAULT_HISTORY_DEPTH: int = 120
+
+#: Node-table columns recorded per node by default.
+DEFAULT_NODE_COLUMNS: tuple[str, ...] = ("cpu", "memory")
+
+#: Cluster summary keys recorded by default, mapped to their series name.
+DEFAULT_CLUSTER_SERIES: dict[str, str] = {
+    "cpu": "avg_cpu",
+    "memory": "avg_memory",
+}
+
+
+# ---------------------------------------------------------------------------
+# Ring buffers
+# ---------------------------------------------------------------------------
+
+
+class RingBuffer:
+    """Preallocated circular buffer of numeric samples."""
+
+    __slots__ = ("_data", "_capacity", "_head", "_count")
+
+    def __init__(self, capacity: int, typecode: str = "f") -> None:
+        """Allocate a buffer holding up to *capacity* samples.
+
+        Args:
+            capacity: Maximum number of retained samples.
+            typecode: ``array`` type code used for storage.
+        """
+        self._capacity = max(1, capacity)
+        self._data = array(typecode, [0]) * self._capacity
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, value) -> None:
+        """Append one sample, overwriting the oldest one when full."""
+        self._data[self._head] = value
+        self._head = (self._head + 1) % self._capacity
+        if self._count < self._capacity:
+            self._count += 1
+
+    def window(self, size: int | None = None) -> list:
+        """Return up to *size* most recent samples, oldest first."""
+        count = self._count if size is None else max(0, min(size, self._count))
+        start = (self._head - count) % self._capacity
+        end = start + count
+        if end <= self._capacity:
+            return self._data[start:end].tolist()
+        return self._data[start:].tolist() + self._data[: end - self._capacity].tolist()
+
+    def copy(self) -> "RingBuffer":
+        """Return an independent copy of the buffer."""
+        clone = RingBuffer.__new__(RingBuffer)
+        clone._data = self._data[:]
+        clone._capacity = self._capacity
+        clone._head = self._head
+        clone._count = self._count
+        return clone
+
+
+class NodeHistory:
+    """Per-node history stored as one ring per node, packed per metric.
+
+    Each metric uses a single flat ``array`` of ``node_count * depth``
+    entries, node-major: row ``i`` owns ``[i * depth, (i + 1) * depth)``.
+    Recording a tick writes the table column into one ring slot with a
+    strided slice assignment; reading a node's series is a contiguous slice.
+
+    All rows share one ring position. Each row remembers the tick it was
+    first recorded in, so a node that joined later only exposes its own
+    samples.
+    """
+
+    def __init__(self, depth: int, columns: tuple[str, ...] = DEFAULT_NODE_COLUMNS) -> None:
+        self.depth = max(1, depth)
+        self.columns = columns
+        self._node_count = 0
+        self._structure_version = -1
+        self._data: dict[str, array] = {}
+        self._index: dict[str, int] = {}
+        self._first_tick = array("q")
+        self._head = 0
+        self._ticks = 0
+        #: ``True`` while a :meth:`frozen` view shares :attr:`_data`.
+        self._shared = False
+
+    def _restructure(self, table: NodeTable) -> None:
+        """Reallocate storage for the current table shape.
+
+        Rings of nodes that are still present move to their new rows by
+        name; rows of new nodes start empty. Runs of consecutive surviving
+        rows are copied with one slice each, so ordinary joins and leaves
+        cost a handful of block copies.
+        """
+        depth = self.depth
+        node_count = len(table)
+        data = {
+            column: array(table.column(column).typecode, [0]) * (depth * node_count)
+            for column in self.columns
+        }
+        first_tick = array("q", [self._ticks]) * node_count
+
+        # (new row, old row, length) runs of rows that moved together.
+        runs: list[list[int]] = []
+        old_index = self._index
+        for new_row, name in enumerate(table.names):
+            old_row = old_index.get(name)
+            if old_row is None:
+                continue
+            if (
+                runs
+                and runs[-1][0] + runs[-1][2] == new_row
+                and runs[-1][1] + runs[-1][2] == old_row
+            ):
+                runs[-1][2] += 1
+            else:
+                runs.append([new_row, old_row, 1])
+
+        for new_row, old_row, length in runs:
+            first_tick[new_row : new_row + length] = self._first_tick[old_row : old_row + length]
+            for column, new_data in data.items():
+                old_data = self._data.get(column)
+                if old_data is not None:
+                    new_data[new_row * depth : (new_row + length) * depth] = old_data[
+                        old_row * depth : (old_row + length) * depth
+                    ]
+
+        self._node_count = node_count
+        self._structure_version = table.structure_version
+        self._data = data
+        self._index = {name: index for index, name in enumerate(table.names)}
+        self._first_tick = first_tick
+        self._shared = False
+
+    def record(self, table: NodeTable) -> None:
+        """Append one sample for every node in *table*."""
+        if table.structure_version != self._structure_version or len(table) != self._node_count:
+            self._restructure(table)
+        elif self._shared:
+            self._data = {column: data[:] for column, data in self._data.items()}
+            self._shared = False
+
+        for column in self.columns:
+            self._data[column][self._head :: self.depth] = table.column(column)
+
+        self._head = (self._head + 1) % self.depth
+        self._ticks += 1
+
+    def window(self, name: str, column: str, size: int | None = None) -> list:
+        """Return up to *size* recent samples of *column* for node *name*."""
+        index = self._index.get(name)
+        if index is None or column not in self._data:
+            return []
+
+        depth = self.depth
+        base = index * depth
+        samples = self._data[column]
+        available = min(depth, self._ticks - self._first_tick[index])
+        count = available if size is None else max(0, min(size, available))
+        start = (self._head - count) % depth
+        end = start + count
+        if end <= depth:
+            return samples[base + start : base + end].tolist()
+        return samples[base + start : base + depth].tolist() + samples[
+            base : base + end - depth
+        ].tolist()
+
+    def frozen(self) -> "NodeHistory":
+        """Return a view of the current samples that later records leave untouched."""
+        view = NodeHistory.__new__(NodeHistory)
+        view.__dict__.update(self.__dict__)
+        self._shared = True
+        return view
+
+
+class MetricHistory:
+    """Thread-safe cluster and node metric history for trend rendering."""
+
+    def __init__(
+        self,
+        depth: int = DEFAULT_HISTORY_DEPTH,
+        *,
+        node_columns: tuple[str, ...] = DEFAULT_NODE_COLUMNS,
+        cluster_series: dict[str, str] = DEFAULT_CLUSTER_SERIES,
+    ) -> None:
+        """Allocate history storage.
+
+        Args:
+            depth: Number of samples retained per series.
+            node_columns: Node-table columns recorded per node.
+            cluster_series: Mapping of series name to summary key.
+        """
+        self._lock = threading.Lock()
+        self._cluster_series = dict(cluster_series)
+        self._cluster = {name: RingBuffer(depth) for name in self._cluster_series}
+        self._nodes = NodeHistory(depth, node_columns)
+
+    def record(self, summary: dict, table: NodeTable | None = None) -> None:
+        """Append one tick of cluster (and optionally node) samples."""
+        with self._lock:
+            for name, key in self._cluster_series.items():
+                self._cluster[name].append(summary.get(key, 0))
+            if table is not None:
+                self._nodes.record(table)
+
+    def cluster_window(self, series: str, size: int | None = None) -> list:
+        """Return recent samples of a cluster *series*, oldest first."""
+        with self._lock:
+            return self._cluster[series].window(size)
+
+    def node_window(self, name: str, column: str, size: int | None = None) -> list:
+        """Return recent samples of *column* for node *name*, oldest first."""
+        with self._lock:
+            return self._nodes.window(name, column, size)
+
+    def view(self) -> "HistoryView":
+        """Return a read-only view of the history as of now, for snapshots."""
+        with self._lock:
+            return HistoryView(
+                {name: ring.copy() for name, ring in self._cluster.items()},
+                self._nodes.frozen(),
+            )
+
+
+class HistoryView:
+    """Read-only :class:`MetricHistory` contents at one tick.
+
+    Offers the same read methods as :class:`MetricHistory` and never
+    changes after it was created, so it can be published in snapshots.
+    """
+
+    def __init__(self, cluster: dict[str, RingBuffer], nodes: NodeHistory) -> None:
+        self._cluster = cluster
+        self._nodes = nodes
+
+    def cluster_window(self, series: str, size: int | None = None) -> list:
+        """Return recent samples of a cluster *series*, oldest first."""
+        return self._cluster[series].window(size)
+
+    def node_window(self, name: str, column: str, size: int | None = None) -> list:
+        """Return recent samples of *column* for node *name*, oldest first."""
+        return self._nodes.window(name, column, size)
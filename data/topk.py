@@ -0,0 +1,235 @@
+"""
+data/topk.py
+============
+Incremental top-K selection over node-table columns.
+
+The :class:`LazyMaxHeap` keeps ``(value, index)`` entries for one column
+and is updated by pushing changed rows instead of re-sorting. Reading the
+top K rows costs O(K log n) plus the stale entries discarded on the way.
+
+:class:`NodeRanker` maintains one heap per node sort mode (CPU, memory,
+disk, latency and NotReady-first) and publishes the top
+:data:`RANKING_DEPTH` row indices per mode with every snapshot. Views that
+need ranks beyond the published depth fall back to a full sort with
+:func:`rank_indices`.
+
+Ordering: higher values first; ties resolve to the lowest row index, so a
+ranking is stable for equal values and matches ``max()`` over rows.
+"""
+
+import heapq
+from array import array
+from typing import Iterable, Sequence
+
+from data.node_table import NodeTable
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Heap size (as a multiple of the row count) that triggers compaction.
+HEAP_COMPACT_FACTOR: int = 4
+
+#: Ranked sort modes and the node-table column each one orders by. The
+#: ``notready`` mode orders by a derived NotReady flag instead.
+RANKED_COLUMNS: dict[str, str] = {
+    "cpu": "cpu",
+    "memory": "memory",
+    "disk": "disk",
+    "latency": "latency_ms",
+}
+
+#: Sort mode putting NotReady nodes first (then provider order).
+NOTREADY_MODE: str = "notready"
+
+#: All sort modes maintained by :class:`NodeRanker`.
+RANKED_MODES: tuple[str, ...] = (*RANKED_COLUMNS, NOTREADY_MODE)
+
+#: Number of top row indices published per sort mode.
+RANKING_DEPTH: int = 64
+
+
+# ---------------------------------------------------------------------------
+# Lazy max-heap
+# ---------------------------------------------------------------------------
+
+
+class LazyMaxHeap:
+    """Max-heap of ``(value, index)`` pairs with lazy invalidation.
+
+    Updates push a new entry instead of editing the old one; entries whose
+    value no longer matches the tracked column are discarded when they reach
+    the top. A row whose value did not change since its last push is not
+    pushed again, so rows changed in other columns leave the heap alone.
+    Ties resolve to the lowest index, matching ``max()`` over rows.
+    """
+
+    def __init__(self, values: array) -> None:
+        self._values = values
+        self._heap: list[tuple[int, int]] = []
+        #: Value of each row as of its latest heap entry.
+        self._pushed: array = array(values.typecode)
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Rebuild the heap from the tracked column (O(n))."""
+        self._heap = [(-value, index) for index, value in enumerate(self._values)]
+        heapq.heapify(self._heap)
+        self._pushed = self._values[:]
+
+    def push(self, index: int) -> None:
+        """Record the current value of row *index* if it changed."""
+        value = self._values[index]
+        if value == self._pushed[index]:
+            return
+        self._pushed[index] = value
+        heapq.heappush(self._heap, (-value, index))
+        if len(self._heap) > HEAP_COMPACT_FACTOR * len(self._values) + 16:
+            self.rebuild()
+
+    def top(self) -> int:
+        """Return the index of the current maximum, or ``-1`` if empty."""
+        heap = self._heap
+        values = self._values
+        while heap:
+            negated, index = heap[0]
+            if index < len(values) and values[index] == -negated:
+                return index
+            heapq.heappop(heap)
+        return -1
+
+    def top_k(self, k: int) -> list[int]:
+        """Return the indices of the *k* largest values, largest first.
+
+        Valid entries are popped and pushed back afterwards; stale and
+        duplicate entries met on the way are dropped for good.
+        """
+        heap = self._heap
+        values = self._values
+        count = len(values)
+        taken: list[tuple[int, int]] = []
+        seen: set[int] = set()
+
+        while heap and len(taken) < k:
+            entry = heapq.heappop(heap)
+            negated, index = entry
+            if index < count and values[index] == -negated and index not in seen:
+                seen.add(index)
+                taken.append(entry)
+
+        for entry in taken:
+            heapq.heappush(heap, entry)
+        return [index for _negated, index in taken]
+
+
+# ---------------------------------------------------------------------------
+# Node ranker
+# ---------------------------------------------------------------------------
+
+
+def _notready_flags(table: NodeTable) -> array:
+    """Return a ``1`` (NotReady) / ``0`` (Ready) flag per row."""
+    return array("B", [0 if ready else 1 for ready in table.ready])
+
+
+def rank_indices(nodes: NodeTable, mode: str) -> list[int]:
+    """Return every row index of *nodes* ordered by sort *mode* (full sort).
+
+    This is the fallback for ranks beyond the published
+    :data:`RANKING_DEPTH`; the order matches :class:`NodeRanker`.
+    """
+    if mode == NOTREADY_MODE:
+        values = _notready_flags(nodes)
+    else:
+        values = nodes.column(RANKED_COLUMNS[mode])
+    return sorted(range(len(values)), key=lambda index: (-values[index], index))
+
+
+def select_ranked(
+    nodes: NodeTable,
+    rankings: dict[str, list[int]] | None,
+    mode: str,
+    start: int,
+    stop: int,
+) -> Sequence[int]:
+    """Return the row indices at ranks ``start..stop-1`` under sort *mode*.
+
+    Args:
+        nodes: The snapshot's node table.
+        rankings: The snapshot's published top indices per mode, if any.
+        mode: A mode from :data:`RANKED_MODES`.
+        start: First rank (0-based).
+        stop: Rank after the last one; clamped to the node count.
+
+    Returns:
+        Row indices of *nodes*, best-ranked first.
+    """
+    stop = min(stop, len(nodes))
+    ranking = rankings.get(mode) if rankings else None
+    if ranking is None or len(ranking) < stop:
+        ranking = rank_indices(nodes, mode)
+    return ranking[start:stop]
+
+
+class NodeRanker:
+    """Per-sort-mode top-K rankings maintained from node-table deltas.
+
+    Typical usage::
+
+        changed = table.take_changes()
+        ranker.apply(table, changed)
+        rankings = ranker.rankings()
+    """
+
+    def __init__(self, depth: int = RANKING_DEPTH) -> None:
+        """Create an empty ranker.
+
+        Args:
+            depth: Number of top row indices returned per mode.
+        """
+        self.depth = depth
+        self._table: NodeTable | None = None
+        self._structure_version: int = -1
+        self._notready: array = array("B")
+        self._heaps: dict[str, LazyMaxHeap] = {}
+
+    def rebuild(self, table: NodeTable) -> None:
+        """Rebuild every heap from *table* (O(n) per mode)."""
+        self._table = table
+        self._structure_version = table.structure_version
+        self._notready = _notready_flags(table)
+
+        # Heaps track the live table columns, which are updated in place.
+        self._heaps = {
+            mode: LazyMaxHeap(table.column(column)) for mode, column in RANKED_COLUMNS.items()
+        }
+        self._heaps[NOTREADY_MODE] = LazyMaxHeap(self._notready)
+
+    def apply(self, table: NodeTable, changed: Iterable[int] | None) -> None:
+        """Fold changed rows of *table* into the heaps.
+
+        Args:
+            table: The node table the changes were made to.
+            changed: Indices of rows whose fields changed, or ``None`` to
+                request a full rebuild (e.g. after rows were added or removed).
+        """
+        if (
+            changed is None
+            or table is not self._table
+            or table.structure_version != self._structure_version
+        ):
+            self.rebuild(table)
+            return
+
+        ready = table.ready
+        notready = self._notready
+        heaps = self._heaps.values()
+        for index in changed:
+            notready[index] = 0 if ready[index] else 1
+            for heap in heaps:
+                heap.push(index)
+
+    def rankings(self) -> dict[str, list[int]]:
+        """Return the top :attr:`depth` row indices for every sort mode."""
+        return {mode: heap.top_k(self.depth) for mode, heap in self._heaps.items()}
@@ -0,0 +1,99 @@
+"""
+frame_timing.py
+===============
+Per-stage frame timing for the dashboard render loop.
+
+This module keeps a rolling window of durations for each named stage of a
+frame (data fetch, page build, shell builds, terminal write). Recording a
+sample is one ring-buffer append, so instrumentation stays cheap when the
+on-screen overlay is hidden; percentiles are only computed when the overlay
+asks for them.
+
+Design goals:
+    - near-zero cost per recorded sample
+    - fixed memory regardless of uptime
+    - no coupling to Rich or to dashboard state
+"""
+
+import time
+from typing import Any, Callable
+
+from data.timeseries import RingBuffer
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Frame stages, in the order they are displayed.
+STAGES: tuple[str, ...] = ("fetch", "page", "sidebar", "header", "footer", "write")
+
+#: Number of samples kept per stage.
+DEFAULT_TIMING_WINDOW: int = 240
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+# ---------------------------------------------------------------------------
+# Stage timer
+# ---------------------------------------------------------------------------
+
+
+class StageTimer:
+    """Rolling per-stage duration histograms."""
+
+    def __init__(
+        self,
+        stages: tuple[str, ...] = STAGES,
+        window: int = DEFAULT_TIMING_WINDOW,
+    ) -> None:
+        """Initialize one ring buffer per stage.
+
+        Args:
+            stages: Names of the tracked stages.
+            window: Number of samples retained per stage.
+        """
+        self.stages = stages
+        self._samples: dict[str, RingBuffer] = {
+            stage: RingBuffer(window, typecode="d") for stage in stages
+        }
+        self._last: dict[str, float] = {stage: 0.0 for stage in stages}
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Record one duration sample for *stage*."""
+        self._samples[stage].append(seconds)
+        self._last[stage] = seconds
+
+    def measure(self, stage: str, func: Callable[..., Any], *args: Any) -> Any:
+        """Call ``func(*args)``, record its duration under *stage*, return its result."""
+        started = time.perf_counter()
+        result = func(*args)
+        self.record(stage, time.perf_counter() - started)
+        return result
+
+    def summary(self) -> dict[str, tuple[float, float, float]]:
+        """Return ``{stage: (last, p50, p99)}`` in seconds.
+
+        This sorts each window and is meant to be called only when the
+        timings are actually displayed.
+        """
+        result = {}
+        for stage in self.stages:
+            ordered = sorted(self._samples[stage].window())
+            result[stage] = (
+                self._last[stage],
+                _percentile(ordered, 0.50),
+                _percentile(ordered, 0.99),
+            )
+        return result
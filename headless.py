@@ -0,0 +1,197 @@
+"""
+headless.py
+===========
+Headless render mode for the TUI dashboard.
+
+This module renders the regular dashboard layout without a TTY: it runs the
+same ``build() → initialize()`` lifecycle as the interactive dashboard, but
+prints each frame into one off-screen recording ``Console`` and exports it
+to a file instead of drawing it with ``Live``.
+
+Supported export formats:
+    - ``text``: plain text without styles
+    - ``ansi``: text with ANSI escape sequences
+    - ``svg``:  standalone SVG image
+    - ``html``: standalone HTML page
+
+Typical usage::
+
+    from headless import run_headless
+    run_headless(frames=5, interval=2.0, export_format="svg", output_dir="out")
+"""
+
+import io
+import os
+import time
+
+from rich.console import Console
+
+from dashboard import DEFAULT_VIEW, UPDATE_INTERVAL, build, initialize, shutdown, update_frame
+from startup_timing import StartupTimer
+from ui.pages import view_sources
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: File extension per supported export format.
+EXPORT_FORMATS: dict[str, str] = {
+    "text": "txt",
+    "ansi": "ans",
+    "svg": "svg",
+    "html": "html",
+}
+
+#: Default off-screen console size, as ``(width, height)``.
+DEFAULT_HEADLESS_SIZE: tuple[int, int] = (120, 40)
+
+#: Title shown in the window chrome of SVG exports.
+SVG_TITLE: str = "TUI Monitor"
+
+#: Maximum time (in seconds) to wait for the view's first snapshots before
+#: exporting the first frame.
+FIRST_SNAPSHOT_TIMEOUT: float = 10.0
+
+#: Polling step (in seconds) while waiting for the first snapshots.
+_READY_POLL_INTERVAL: float = 0.05
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _create_console(size: tuple[int, int]) -> Console:
+    """Create the single recording console reused for every frame."""
+    width, height = size
+    return Console(
+        file=io.StringIO(),
+        width=width,
+        height=height,
+        record=True,
+        force_terminal=True,
+        color_system="truecolor",
+    )
+
+
+def _export(console: Console, export_format: str) -> str:
+    """Export and clear the console's record buffer in *export_format*."""
+    if export_format == "text":
+        return console.export_text(clear=True)
+    if export_format == "ansi":
+        return console.export_text(clear=True, styles=True)
+    if export_format == "svg":
+        return console.export_svg(title=SVG_TITLE, clear=True)
+    return console.export_html(clear=True)
+
+
+def _wait_for_sources(ctx: dict, timeout: float) -> None:
+    """Wait until the active view's data sources have published data."""
+    names = view_sources(ctx["current_view"])
+    deadline = time.monotonic() + timeout
+    while not ctx["sources"].ready(names) and time.monotonic() < deadline:
+        time.sleep(_READY_POLL_INTERVAL)
+
+
+def render_frame(console: Console, layout, export_format: str) -> str:
+    """Render *layout* into *console* and return the exported frame.
+
+    Args:
+        console: Recording console created by :func:`_create_console`.
+        layout: The dashboard ``Layout`` to render.
+        export_format: One of :data:`EXPORT_FORMATS`.
+
+    Returns:
+        The exported frame contents.
+    """
+    # The terminal stream is only a sink; the record buffer holds the frame.
+    console.file.seek(0)
+    console.file.truncate()
+    console.print(layout)
+    return _export(console, export_format)
+
+
+# ---------------------------------------------------------------------------
+# Headless lifecycle
+# ---------------------------------------------------------------------------
+
+
+def run_headless(
+    *,
+    frames: int = 1,
+    interval: float = UPDATE_INTERVAL,
+    size: tuple[int, int] = DEFAULT_HEADLESS_SIZE,
+    export_format: str = "text",
+    output_dir: str = ".",
+    view: str | None = None,
+    prefix: str = "frame",
+    startup: StartupTimer | None = None,
+) -> list[str]:
+    """Render *frames* dashboard frames to files, one every *interval* seconds.
+
+    Args:
+        frames: Number of frames to export.
+        interval: Delay between two frames, in seconds. The background
+            fetchers poll at the same interval.
+        size: Off-screen console size as ``(width, height)``.
+        export_format: One of :data:`EXPORT_FORMATS`.
+        output_dir: Directory receiving the frame files; created if missing.
+        view: View identifier to render; defaults to the dashboard's
+            default view.
+        prefix: File-name prefix; files are named ``<prefix>-0000.<ext>``.
+        startup: Optional startup timer receiving the ``build``,
+            ``initialize`` and ``first_paint`` stages; the first paint is
+            the export of the first frame.
+
+    Returns:
+        The paths of the written frame files, in order.
+
+    Raises:
+        ValueError: If *export_format* is not supported.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"unsupported export format: {export_format!r}")
+
+    os.makedirs(output_dir, exist_ok=True)
+    extension = EXPORT_FORMATS[export_format]
+    console = _create_console(size)
+
+    layout = build()
+    if startup is not None:
+        startup.mark("build")
+
+    ctx = initialize(layout, view or DEFAULT_VIEW)
+    ctx["sources"].set_interval(interval)
+
+    paths: list[str] = []
+    try:
+        # Unlike the interactive loop, the first exported frame should show
+        # data rather than a "waiting" placeholder.
+        _wait_for_sources(ctx, FIRST_SNAPSHOT_TIMEOUT)
+        update_frame(layout, ctx)
+        if startup is not None:
+            startup.mark("initialize")
+
+        next_frame_at = time.monotonic()
+        for index in range(frames):
+            if index:
+                time.sleep(max(0.0, next_frame_at - time.monotonic()))
+                update_frame(layout, ctx)
+
+            next_frame_at = time.monotonic() + interval
+            content = ctx["timings"].measure(
+                "write", render_frame, console, layout, export_format
+            )
+
+            path = os.path.join(output_dir, f"{prefix}-{index:04d}.{extension}")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(content)
+            paths.append(path)
+
+            if startup is not None and index == 0:
+                startup.mark("first_paint")
+    finally:
+        shutdown(ctx)
+
+    return paths
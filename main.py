@@ -1,5 +1,85 @@
-from dashboard import run_dashboard
+import argparse
+import sys
+
+# The startup clock starts before the dashboard modules are imported, so
+# the report includes their import time.
+from startup_timing import StartupTimer
+
+STARTUP = StartupTimer()
+
+from dashboard import MENU_ITEMS, UPDATE_INTERVAL, run_dashboard  # noqa: E402
+from headless import DEFAULT_HEADLESS_SIZE, EXPORT_FORMATS, run_headless  # noqa: E402
+
+STARTUP.mark("import")
+
+
+def _parse_size(value: str) -> tuple[int, int]:
+    """Parse ``"120x40"`` into ``(120, 40)``."""
+    try:
+        width, height = value.lower().split("x")
+        return int(width), int(height)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size {value!r}, expected WIDTHxHEIGHT")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="TUI cluster-monitoring dashboard.")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="render frames to files instead of the terminal",
+    )
+    parser.add_argument("--frames", type=int, default=1, help="headless: number of frames")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=UPDATE_INTERVAL,
+        help="headless: seconds between frames",
+    )
+    parser.add_argument(
+        "--size",
+        type=_parse_size,
+        default=DEFAULT_HEADLESS_SIZE,
+        help="headless: console size, e.g. 120x40",
+    )
+    parser.add_argument(
+        "--format",
+        dest="export_format",
+        choices=tuple(EXPORT_FORMATS),
+        default="text",
+        help="headless: export format",
+    )
+    parser.add_argument("--output-dir", default=".", help="headless: directory for frame files")
+    parser.add_argument(
+        "--view",
+        choices=tuple(view_id for _key, view_id, _label in MENU_ITEMS),
+        help="headless: view to render",
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="print startup timing (import, build, initialize, first paint) on exit",
+    )
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
-    run_dashboard()
+    args = parse_args()
+
+    if args.headless:
+        for path in run_headless(
+            frames=max(1, args.frames),
+            interval=args.interval,
+            size=args.size,
+            export_format=args.export_format,
+            output_dir=args.output_dir,
+            view=args.view,
+            startup=STARTUP,
+        ):
+            print(path)
+    else:
+        run_dashboard(STARTUP)
+
+    if args.startup_report:
+        print(STARTUP.report(), file=sys.stderr)
@@ -0,0 +1,110 @@
+"""
+refresh_scheduler.py
+====================
+Adaptive refresh scheduling for the dashboard render loop.
+
+Each view has its own base refresh interval. While consecutive refreshes
+produce no visible change, the interval backs off geometrically up to a
+ceiling; as soon as something changes again, it snaps back to the view's
+base interval. Idle dashboards therefore wake up rarely, while busy ones
+keep their normal cadence.
+
+Design goals:
+    - per-view base intervals
+    - bounded exponential back-off on identical snapshots
+    - no coupling to Rich, data providers or terminal input
+"""
+
+import time
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Number of consecutive unchanged refreshes before backing off.
+DEFAULT_BACKOFF_AFTER: int = 3
+
+#: Multiplier applied to the interval on every further unchanged refresh.
+DEFAULT_BACKOFF_FACTOR: float = 2.0
+
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+
+class RefreshScheduler:
+    """Compute refresh deadlines per view with adaptive back-off."""
+
+    def __init__(
+        self,
+        intervals: dict[str, float],
+        *,
+        default_interval: float,
+        max_interval: float,
+        backoff_after: int = DEFAULT_BACKOFF_AFTER,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            intervals: Base refresh interval per view identifier, in seconds.
+            default_interval: Base interval for views not in *intervals*.
+            max_interval: Ceiling for the backed-off interval.
+            backoff_after: Unchanged refreshes tolerated before backing off.
+            backoff_factor: Growth factor per further unchanged refresh.
+        """
+        self._intervals = dict(intervals)
+        self._default_interval = default_interval
+        self.max_interval = max_interval
+        self.backoff_after = backoff_after
+        self.backoff_factor = backoff_factor
+
+        self.view: str | None = None
+        self.interval: float = default_interval
+        self._unchanged: int = 0
+        self._next_at: float = time.monotonic()
+
+    def base_interval(self, view: str) -> float:
+        """Return the configured base interval for *view*."""
+        return self._intervals.get(view, self._default_interval)
+
+    def set_view(self, view: str) -> None:
+        """Switch to *view*, resetting back-off if the view changed."""
+        if view == self.view:
+            return
+        self.view = view
+        self._reset()
+
+    def _reset(self) -> None:
+        """Return to the active view's base interval."""
+        self._unchanged = 0
+        self.interval = self.base_interval(self.view)
+
+    def observe(self, changed: bool) -> None:
+        """Record whether the latest refresh produced a visible change.
+
+        Args:
+            changed: ``True`` if the refresh changed displayed data.
+        """
+        if changed:
+            self._reset()
+            return
+
+        self._unchanged += 1
+        excess = self._unchanged - self.backoff_after
+        if excess > 0:
+            base = self.base_interval(self.view)
+            self.interval = min(self.max_interval, base * self.backoff_factor**excess)
+
+    def schedule(self, now: float | None = None) -> float:
+        """Set and return the next deadline, one interval after *now*."""
+        now = time.monotonic() if now is None else now
+        self._next_at = now + self.interval
+        return self._next_at
+
+    @property
+    def next_at(self) -> float:
+        """Monotonic time of the next scheduled refresh."""
+        return self._next_at
@@ -0,0 +1,86 @@
+"""
+startup_timing.py
+=================
+Startup timing for the dashboard entry points.
+
+This module measures how long the dashboard takes from the start of
+``main.py`` to the first painted frame, split into the startup stages
+(module imports, layout build, initialization, first paint), and compares
+the total against :data:`FIRST_PAINT_BUDGET`.
+
+It only depends on the standard library, so it can be imported before any
+of the dashboard modules whose import time it measures.
+
+Design goals:
+    - one clock read per stage
+    - a fixed, measurable time-to-first-paint target
+    - no coupling to Rich or to dashboard state
+"""
+
+import time
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Startup stages, in the order they are reported.
+STARTUP_STAGES: tuple[str, ...] = ("import", "build", "initialize", "first_paint")
+
+#: Target time (in seconds) from the start of ``main.py`` to the first
+#: painted frame.
+FIRST_PAINT_BUDGET: float = 0.25
+
+
+# ---------------------------------------------------------------------------
+# Startup timer
+# ---------------------------------------------------------------------------
+
+
+class StartupTimer:
+    """Consecutive startup-stage durations measured against a budget."""
+
+    def __init__(self, budget: float = FIRST_PAINT_BUDGET) -> None:
+        """Start the clock; the first stage is measured from here.
+
+        Args:
+            budget: Time-to-first-paint target, in seconds.
+        """
+        self.budget = budget
+        self._started = time.perf_counter()
+        self._last = self._started
+        self._durations: dict[str, float] = {}
+
+    def mark(self, stage: str) -> None:
+        """Record the time since the previous mark as the duration of *stage*."""
+        now = time.perf_counter()
+        self._durations[stage] = now - self._last
+        self._last = now
+
+    @property
+    def durations(self) -> dict[str, float]:
+        """Return ``{stage: seconds}`` for every marked stage."""
+        return dict(self._durations)
+
+    @property
+    def total(self) -> float:
+        """Return the time from the start of the clock to the last mark."""
+        return self._last - self._started
+
+    def within_budget(self) -> bool:
+        """Return ``True`` if the stages marked so far fit :attr:`budget`."""
+        return self.total <= self.budget
+
+    def report(self) -> str:
+        """Return a multi-line, human-readable startup report."""
+        lines = ["startup timing:"]
+        for stage in STARTUP_STAGES:
+            if stage in self._durations:
+                lines.append(f"  {stage:<12}{self._durations[stage] * 1000:8.1f} ms")
+
+        verdict = "ok" if self.within_budget() else "OVER BUDGET"
+        lines.append(
+            f"  {'total':<12}{self.total * 1000:8.1f} ms"
+            f"  (budget {self.budget * 1000:.0f} ms: {verdict})"
+        )
+        return "\n".join(lines)
@@ -3,11 +3,19 @@ terminal_input.py
 =================
 Low-level terminal key reader for non-blocking dashboard input.
 
-This module provides a small context-managed helper for reading single-key
+This module provides a small context-managed helper for reading keyboard
 input from a terminal without blocking the dashboard render loop.
 
+Each wakeup drains every byte currently available on the file descriptor
+with ``os.read`` and decodes it into a batch of key events. Plain characters
+are returned as-is; escape sequences (arrows, Home/End, PageUp/PageDown,
+function keys) are decoded into named keys such as ``"up"`` or
+``"pagedown"``. This lets the render loop apply a whole burst of keys and
+redraw once.
+
 Design goals:
     - non-blocking key reads
+    - one read per burst of input, including multi-byte sequences
     - safe terminal-mode restoration on exit
     - no coupling to dashboard state or page routing
 
@@ -16,21 +24,157 @@ Notes:
     - If stdin is not a TTY, key reading is automatically disabled.
 """
 
+import codecs
+import os
 import select
 import sys
 import termios
 import tty
+from collections import deque
 from typing import TextIO
 
 
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Maximum number of bytes requested per ``os.read`` call.
+READ_CHUNK_SIZE: int = 1024
+
+#: Time (in seconds) to wait for the rest of an incomplete escape sequence
+#: before treating a lone ESC as the Escape key.
+ESCAPE_SEQUENCE_TIMEOUT: float = 0.03
+
+#: Escape character starting every terminal key sequence.
+ESC: str = "\x1b"
+
+#: Named keys for single control characters.
+_CONTROL_KEYS: dict[str, str] = {
+    "\r": "enter",
+    "\n": "enter",
+    "\t": "tab",
+    "\x7f": "backspace",
+}
+
+#: Named keys for ``ESC [ <final>`` and ``ESC O <final>`` sequences.
+_FINAL_KEYS: dict[str, str] = {
+    "A": "up",
+    "B": "down",
+    "C": "right",
+    "D": "left",
+    "H": "home",
+    "F": "end",
+    "Z": "shift+tab",
+    "P": "f1",
+    "Q": "f2",
+    "R": "f3",
+    "S": "f4",
+}
+
+#: Named keys for ``ESC [ <number> ~`` sequences.
+_TILDE_KEYS: dict[str, str] = {
+    "1": "home",
+    "2": "insert",
+    "3": "delete",
+    "4": "end",
+    "5": "pageup",
+    "6": "pagedown",
+    "7": "home",
+    "8": "end",
+    "11": "f1",
+    "12": "f2",
+    "13": "f3",
+    "14": "f4",
+    "15": "f5",
+    "17": "f6",
+    "18": "f7",
+    "19": "f8",
+    "20": "f9",
+    "21": "f10",
+    "23": "f11",
+    "24": "f12",
+}
+
+
+# ---------------------------------------------------------------------------
+# Decoding
+# ---------------------------------------------------------------------------
+
+
+def decode_keys(text: str) -> tuple[list[str], str]:
+    """Decode terminal input text into key events.
+
+    Args:
+        text: Decoded characters read from the terminal.
+
+    Returns:
+        A tuple of ``(events, remainder)`` where ``remainder`` holds a
+        trailing escape sequence that is not complete yet.
+    """
+    events: list[str] = []
+    index = 0
+    length = len(text)
+
+    while index < length:
+        char = text[index]
+
+        if char != ESC:
+            events.append(_CONTROL_KEYS.get(char, char))
+            index += 1
+            continue
+
+        if index + 1 >= length:
+            return events, text[index:]
+
+        kind = text[index + 1]
+
+        if kind == "[":
+            # CSI: parameter/intermediate bytes followed by one final byte.
+            end = index + 2
+            while end < length and not "\x40" <= text[end] <= "\x7e":
+                end += 1
+            if end >= length:
+                return events, text[index:]
+
+            params, final = text[index + 2 : end], text[end]
+            if final == "~":
+                name = _TILDE_KEYS.get(params.split(";")[0])
+            else:
+                name = _FINAL_KEYS.get(final)
+            if name is not None:
+                events.append(name)
+            index = end + 1
+        elif kind == "O":
+            if index + 2 >= length:
+                return events, text[index:]
+            name = _FINAL_KEYS.get(text[index + 2])
+            if name is not None:
+                events.append(name)
+            index += 3
+        elif kind == ESC:
+            events.append("escape")
+            index += 1
+        else:
+            events.append(f"alt+{kind}")
+            index += 2
+
+    return events, ""
+
+
+# ---------------------------------------------------------------------------
+# Key reader
+# ---------------------------------------------------------------------------
+
+
 class TerminalKeyReader:
-    """Context-managed non-blocking single-key terminal reader.
+    """Context-managed non-blocking batched terminal key reader.
 
     The reader temporarily switches the terminal into cbreak mode so key
     presses can be observed without requiring Enter.
 
-    If the provided stream is not a TTY, the reader disables itself and
-    ``read_key()`` always returns ``None``.
+    If the provided stream is not a TTY, the reader disables itself,
+    ``read_keys()`` always returns an empty list and ``read_key()`` always
+    returns ``None``.
     """
 
     def __init__(self, stream: TextIO | None = None) -> None:
@@ -43,6 +187,9 @@ class TerminalKeyReader:
         self._fd: int | None = None
         self._old_attrs: list | None = None
         self._enabled: bool = False
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._pending: str = ""
+        self._queued: deque[str] = deque()
 
     def __enter__(self) -> "TerminalKeyReader":
         """Enter the terminal reader context and enable cbreak mode if possible.
@@ -63,24 +210,70 @@ class TerminalKeyReader:
         if self._enabled and self._fd is not None and self._old_attrs is not None:
             termios.tcsetattr(self._fd, termios.TCSADRAIN, self._old_attrs)
 
-    def read_key(self, timeout: float = 0.0) -> str | None:
-        """Read one key from the terminal if available.
+    def _wait_readable(self, timeout: float) -> bool:
+        """Return ``True`` if the descriptor becomes readable within *timeout*."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        return bool(ready)
 
-        The method waits up to ``timeout`` seconds for input. If no key is
-        available within the timeout window, ``None`` is returned.
+    def _drain(self) -> str:
+        """Read every byte currently available and return the decoded text."""
+        chunks: list[bytes] = []
+        while True:
+            chunk = os.read(self._fd, READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if len(chunk) < READ_CHUNK_SIZE or not self._wait_readable(0.0):
+                break
+        return self._decoder.decode(b"".join(chunks))
+
+    def read_keys(self, timeout: float = 0.0) -> list[str]:
+        """Read all available key events as one batch.
+
+        The method waits up to ``timeout`` seconds for input, then drains the
+        descriptor and decodes everything that arrived. An incomplete escape
+        sequence gets :data:`ESCAPE_SEQUENCE_TIMEOUT` to finish; a lone ESC
+        is then reported as ``"escape"``.
 
         Args:
-            timeout: Maximum time to wait for a key press, in seconds.
+            timeout: Maximum time to wait for the first byte, in seconds.
 
         Returns:
-            A single-character string if input is available, otherwise ``None``.
+            A list of key events, possibly empty. Printable keys are single
+            characters; special keys are names such as ``"up"``.
         """
-        if not self._enabled:
-            return None
+        if self._queued:
+            events = list(self._queued)
+            self._queued.clear()
+            return events
+
+        if not self._enabled or not self._wait_readable(timeout):
+            return []
+
+        events, self._pending = decode_keys(self._pending + self._drain())
 
-        ready, _, _ = select.select([self._stream], [], [], timeout)
-        if not ready:
-            return None
+        if self._pending and self._wait_readable(ESCAPE_SEQUENCE_TIMEOUT):
+            more, self._pending = decode_keys(self._pending + self._drain())
+            events.extend(more)
 
-        key = self._stream.read(1)
-        return key or None
\ No newline at end of file
+        if self._pending:
+            if self._pending == ESC:
+                events.append("escape")
+            self._pending = ""
+
+        return events
+
+    def read_key(self, timeout: float = 0.0) -> str | None:
+        """Read one key event if available.
+
+        Remaining events of the same batch are queued for later calls.
+
+        Args:
+            timeout: Maximum time to wait for a key press, in seconds.
+
+        Returns:
+            One key event if input is available, otherwise ``None``.
+        """
+        if not self._queued:
+            self._queued.extend(self.read_keys(timeout))
+        return self._queued.popleft() if self._queued else None
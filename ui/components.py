@@ -5,41 +5,312 @@ Reusable Rich renderable builders for high-level dashboard sections.
 
 This module currently provides:
     - Cluster summary panel rendering
-    - Alerts placeholder panel rendering
-    - Small sparkline helper for trend visualization
+    - Alerts panel rendering (recent alert history or firing alerts)
+    - Node-grid page position indicator
+    - Sparkline and braille line-chart renderables for trend visualization
+
+The trend renderables map samples to glyphs through lookup tables built at
+import time and emit one styled segment per run of samples in the same
+colour band, so drawing a trend costs one table lookup per sample.
+
+Styles are theme roles resolved through :mod:`ui.theme`.
 
 These builders are intentionally presentation-focused and should not contain
 data-fetching logic. All input data must be prepared upstream by the dashboard
 or data-provider layers.
 """
 
+import time
+from typing import Sequence
+
 from rich.align import Align
-from rich.console import Group
+from rich.console import Console, ConsoleOptions, Group, RenderResult
+from rich.measure import Measurement
 from rich.panel import Panel
+from rich.segment import Segment
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 
+from ui.theme import CRIT_THRESHOLD, WARN_THRESHOLD, get_theme, on_theme_change
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Theme role per Prometheus health value in the cluster summary.
+PROMETHEUS_HEALTH_STYLES: dict[str, str] = {
+    "Healthy": "health.healthy",
+    "Degraded": "health.degraded",
+    "Down": "health.down",
+}
+
+#: Theme role per alert severity in the alerts panel.
+ALERT_SEVERITY_STYLES: dict[str, str] = {
+    "WARN": "severity.warn",
+    "CRIT": "severity.crit",
+}
+
+#: Alert events listed in the alerts panel.
+ALERT_PANEL_ROWS: int = 4
+
+#: Trend colour bands as ``(lower bound, style)`` pairs, highest first; a
+#: sample takes the style of the first band whose bound it reaches. Styles
+#: are theme roles or style strings.
+TREND_BANDS: tuple[tuple[int, str], ...] = (
+    (CRIT_THRESHOLD, "severity.crit"),
+    (WARN_THRESHOLD, "severity.warn"),
+    (0, "severity.ok"),
+)
+
+#: Sparkline glyphs from lowest to highest level.
+SPARK_GLYPHS: str = "▁▂▃▄▅▆▇█"
+
+#: Number of quantization steps of the lookup tables (0..100 inclusive).
+TREND_STEPS: int = 100
+
+#: Width (in cells) of the trend charts in the cluster summary.
+SUMMARY_TREND_WIDTH: int = 15
+
+#: Braille dot bits of the left and right sub-column, top row first.
+_BRAILLE_COLUMN_BITS: tuple[tuple[int, ...], tuple[int, ...]] = (
+    (0x01, 0x02, 0x04, 0x40),
+    (0x08, 0x10, 0x20, 0x80),
+)
+
+#: Every braille pattern, indexed by its dot bits.
+_BRAILLE_CHARS: tuple[str, ...] = tuple(chr(0x2800 + bits) for bits in range(256))
+
+#: Sparkline glyph per quantized step.
+_SPARK_TABLE: tuple[str, ...] = tuple(
+    SPARK_GLYPHS[min(len(SPARK_GLYPHS) - 1, step * len(SPARK_GLYPHS) // (TREND_STEPS + 1))]
+    for step in range(TREND_STEPS + 1)
+)
+
+#: ``_BRAILLE_SPAN_BITS[side][top][bottom]``: dot bits lighting rows
+#: ``top..bottom`` (0 = top) of one braille cell in sub-column *side*.
+_BRAILLE_SPAN_BITS: tuple[tuple[tuple[int, ...], ...], ...] = tuple(
+    tuple(
+        tuple(sum(bits[top : bottom + 1]) for bottom in range(4))
+        for top in range(4)
+    )
+    for bits in _BRAILLE_COLUMN_BITS
+)
+
+
+# ---------------------------------------------------------------------------
+# Trend renderables
+# ---------------------------------------------------------------------------
+
+
+#: ``(band index per step, style per band)`` lookup tables per band set,
+#: resolved against the active theme.
+_BAND_TABLES: dict[tuple, tuple[tuple[int, ...], list[Style]]] = {}
+
+on_theme_change(_BAND_TABLES.clear)
+
+
+def _band_table(bands: tuple[tuple[int, str], ...]) -> tuple[tuple[int, ...], list[Style]]:
+    """Return the (cached) lookup tables of *bands*."""
+    tables = _BAND_TABLES.get(bands)
+    if tables is None:
+        last = len(bands) - 1
+        indices = tuple(
+            next((index for index, (bound, _style) in enumerate(bands) if step >= bound), last)
+            for step in range(TREND_STEPS + 1)
+        )
+        theme = get_theme()
+        tables = (indices, [theme.resolve(style) for _bound, style in bands])
+        _BAND_TABLES[bands] = tables
+    return tables
+
+
+class _Trend:
+    """Sample quantization and measurement shared by the trend renderables."""
+
+    def __init__(
+        self,
+        samples: Sequence[float],
+        *,
+        width: int | None,
+        low: float,
+        high: float,
+        bands: tuple[tuple[int, str], ...],
+    ) -> None:
+        self.samples = samples
+        self.width = width
+        self.low = low
+        self.high = high
+        self._bands = _band_table(bands)
+
+    def _steps(self, count: int) -> list[int]:
+        """Quantize the last *count* samples to ``0..TREND_STEPS``."""
+        samples = self.samples[-count:] if count else []
+        span = self.high - self.low
+        factor = TREND_STEPS / span if span > 0 else 0.0
+        low = self.low
+        return [
+            0 if step < 0 else TREND_STEPS if step > TREND_STEPS else step
+            for step in [int((value - low) * factor + 0.5) for value in samples]
+        ]
+
+    def _cells(self, options: ConsoleOptions) -> int:
+        """Return the number of cells to draw into."""
+        width = options.max_width if self.width is None else self.width
+        return max(0, min(width, options.max_width))
+
+    def __rich_measure__(self, console: Console, options: ConsoleOptions) -> Measurement:
+        """Return the measurement without looking at the samples."""
+        if self.width is None:
+            return Measurement(1, options.max_width)
+        width = min(self.width, options.max_width)
+        return Measurement(width, width)
+
+
+def _runs(glyphs: list[str], band_indices: list[int], styles: list[Style]) -> list[Segment]:
+    """Group *glyphs* into one segment per run of equal colour band."""
+    segments = []
+    start = 0
+    count = len(glyphs)
+    for index in range(1, count + 1):
+        if index == count or band_indices[index] != band_indices[start]:
+            segments.append(Segment("".join(glyphs[start:index]), styles[band_indices[start]]))
+            start = index
+    return segments
+
+
+class Sparkline(_Trend):
+    """One-line sparkline of the most recent samples, one sample per cell.
+
+    Samples are scaled from ``low..high`` onto :data:`SPARK_GLYPHS`. Shorter
+    windows are right-aligned, so the newest sample is always in the last
+    cell.
+    """
+
+    def __init__(
+        self,
+        samples: Sequence[float],
+        *,
+        width: int | None = None,
+        low: float = 0,
+        high: float = 100,
+        bands: tuple[tuple[int, str], ...] = TREND_BANDS,
+    ) -> None:
+        """Create the sparkline.
+
+        Args:
+            samples: Sample window, oldest first.
+            width: Fixed width in cells; ``None`` fills the available width.
+            low: Value drawn as the lowest glyph.
+            high: Value drawn as the highest glyph.
+            bands: Colour bands, see :data:`TREND_BANDS`; bounds are in
+                percent of ``low..high``.
+        """
+        super().__init__(samples, width=width, low=low, high=high, bands=bands)
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        cells = self._cells(options)
+        steps = self._steps(cells)
+        band_table, styles = self._bands
+
+        padding = cells - len(steps)
+        if padding:
+            yield Segment(" " * padding)
+        yield from _runs(
+            [_SPARK_TABLE[step] for step in steps],
+            [band_table[step] for step in steps],
+            styles,
+        )
+        yield Segment.line()
+
+
+class BrailleChart(_Trend):
+    """Braille line chart: two samples per cell, four dot rows per line.
+
+    Consecutive samples are joined by vertical dot runs, so the chart reads
+    as a continuous line. Each cell is coloured by the band of its higher
+    sample. Shorter windows are right-aligned.
+    """
+
+    def __init__(
+        self,
+        samples: Sequence[float],
+        *,
+        width: int | None = None,
+        height: int = 1,
+        low: float = 0,
+        high: float = 100,
+        bands: tuple[tuple[int, str], ...] = TREND_BANDS,
+    ) -> None:
+        """Create the chart.
+
+        Args:
+            samples: Sample window, oldest first.
+            width: Fixed width in cells; ``None`` fills the available width.
+            height: Chart height in lines.
+            low: Value drawn on the bottom dot row.
+            high: Value drawn on the top dot row.
+            bands: Colour bands, see :data:`TREND_BANDS`; bounds are in
+                percent of ``low..high``.
+        """
+        super().__init__(samples, width=width, low=low, high=high, bands=bands)
+        self.height = max(1, height)
+
+    def __rich_console__(self, console: Console, options: ConsoleOptions) -> RenderResult:
+        cells = self._cells(options)
+        steps = self._steps(2 * cells)
+        band_table, styles = self._bands
+        height = self.height
+        dot_rows = 4 * height
+
+        # Dot row per sample, 0 = top of the chart.
+        rows = [(dot_rows - 1) - step * (dot_rows - 1) // TREND_STEPS for step in steps]
+        offset = 2 * cells - len(rows)
+
+        lines = [[0] * cells for _line in range(height)]
+        cell_bands = [len(styles) - 1] * cells
+        previous = rows[0] if rows else 0
+        for sample, row in enumerate(rows):
+            position = offset + sample
+            cell, side = divmod(position, 2)
+            top, bottom = (row, previous) if row <= previous else (previous, row)
+            for line in range(top // 4, bottom // 4 + 1):
+                first = max(top - 4 * line, 0)
+                last = min(bottom - 4 * line, 3)
+                lines[line][cell] |= _BRAILLE_SPAN_BITS[side][first][last]
+            band = band_table[steps[sample]]
+            if band < cell_bands[cell]:
+                cell_bands[cell] = band
+            previous = row
+
+        for line in lines:
+            yield from _runs([_BRAILLE_CHARS[bits] for bits in line], cell_bands, styles)
+            yield Segment.line()
+
 
 # ---------------------------------------------------------------------------
 # Public renderable builders
 # ---------------------------------------------------------------------------
 
 
-def build_cluster_summary(summary: dict) -> Panel:
+def build_cluster_summary(summary: dict, prometheus_health: str = "Unknown") -> Panel:
     """Build the cluster summary panel.
 
     The summary is currently rendered as a two-column layout:
 
     - Left column:
         - Ready node ratio
-        - Prometheus health (currently static/mock)
+        - Prometheus health
     - Right column:
-        - CPU capacity + average usage
-        - Memory capacity + average usage
+        - CPU capacity + average usage + braille trend
+        - Memory capacity + average usage + braille trend
 
     Args:
         summary: Cluster summary dictionary prepared by the data/dashboard
                  layer.
+        prometheus_health: Health reported by the Prometheus provider, or a
+            status word such as ``"Pending"`` / ``"Not configured"``.
 
     Returns:
         A Rich ``Panel`` containing the formatted summary view.
@@ -47,22 +318,19 @@ def build_cluster_summary(summary: dict) -> Panel:
     # ---------------------------------------------------------------------
     # Left block: cluster readiness and service health
     # ---------------------------------------------------------------------
+    theme = get_theme()
     total_nodes = summary["total_nodes"]
     ready_nodes = summary["ready_nodes"]
 
     left_line_1 = Text(
         f"Cluster Ready Nodes: {ready_nodes}/{total_nodes}",
-        style="cyan",
+        style=theme["label"],
     )
 
-    # NOTE:
-    # Prometheus health is currently static and purely demonstrational.
-    # It is not yet sourced from a real service-state provider.
-    prom_health = "Healthy"
-    prom_style = "green" if prom_health == "Healthy" else "yellow"
+    prom_style = theme[PROMETHEUS_HEALTH_STYLES.get(prometheus_health, "muted")]
 
-    left_line_2 = Text("Prometheus: ", style="grey70")
-    left_line_2.append(prom_health, style=prom_style)
+    left_line_2 = Text("Prometheus: ", style=theme["subtle"])
+    left_line_2.append(prometheus_health, style=prom_style)
 
     left_block = Group(left_line_1, left_line_2)
 
@@ -81,15 +349,19 @@ def build_cluster_summary(summary: dict) -> Panel:
 
     right_line_1 = Text(
         f"CPU: {used_cores}/{total_cores} cores | avg {avg_cpu}% ",
-        style="yellow",
+        style=theme["value"],
     )
 
     right_line_2 = Text(
         f"MEM: {used_mem}/{total_mem} GB | avg {avg_mem}% ",
-        style="yellow",
+        style=theme["value"],
     )
 
-    right_block = Group(right_line_1, right_line_2)
+    right_block = Table.grid()
+    right_block.add_column(justify="right")
+    right_block.add_column(width=SUMMARY_TREND_WIDTH)
+    right_block.add_row(right_line_1, BrailleChart(cpu_trend, width=SUMMARY_TREND_WIDTH))
+    right_block.add_row(right_line_2, BrailleChart(mem_trend, width=SUMMARY_TREND_WIDTH))
 
     # ---------------------------------------------------------------------
     # Final layout: two balanced columns inside a single panel
@@ -99,24 +371,105 @@ def build_cluster_summary(summary: dict) -> Panel:
     grid.add_column(ratio=1, justify="center")
     grid.add_row(left_block, right_block)
 
-    return Panel(grid, title="Cluster Summary", border_style="green")
+    return Panel(grid, title="Cluster Summary", border_style=theme["border.summary"])
+
 
+def _alert_row(stamp: float | None, event: str, alert: dict) -> tuple[Text, ...]:
+    """Build one alerts-table row (time, event, severity, node, message)."""
+    theme = get_theme()
+    severity = alert["severity"]
+    severity_style = theme[ALERT_SEVERITY_STYLES.get(severity, "notice")]
+    clock = time.strftime("%H:%M:%S", time.localtime(stamp)) if stamp else ""
+    return (
+        Text(clock, style=theme["muted"]),
+        Text(event.upper(), style=theme["ok"] if event == "resolved" else severity_style),
+        Text(severity, style=severity_style),
+        Text(alert["node"], style=theme["title"]),
+        Text(alert["message"], style=theme["subtle"]),
+    )
 
-def build_alerts_placeholder() -> Panel:
-    """Build a placeholder alerts panel.
 
-    This panel explicitly communicates that alert handling has not yet been
-    implemented, to avoid confusing "no alerts" with "alerts subsystem absent".
+def build_alerts_panel(
+    alerts: list[dict],
+    summary: dict,
+    history: list[dict] | None = None,
+    rows: int = ALERT_PANEL_ROWS,
+) -> Panel:
+    """Build the alerts panel.
+
+    The panel lists the most recent alert events from the alert history
+    store (see :mod:`data.alert_history`), newest first. Without a history
+    store, the currently firing alerts are listed instead.
+
+    Args:
+        alerts: Currently firing alerts of the snapshot.
+        summary: Cluster summary carrying the ``alerts_total`` and
+            ``alerts_crit`` counts.
+        history: Recent alert events, newest first, or ``None`` if no
+            history store is configured.
+        rows: Maximum number of listed events.
 
     Returns:
-        A Rich ``Panel`` containing a centered placeholder message.
+        A Rich ``Panel`` titled with the firing alert counts.
     """
-    message = Text("Alerts panel is not implemented yet", style="yellow")
-    hint = Text("Coming soon", style="grey50")
+    theme = get_theme()
+    title = f"Alerts: {summary['alerts_total']} firing ({summary['alerts_crit']} crit)"
 
-    content = Align.center(
-        Text.assemble(message, "\n", hint),
-        vertical="middle",
-    )
+    if history is None:
+        entries = [_alert_row(alert.get("since"), "firing", alert) for alert in alerts[:rows]]
+        empty_message = "No firing alerts"
+    else:
+        entries = [_alert_row(event["ts"], event["event"], event) for event in history[:rows]]
+        title += " | recent events"
+        empty_message = "No alert events recorded"
+
+    if entries:
+        content = Table.grid(expand=True, padding=(0, 1))
+        content.add_column(no_wrap=True)
+        content.add_column(no_wrap=True, width=8)
+        content.add_column(no_wrap=True, width=4)
+        content.add_column(no_wrap=True)
+        content.add_column(ratio=1, no_wrap=True, overflow="ellipsis")
+        for entry in entries:
+            content.add_row(*entry)
+    else:
+        content = Align.center(Text(empty_message, style=theme["muted"]), vertical="middle")
+
+    border = "border.notice" if alerts else "border.muted"
+    return Panel(content, title=title, border_style=theme[border])
 
-    return Panel(content, title="Alerts", border_style="yellow")
\ No newline at end of file
+
+def build_page_indicator(
+    first: int,
+    last: int,
+    total: int,
+    page: int,
+    pages: int,
+    sort_label: str = "Provider order",
+) -> Text:
+    """Build the one-line position indicator shown above the node grid.
+
+    Args:
+        first: 1-based index of the first visible node (``0`` if none).
+        last: 1-based index of the last visible node.
+        total: Total number of nodes.
+        page: 0-based index of the visible page.
+        pages: Total number of pages.
+        sort_label: Label of the active node sort mode.
+
+    Returns:
+        A right-justified Rich ``Text`` line.
+    """
+    theme = get_theme()
+    if total == 0:
+        return Text("No nodes", style=theme["muted"], justify="right")
+
+    return Text.assemble(
+        (f"Nodes {first}-{last} of {total}", theme["subtle"]),
+        ("  |  ", theme["muted"]),
+        (f"Page {page + 1}/{pages}", theme["label"]),
+        ("  |  Sort: ", theme["muted"]),
+        (sort_label, theme["label"]),
+        ("  |  PgUp/PgDn n/p Home/End s", theme["muted"]),
+        justify="right",
+    )
@@ -4,39 +4,137 @@ ui/node_panel.py
 Renderable builders for cluster node panels.
 
 This module contains:
-    - A custom expandable block bar renderable
+    - A custom expandable block bar renderable with an LRU segment cache
+    - A table-free trend row renderable aligned with the metric rows
     - Node metric row builders
     - Node information row builder
     - Full node panel and empty placeholder panel builders
+    - An LRU panel cache keyed on the values each panel displays
+
+Styles come from the active :mod:`ui.theme`; both caches are cleared when
+the theme changes.
 
 These helpers are presentation-only and should not perform any data fetching.
 All node data must be prepared upstream by the dashboard/data layers.
 """
 
+from collections import OrderedDict
+from typing import Any
+
 from rich.align import Align
 from rich.console import Console, ConsoleOptions, Group, RenderResult
 from rich.measure import Measurement
 from rich.panel import Panel
+from rich.segment import Segment
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 
+from ui.components import Sparkline
+from ui.theme import get_theme, on_theme_change
+
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
-#: Severity threshold for warning state.
-WARN_THRESHOLD: int = 60
-
-#: Severity threshold for critical state.
-CRIT_THRESHOLD: int = 85
-
 #: Minimum internal width of the custom block bar.
 BAR_MIN_WIDTH: int = 6
 
+#: Cells left and right of the bar in a metric row (label and value
+#: columns plus the grid padding between them).
+METRIC_LABEL_CELLS: int = 5
+METRIC_VALUE_CELLS: int = 5
+
 #: Shared spacer line inserted between metric rows.
 ROW_SPACER: Text = Text("")
 
+#: Node fields that determine how a node panel looks.
+PANEL_KEY_FIELDS: tuple[str, ...] = (
+    "name",
+    "role",
+    "status",
+    "cpu",
+    "memory",
+    "disk",
+    "pods",
+    "latency_ms",
+)
+
+#: Default panel-cache capacity (two pages of the largest grid preset).
+DEFAULT_PANEL_CACHE_SIZE: int = 18
+
+#: Default bar-segment cache capacity. Three bars per panel at 101 values
+#: and a handful of widths stay well below this.
+DEFAULT_BAR_CACHE_SIZE: int = 4096
+
+
+# ---------------------------------------------------------------------------
+# Bar segment cache
+# ---------------------------------------------------------------------------
+
+
+class BarSegmentCache:
+    """LRU cache of rendered block-bar segments.
+
+    Keys describe everything a bar looks like (inner width, value, glyphs,
+    styles and brackets), so equal bars share one immutable segment list
+    and a cache hit renders without building any ``Text`` or string.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_BAR_CACHE_SIZE) -> None:
+        self.max_size = max(1, max_size)
+        self._segments: OrderedDict[tuple, tuple[Segment, ...]] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def resize(self, max_size: int) -> None:
+        """Change the capacity, evicting least recently used entries."""
+        self.max_size = max(1, max_size)
+        while len(self._segments) > self.max_size:
+            self._segments.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached segment list."""
+        self._segments.clear()
+
+    def get(self, bar: "BlockBar", inner_width: int) -> tuple[Segment, ...]:
+        """Return the segments of *bar* at *inner_width*, building them on a miss."""
+        key = (
+            inner_width,
+            bar.value,
+            bar.fill,
+            bar.empty,
+            bar.fill_style,
+            bar.empty_style,
+            bar.show_brackets,
+        )
+
+        segments = self._segments.get(key)
+        if segments is not None:
+            self._segments.move_to_end(key)
+            self.hits += 1
+            return segments
+
+        self.misses += 1
+        segments = bar.build_segments(inner_width)
+        self._segments[key] = segments
+        if len(self._segments) > self.max_size:
+            self._segments.popitem(last=False)
+        return segments
+
+
+#: Shared segment cache used by every block bar.
+_BAR_CACHE: BarSegmentCache = BarSegmentCache()
+
+
+def get_bar_cache() -> BarSegmentCache:
+    """Return the shared block-bar segment cache."""
+    return _BAR_CACHE
+
 
 # ---------------------------------------------------------------------------
 # Custom renderables
@@ -47,7 +145,10 @@ class BlockBar:
     """Expandable block bar renderable for percentage-based metrics.
 
     The bar adapts to the available width at render time and uses filled and
-    empty block characters to represent utilization.
+    empty block characters to represent utilization. Styles may be theme
+    roles, style strings or ``Style`` objects; they default to the theme's
+    ``bar.fill`` / ``bar.empty``. Rendered segments come from the shared
+    :class:`BarSegmentCache`.
     """
 
     def __init__(
@@ -57,16 +158,17 @@ class BlockBar:
         fill: str = "█",
         empty: str = "░",
         show_brackets: bool = True,
-        fill_style: str = "white",
-        empty_style: str = "grey50",
+        fill_style: str | Style | None = None,
+        empty_style: str | Style | None = None,
         min_width: int = BAR_MIN_WIDTH,
     ) -> None:
+        theme = get_theme()
         self.value = max(0, min(100, int(value)))
         self.fill = fill
         self.empty = empty
         self.show_brackets = show_brackets
-        self.fill_style = fill_style
-        self.empty_style = empty_style
+        self.fill_style = theme.resolve("bar.fill" if fill_style is None else fill_style)
+        self.empty_style = theme.resolve("bar.empty" if empty_style is None else empty_style)
         self.min_width = min_width
 
     def __rich_measure__(
@@ -78,6 +180,29 @@ class BlockBar:
         min_width = self.min_width + (2 if self.show_brackets else 0)
         return Measurement(min_width, options.max_width)
 
+    def build_segments(self, inner_width: int) -> tuple[Segment, ...]:
+        """Build the segments of this bar at *inner_width* (cache miss path)."""
+        filled = int(round(inner_width * self.value / 100))
+        empty = max(0, inner_width - filled)
+
+        bracket_style = get_theme()["bar.bracket"]
+        segments = []
+
+        if self.show_brackets:
+            segments.append(Segment("[", bracket_style))
+
+        if filled:
+            segments.append(Segment(self.fill * filled, self.fill_style))
+
+        if empty:
+            segments.append(Segment(self.empty * empty, self.empty_style))
+
+        if self.show_brackets:
+            segments.append(Segment("]", bracket_style))
+
+        segments.append(Segment.line())
+        return tuple(segments)
+
     def __rich_console__(
         self,
         console: Console,
@@ -88,24 +213,42 @@ class BlockBar:
         bracket_width = 2 if self.show_brackets else 0
         inner_width = max(1, max_width - bracket_width)
 
-        filled = int(round(inner_width * self.value / 100))
-        empty = max(0, inner_width - filled)
+        yield from _BAR_CACHE.get(self, inner_width)
 
-        bar = Text()
 
-        if self.show_brackets:
-            bar.append("[", style="grey70")
+class TrendRow:
+    """Labelled sparkline laid out like a metric row, without a ``Table``.
 
-        if filled:
-            bar.append(self.fill * filled, style=self.fill_style)
+    The sparkline occupies exactly the bar column of :func:`metric_row`, so
+    trends line up with the bars below them at a fraction of a table's
+    layout cost.
+    """
 
-        if empty:
-            bar.append(self.empty * empty, style=self.empty_style)
+    def __init__(self, label: str, samples, *, label_style: str | Style = "label") -> None:
+        self.label = f"{label:<{METRIC_LABEL_CELLS - 1}} "
+        self.label_style = get_theme().resolve(label_style)
+        self.samples = samples
 
-        if self.show_brackets:
-            bar.append("]", style="grey70")
+    def __rich_measure__(
+        self,
+        console: Console,
+        options: ConsoleOptions,
+    ) -> Measurement:
+        """Return the minimum/maximum width for the renderable."""
+        return Measurement(METRIC_LABEL_CELLS + 1, options.max_width)
 
-        yield bar
+    def __rich_console__(
+        self,
+        console: Console,
+        options: ConsoleOptions,
+    ) -> RenderResult:
+        """Render the label followed by the sparkline."""
+        width = max(0, options.max_width - METRIC_LABEL_CELLS - METRIC_VALUE_CELLS)
+        yield Segment(self.label, self.label_style)
+        yield from console.render(
+            Sparkline(self.samples, width=width),
+            options.update_width(width),
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -115,61 +258,59 @@ class BlockBar:
 
 def format_status(status: str) -> Text:
     """Return a colorized status label for a node."""
-    if status == "Ready":
-        return Text(status, style="green")
-    return Text(status, style="bold red")
-
+    return Text(status, style=get_theme().status(status))
 
-def severity_style(value: int) -> str:
-    """Return the severity style for a utilization percentage."""
-    value = max(0, min(100, int(value)))
 
-    if value >= CRIT_THRESHOLD:
-        return "bold red"
-    if value >= WARN_THRESHOLD:
-        return "yellow"
-    return "green"
+def severity_style(value: int) -> Style:
+    """Return the theme's severity style for a utilization percentage."""
+    return get_theme().severity(value)
 
 
 def metric_row(label: str, value: int) -> Table:
     """Build a single metric row containing label, bar, and percentage."""
+    theme = get_theme()
+    severity = theme.severity(value)
+
     grid = Table.grid(expand=True, padding=(0, 1))
     grid.add_column(width=4)
     grid.add_column(ratio=1)
     grid.add_column(justify="right", width=4)
 
     grid.add_row(
-        Text(f"{label:<3}", style="cyan"),
+        Text(f"{label:<3}", style=theme["label"]),
         BlockBar(
             value,
             show_brackets=False,
-            fill_style=severity_style(value),
-            empty_style="grey35",
+            fill_style=severity,
+            empty_style=theme["bar.track"],
         ),
-        Text(f"{value:>3}%", style=severity_style(value)),
+        Text(f"{value:>3}%", style=severity),
     )
     return grid
 
 
 def info_row(pods: int, latency_ms: int) -> Table:
     """Build the bottom information row for a node panel."""
+    value_style = get_theme()["value"]
+
     grid = Table.grid(expand=True, padding=(0, 1))
     grid.add_column(ratio=1)
     grid.add_column(justify="right")
 
     grid.add_row(
-        Text(f"Pods: {pods}", style="yellow"),
-        Text(f"Lat: {latency_ms}ms", style="yellow"),
+        Text(f"Pods: {pods}", style=value_style),
+        Text(f"Lat: {latency_ms}ms", style=value_style),
     )
     return grid
 
 
 def build_node_title(node: dict) -> Text:
     """Build the panel title for a node."""
+    theme = get_theme()
     title = Text()
-    title.append(node["name"], style="bold")
+    title.append(node["name"], style=theme["title"])
     title.append(" | ")
-    title.append(node["role"], style="magenta")
+    title.append(node["role"], style=theme["node.role"])
     title.append(" | ")
     title.append_text(format_status(node["status"]))
     return title
@@ -182,24 +323,35 @@ def build_node_title(node: dict) -> Text:
 
 def build_empty_node_panel(title: str = "Empty") -> Panel:
     """Build a placeholder panel for unused grid cells."""
+    theme = get_theme()
     return Panel(
-        Align.center(Text("—", style="grey50"), vertical="middle"),
-        title=Text(title, style="grey50"),
-        border_style="grey50",
+        Align.center(Text("—", style=theme["muted"]), vertical="middle"),
+        title=Text(title, style=theme["muted"]),
+        border_style=theme["border.muted"],
         padding=(0, 1),
     )
 
 
-def build_node_panel(node: dict) -> Panel:
+def build_node_panel(node: dict, trend=()) -> Panel:
     """Build a full node panel from a node-state dictionary.
 
     The panel contains:
         - A title with node name, role, and readiness status
+        - A CPU trend sparkline (in place of the top spacer) if *trend* is set
         - CPU / RAM / Disk metric rows
         - One compact info row with pod count and latency
     """
-    content = Group(
-        ROW_SPACER,
+    return _assemble_node_panel(node, TrendRow("TRD", trend) if trend else None)
+
+
+def _assemble_node_panel(node: dict, trend_row: TrendRow | None) -> Panel:
+    """Build a node panel around an existing (or no) trend row."""
+    return _wrap_node_panel(build_node_title(node), trend_row, _node_panel_rows(node))
+
+
+def _node_panel_rows(node: dict) -> tuple:
+    """Build the rows below the trend slot of a node panel."""
+    return (
         metric_row("CPU", node["cpu"]),
         ROW_SPACER,
         metric_row("RAM", node["memory"]),
@@ -209,9 +361,90 @@ def build_node_panel(node: dict) -> Panel:
         info_row(node["pods"], node["latency_ms"]),
     )
 
+
+def _wrap_node_panel(title: Text, trend_row: TrendRow | None, rows: tuple) -> Panel:
+    """Put a trend row (or spacer) and prebuilt *rows* into a node panel."""
     return Panel(
-        content,
-        title=build_node_title(node),
-        border_style="blue",
+        Group(trend_row if trend_row is not None else ROW_SPACER, *rows),
+        title=title,
+        border_style=get_theme()["border.panel"],
         padding=(0, 1),
-    )
\ No newline at end of file
+    )
+
+
+# ---------------------------------------------------------------------------
+# Panel cache
+# ---------------------------------------------------------------------------
+
+
+class PanelCache:
+    """LRU cache of node panels keyed on the values each panel displays.
+
+    A node whose displayed fields did not change since the previous frame
+    gets the exact same ``Panel`` object back, so nothing is rebuilt. The
+    trend slides every tick, so it is not part of the key: when it changed,
+    the cached title and rows are wrapped into a new ``Panel`` with a new
+    :class:`TrendRow`. Panels already handed out are never modified.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_PANEL_CACHE_SIZE) -> None:
+        self.max_size = max(1, max_size)
+        #: ``(panel, title, rows, trend)`` per key.
+        self._panels: OrderedDict[tuple, tuple[Panel, Text, tuple, Any]] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._panels)
+
+    def resize(self, max_size: int) -> None:
+        """Change the capacity, evicting least recently used panels."""
+        self.max_size = max(1, max_size)
+        while len(self._panels) > self.max_size:
+            self._panels.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached panel."""
+        self._panels.clear()
+
+    def get(self, node: dict, trend=()) -> Panel:
+        """Return the cached panel for *node* and *trend*, building it on a miss."""
+        key = (*(node[field] for field in PANEL_KEY_FIELDS), bool(trend))
+
+        entry = self._panels.get(key)
+        if entry is not None:
+            self._panels.move_to_end(key)
+            self.hits += 1
+            panel, title, rows, cached_trend = entry
+            if trend and trend != cached_trend:
+                panel = _wrap_node_panel(title, TrendRow("TRD", trend), rows)
+                self._panels[key] = (panel, title, rows, trend)
+            return panel
+
+        self.misses += 1
+        title = build_node_title(node)
+        rows = _node_panel_rows(node)
+        panel = _wrap_node_panel(title, TrendRow("TRD", trend) if trend else None, rows)
+        self._panels[key] = (panel, title, rows, trend)
+        if len(self._panels) > self.max_size:
+            self._panels.popitem(last=False)
+        return panel
+
+
+#: Shared panel cache used by the node grid.
+_PANEL_CACHE: PanelCache = PanelCache()
+
+
+def get_panel_cache() -> PanelCache:
+    """Return the shared node-panel cache."""
+    return _PANEL_CACHE
+
+
+def build_node_panel_cached(node: dict, trend=()) -> Panel:
+    """Return a node panel from the shared cache, building it if needed."""
+    return _PANEL_CACHE.get(node, trend)
+
+
+# Cached panels and bar segments hold the previous theme's styles.
+on_theme_change(_PANEL_CACHE.clear)
+on_theme_change(_BAR_CACHE.clear)
@@ -5,17 +5,35 @@ Nodes page builder for the dashboard content area.
 
 This module owns the full structure of the ``nodes`` view, including:
     - cluster summary
-    - node grid
-    - alerts panel
+    - paged node grid with a position indicator
+    - alerts panel (recent events from the alert history store)
 
 It also owns the node-grid preset definition and fallback behavior.
+
+The grid is virtualized: only the nodes on the visible page are
+materialized and turned into panels, so the per-frame cost depends on the
+grid capacity rather than on the cluster size. Sorted modes read the
+snapshot's incrementally maintained top-K rankings (see :mod:`data.topk`)
+and only fall back to a full sort for pages beyond the published depth.
 """
 
+from typing import Sequence
+
 from rich.layout import Layout
 
 from config import GRID_PRESET
-from ui.components import build_alerts_placeholder, build_cluster_summary
-from ui.node_panel import build_empty_node_panel, build_node_panel
+from data.topk import select_ranked
+from ui.components import (
+    build_alerts_panel,
+    build_cluster_summary,
+    build_page_indicator,
+)
+from ui.node_panel import (
+    build_empty_node_panel,
+    build_node_panel_cached,
+    get_panel_cache,
+)
+from ui.theme import on_theme_change
 
 
 # ---------------------------------------------------------------------------
@@ -33,8 +51,30 @@ _GRID_PRESETS: dict[str, tuple[int, int]] = {
 DEFAULT_GRID_COLS: int = 3
 DEFAULT_GRID_ROWS: int = 3
 
+#: Node-grid sort modes in keyboard cycle order, with indicator labels.
+#: ``provider`` keeps the provider's node order; the others are ranked
+#: worst-first (see :data:`data.topk.RANKED_MODES`).
+SORT_MODE_LABELS: dict[str, str] = {
+    "provider": "Provider order",
+    "cpu": "CPU",
+    "memory": "Memory",
+    "disk": "Disk",
+    "latency": "Latency",
+    "notready": "NotReady first",
+}
+
+#: Sort mode keeping the provider's node order.
+DEFAULT_SORT_MODE: str = "provider"
+
+#: Number of recent CPU samples drawn as the trend of each node panel.
+NODE_TREND_WINDOW: int = 32
+
+#: Data sources read by the nodes page (see :mod:`data.providers`).
+DATA_SOURCES: tuple[str, ...] = ("cluster", "prometheus")
+
 #: Static section sizes inside the nodes page.
 SUMMARY_HEIGHT: int = 4
+POSITION_HEIGHT: int = 1
 ALERTS_HEIGHT: int = 6
 
 
@@ -55,40 +95,163 @@ def _resolve_grid_preset() -> tuple[int, int]:
     )
 
 
-def _build_node_grid_layout(nodes: list[dict]) -> Layout:
-    """Build a fixed-size node grid as a nested Rich layout.
+class _NodesPageSkeleton:
+    """Persistent nodes-page layout tree for one grid preset.
+
+    The page split, row splits and cell splits are built once. Each frame
+    only swaps renderables into existing ``Layout`` nodes, and grid cells
+    are only updated when their panel object actually changed.
+    """
+
+    def __init__(self, grid_cols: int, grid_rows: int) -> None:
+        self.page = Layout(name="nodes_page")
+        self.page.split_column(
+            Layout(name="summary", size=SUMMARY_HEIGHT),
+            Layout(name="position", size=POSITION_HEIGHT),
+            Layout(name="nodes"),
+            Layout(name="alerts", size=ALERTS_HEIGHT),
+        )
+
+        self.grid = Layout(name="nodes_grid")
+        self.grid.split_column(
+            *[Layout(name=f"grid_row_{row}", ratio=1) for row in range(grid_rows)]
+        )
+
+        for row in range(grid_rows):
+            self.grid[f"grid_row_{row}"].split_row(
+                *[
+                    Layout(name=f"grid_cell_{row * grid_cols + col}", ratio=1)
+                    for col in range(grid_cols)
+                ]
+            )
+
+        self.page["nodes"].update(self.grid)
+
+        self.summary: Layout = self.page["summary"]
+        self.position: Layout = self.page["position"]
+        self.alerts: Layout = self.page["alerts"]
+        self.cells: list[Layout] = [
+            self.grid[f"grid_cell_{idx}"] for idx in range(grid_cols * grid_rows)
+        ]
+        self.shown: list = [None] * len(self.cells)
+        self.empty_panel = build_empty_node_panel()
+
+    def restyle(self) -> None:
+        """Rebuild the themed empty panel and force every cell to update."""
+        self.empty_panel = build_empty_node_panel()
+        self.shown = [None] * len(self.cells)
+
+    def update_cells(self, panels: list) -> int:
+        """Place *panels* into the grid, touching only changed cells.
+
+        Returns:
+            The number of cells that were updated.
+        """
+        updated = 0
+        for idx, cell in enumerate(self.cells):
+            panel = panels[idx] if idx < len(panels) else self.empty_panel
+            if panel is not self.shown[idx]:
+                cell.update(panel)
+                self.shown[idx] = panel
+                updated += 1
+        return updated
+
+
+#: Persistent page skeletons keyed by ``(grid_cols, grid_rows)``.
+_SKELETONS: dict[tuple[int, int], _NodesPageSkeleton] = {}
+
+
+def _restyle_skeletons() -> None:
+    """Drop theme-dependent state of every skeleton after a theme change."""
+    for skeleton in _SKELETONS.values():
+        skeleton.restyle()
+
+
+on_theme_change(_restyle_skeletons)
+
+
+def _get_skeleton() -> _NodesPageSkeleton:
+    """Return the persistent page skeleton for the active grid preset."""
+    preset = _resolve_grid_preset()
+    skeleton = _SKELETONS.get(preset)
+    if skeleton is None:
+        skeleton = _NodesPageSkeleton(*preset)
+        _SKELETONS[preset] = skeleton
+    return skeleton
+
+
+def _build_node_grid_layout(
+    nodes: Sequence[dict],
+    page: int = 0,
+    sort_mode: str = DEFAULT_SORT_MODE,
+    rankings: dict[str, list[int]] | None = None,
+    history=None,
+) -> Layout:
+    """Refresh the persistent node grid with one page of nodes.
 
     Args:
-        nodes: List of node-state dictionaries.
+        nodes: Sequence of node-state dictionaries, such as a list or a
+            columnar ``NodeTable`` (required for sorted modes). Only the
+            rows of the visible page are materialized.
+        page: 0-based page index; clamped to the available pages.
+        sort_mode: One of :data:`SORT_MODE_LABELS`.
+        rankings: The snapshot's published top row indices per sort mode.
+        history: Metric history supplying each visible node's CPU trend.
 
     Returns:
-        A Rich ``Layout`` containing the node grid.
+        The persistent Rich ``Layout`` containing the node grid.
     """
-    grid_cols, grid_rows = _resolve_grid_preset()
-    capacity = grid_cols * grid_rows
+    skeleton = _get_skeleton()
+    capacity = len(skeleton.cells)
+    total = len(nodes)
+    pages = count_node_pages(total)
+    page = min(max(page, 0), pages - 1)
+    offset = page * capacity
+
+    # Keep the current and the previous page of panels warm.
+    get_panel_cache().resize(2 * capacity)
+    if sort_mode == DEFAULT_SORT_MODE:
+        visible = nodes[offset : offset + capacity]
+    else:
+        ranked = select_ranked(nodes, rankings, sort_mode, offset, offset + capacity)
+        visible = [nodes[index] for index in ranked]
+    panels = [
+        build_node_panel_cached(
+            node,
+            history.node_window(node["name"], "cpu", NODE_TREND_WINDOW) if history else (),
+        )
+        for node in visible
+    ]
+
+    skeleton.update_cells(panels)
+    skeleton.position.update(
+        build_page_indicator(
+            offset + 1 if visible else 0,
+            offset + len(visible),
+            total,
+            page,
+            pages,
+            SORT_MODE_LABELS.get(sort_mode, sort_mode),
+        )
+    )
+    return skeleton.grid
 
-    panels = [build_node_panel(node) for node in nodes[:capacity]]
 
-    while len(panels) < capacity:
-        panels.append(build_empty_node_panel())
+# ---------------------------------------------------------------------------
+# Paging helpers
+# ---------------------------------------------------------------------------
 
-    grid = Layout(name="nodes_grid")
-    grid.split_column(
-        *[Layout(name=f"grid_row_{row}", ratio=1) for row in range(grid_rows)]
-    )
 
-    for row in range(grid_rows):
-        grid[f"grid_row_{row}"].split_row(
-            *[
-                Layout(name=f"grid_cell_{row * grid_cols + col}", ratio=1)
-                for col in range(grid_cols)
-            ]
-        )
+def get_grid_capacity() -> int:
+    """Return the number of node cells in the active grid preset."""
+    cols, rows = _resolve_grid_preset()
+    return cols * rows
 
-    for idx, panel in enumerate(panels):
-        grid[f"grid_cell_{idx}"].update(panel)
 
-    return grid
+def count_node_pages(node_count: int) -> int:
+    """Return the number of grid pages needed for *node_count* nodes (at least 1)."""
+    capacity = get_grid_capacity()
+    return max(1, -(-node_count // capacity))
 
 
 # ---------------------------------------------------------------------------
@@ -96,29 +259,49 @@ def _build_node_grid_layout(nodes: list[dict]) -> Layout:
 # ---------------------------------------------------------------------------
 
 
-def build_nodes_page(cluster: dict) -> Layout:
-    """Build the nodes page as a nested layout.
+def build_nodes_page(
+    cluster: dict,
+    page: int = 0,
+    prometheus_health: str = "Unknown",
+    sort_mode: str = DEFAULT_SORT_MODE,
+) -> Layout:
+    """Refresh and return the nodes page layout.
 
     The nodes page keeps a stable vertical structure consisting of:
         - cluster summary
+        - page position indicator
         - node grid
         - alerts panel
 
+    The layout tree is built once per grid preset and reused across frames;
+    only the renderables inside it are replaced.
+
     Args:
         cluster: Full cluster-state dictionary.
+        page: 0-based node-grid page to show.
+        prometheus_health: Prometheus health shown in the cluster summary.
+        sort_mode: Node-grid order, one of :data:`SORT_MODE_LABELS`.
 
     Returns:
-        A Rich ``Layout`` representing the complete nodes page.
+        The persistent Rich ``Layout`` representing the complete nodes page.
     """
-    page = Layout(name="nodes_page")
-    page.split_column(
-        Layout(name="summary", size=SUMMARY_HEIGHT),
-        Layout(name="nodes"),
-        Layout(name="alerts", size=ALERTS_HEIGHT),
+    skeleton = _get_skeleton()
+
+    skeleton.summary.update(build_cluster_summary(cluster["summary"], prometheus_health))
+    _build_node_grid_layout(
+        cluster["nodes"],
+        page,
+        sort_mode,
+        cluster.get("rankings"),
+        cluster.get("history"),
+    )
+    skeleton.alerts.update(
+        build_alerts_panel(
+            cluster["alerts"],
+            cluster["summary"],
+            cluster.get("alert_history"),
+            ALERTS_HEIGHT - 2,
+        )
     )
 
-    page["summary"].update(build_cluster_summary(cluster["summary"]))
-    page["nodes"].update(_build_node_grid_layout(cluster["nodes"]))
-    page["alerts"].update(build_alerts_placeholder())
-
-    return page
\ No newline at end of file
+    return skeleton.page
@@ -5,25 +5,39 @@ Page-level routing for the dashboard content area.
 
 This module is responsible for selecting which page renderable should be
 placed into the main ``content`` slot based on the active view identifier.
+
+It also maps each view to the data sources its page declares, so the
+orchestration layer only fetches data for the visible page.
+
+Page modules are imported lazily, on the first frame that shows them, so
+startup only pays for the page that is actually visible.
 """
 
+import importlib
+from types import ModuleType
+from typing import Any
+
 from rich.align import Align
 from rich.panel import Panel
 from rich.text import Text
 
-from ui.nodes_page import build_nodes_page
+from ui.theme import get_theme
 
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
+#: Page module per implemented view. Each module declares the data sources
+#: it reads as ``DATA_SOURCES``; views without an entry are static and need
+#: no data.
+PAGE_MODULES: dict[str, str] = {
+    "nodes": "ui.nodes_page",
+    "prometheus": "ui.prometheus_page",
+}
+
 #: Static page metadata for views that are not implemented yet.
 _PLACEHOLDER_PAGES: dict[str, tuple[str, str]] = {
-    "prometheus": (
-        "Prometheus",
-        "Prometheus page is not implemented yet.",
-    ),
     "cluster": (
         "Cluster",
         "Cluster page is not implemented yet.",
@@ -54,30 +68,78 @@ def build_placeholder_page(title: str, message: str) -> Panel:
     Returns:
         A Rich ``Panel`` with centered placeholder text.
     """
+    theme = get_theme()
     content = Align.center(
-        Text(message, style="yellow"),
+        Text(message, style=theme["notice"]),
         vertical="middle",
     )
 
     return Panel(
         content,
         title=title,
-        border_style="yellow",
+        border_style=theme["border.notice"],
     )
 
 
-def build_content_page(view_id: str, cluster: dict):
+def load_page(view_id: str) -> ModuleType:
+    """Import (once) and return the page module of *view_id*.
+
+    Raises:
+        KeyError: If *view_id* has no page module.
+    """
+    return importlib.import_module(PAGE_MODULES[view_id])
+
+
+def view_sources(view_id: str) -> tuple[str, ...]:
+    """Return the data sources the page of *view_id* reads (empty if static)."""
+    if view_id not in PAGE_MODULES:
+        return ()
+    return load_page(view_id).DATA_SOURCES
+
+
+def _prometheus_health(data: dict[str, Any]) -> str:
+    """Return the Prometheus health word shown in the cluster summary."""
+    if "prometheus" not in data:
+        return "Not configured"
+    if data["prometheus"] is None:
+        return "Pending"
+    return data["prometheus"]["health"]
+
+
+def build_content_page(
+    view_id: str,
+    data: dict[str, Any] | None = None,
+    node_page: int = 0,
+    node_sort: str = "provider",
+):
     """Build the content renderable for the currently active view.
 
     Args:
         view_id: Identifier of the active content view.
-        cluster: Full cluster-state dictionary.
+        data: ``{source: snapshot}`` for the sources of *view_id* (see
+            :func:`view_sources`). A missing key means the source is not
+            configured; ``None`` means its first snapshot is still pending.
+        node_page: 0-based page of the node grid on the nodes view.
+        node_sort: Node-grid sort mode on the nodes view.
 
     Returns:
         A Rich renderable representing the selected page.
     """
+    data = data or {}
+
     if view_id == "nodes":
-        return build_nodes_page(cluster)
+        cluster = data.get("cluster")
+        if cluster is None:
+            return build_placeholder_page("Nodes", "Waiting for cluster data...")
+        return load_page("nodes").build_nodes_page(
+            cluster, node_page, _prometheus_health(data), node_sort
+        )
+
+    if view_id == "prometheus":
+        return load_page("prometheus").build_prometheus_page(
+            data.get("prometheus"),
+            configured="prometheus" in data,
+        )
 
     title, message = _PLACEHOLDER_PAGES.get(
         view_id,
@@ -0,0 +1,123 @@
+"""
+ui/prometheus_page.py
+=====================
+Prometheus page builder for the dashboard content area.
+
+This module renders the state returned by
+:class:`data.prometheus.PrometheusProvider`: a status line with the server
+URL, health and refresh statistics, followed by one table row per query.
+
+The builder is presentation-only; queries are run upstream by the
+background fetcher.
+"""
+
+import math
+
+from rich.console import Group
+from rich.panel import Panel
+from rich.style import Style
+from rich.table import Table
+from rich.text import Text
+
+from ui.components import PROMETHEUS_HEALTH_STYLES
+from ui.theme import get_theme
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Data sources read by the Prometheus page (see :mod:`data.providers`).
+DATA_SOURCES: tuple[str, ...] = ("prometheus",)
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _format_value(value: float | None) -> str:
+    """Format a query value compactly (``-`` when missing, ``NaN`` / ``±Inf``)."""
+    if value is None:
+        return "-"
+    if not math.isfinite(value):
+        # Prometheus returns these e.g. for 0/0 ratios or division by zero.
+        return "NaN" if math.isnan(value) else ("+Inf" if value > 0 else "-Inf")
+    if value == int(value) and abs(value) < 1e12:
+        return str(int(value))
+    return f"{value:.3g}" if abs(value) >= 1000 else f"{value:.2f}"
+
+
+def _build_status_line(prometheus: dict) -> Text:
+    """Build the status line above the query table."""
+    theme = get_theme()
+    health = prometheus["health"]
+    line = Text("Server: ", style=theme["subtle"])
+    line.append(prometheus["url"], style=theme["label"])
+    line.append("  |  Health: ", style=theme["subtle"])
+    line.append(health, style=theme[PROMETHEUS_HEALTH_STYLES.get(health, "notice")])
+    line.append(
+        f"  |  {prometheus['requests']} requests in {prometheus['duration'] * 1000:.0f} ms"
+        f"  |  errors: {prometheus['errors']}",
+        style=theme["subtle"],
+    )
+    return line
+
+
+def _build_query_table(results: dict[str, dict]) -> Table:
+    """Build the per-query result table."""
+    theme = get_theme()
+    table = Table(expand=True, box=None, padding=(0, 1), header_style=theme["accent"])
+    table.add_column("Query", no_wrap=True)
+    table.add_column("Kind", no_wrap=True)
+    table.add_column("Series", justify="right")
+    table.add_column("Value", justify="right")
+    table.add_column("ms", justify="right")
+    table.add_column("Status", ratio=1, overflow="ellipsis", no_wrap=True)
+
+    for query_id, result in results.items():
+        error = result["error"]
+        table.add_row(
+            query_id,
+            result["kind"],
+            str(result["series"]),
+            _format_value(result["value"]),
+            f"{result['duration'] * 1000:.0f}",
+            Text(error, style=theme["error"]) if error else Text("ok", style=theme["ok"]),
+        )
+    return table
+
+
+# ---------------------------------------------------------------------------
+# Public page builder
+# ---------------------------------------------------------------------------
+
+
+def build_prometheus_page(prometheus: dict | None, configured: bool = True) -> Panel:
+    """Build the Prometheus page.
+
+    Args:
+        prometheus: Latest Prometheus state, or ``None`` while the first
+            refresh is still running.
+        configured: ``False`` if no Prometheus server is configured.
+
+    Returns:
+        A Rich ``Panel`` representing the complete Prometheus page.
+    """
+    theme = get_theme()
+    if not configured:
+        message = Text("Prometheus is not configured (set PROMETHEUS_URL).", style=theme["notice"])
+        return Panel(message, title="Prometheus", border_style=theme["border.notice"])
+
+    if prometheus is None:
+        message = Text("Waiting for Prometheus data...", style=theme["notice"])
+        return Panel(message, title="Prometheus", border_style=theme["border.notice"])
+
+    content = Group(
+        _build_status_line(prometheus),
+        Text(),
+        _build_query_table(prometheus["results"]),
+    )
+    # Borders take only the colour of the health style.
+    health_style = theme[PROMETHEUS_HEALTH_STYLES.get(prometheus["health"], "notice")]
+    return Panel(content, title="Prometheus", border_style=Style(color=health_style.color))
@@ -0,0 +1,103 @@
+"""
+ui/regions.py
+=============
+Change tracking for the top-level dashboard layout regions.
+
+The dashboard shell from :mod:`ui.layout` has four regions that are filled
+by independent builders: ``header``, ``sidebar``, ``content`` and
+``footer``. This module lets the orchestration layer describe each region's
+inputs as a hashable key and only re-run a builder when that key changed.
+
+Typical usage::
+
+    regions = RegionTracker(layout)
+    regions.begin_frame()
+    regions.update("sidebar", current_view, build_sidebar, MENU_ITEMS, current_view)
+"""
+
+from typing import Any, Callable
+
+from rich.layout import Layout
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Top-level regions defined by :func:`ui.layout.build_layout`.
+REGION_NAMES: tuple[str, ...] = ("header", "sidebar", "content", "footer")
+
+#: Sentinel key that never equals any real input key.
+_NEVER_BUILT = object()
+
+
+# ---------------------------------------------------------------------------
+# Region tracker
+# ---------------------------------------------------------------------------
+
+
+class RegionTracker:
+    """Rebuild layout regions only when their inputs changed.
+
+    Frame statistics are available through :attr:`built` and
+    :attr:`skipped` (current frame) and :attr:`last_built` /
+    :attr:`last_skipped` (previous completed frame).
+    """
+
+    def __init__(self, layout: Layout, regions: tuple[str, ...] = REGION_NAMES) -> None:
+        """Initialize the tracker.
+
+        Args:
+            layout: The dashboard shell layout.
+            regions: Names of the tracked regions.
+        """
+        self._regions: dict[str, Layout] = {name: layout[name] for name in regions}
+        self._keys: dict[str, Any] = {name: _NEVER_BUILT for name in regions}
+
+        self.built: int = 0
+        self.skipped: int = 0
+        self.last_built: int = 0
+        self.last_skipped: int = 0
+
+    @property
+    def region_count(self) -> int:
+        """Number of tracked regions."""
+        return len(self._regions)
+
+    def begin_frame(self) -> None:
+        """Start a new frame and roll the per-frame statistics over."""
+        self.last_built = self.built
+        self.last_skipped = self.skipped
+        self.built = 0
+        self.skipped = 0
+
+    def update(self, region: str, key: Any, builder: Callable[..., Any], *args: Any) -> bool:
+        """Rebuild *region* with ``builder(*args)`` if *key* changed.
+
+        Args:
+            region: Name of a tracked region.
+            key: Hashable/comparable summary of every input the builder uses.
+            builder: Renderable builder for the region.
+            *args: Positional arguments passed to *builder*.
+
+        Returns:
+            ``True`` if the region was rebuilt, ``False`` if it was skipped.
+        """
+        if self._keys[region] == key:
+            self.skipped += 1
+            return False
+
+        self._regions[region].update(builder(*args))
+        self._keys[region] = key
+        self.built += 1
+        return True
+
+    def set_size(self, region: str, size: int | None) -> None:
+        """Set the fixed height of *region* (``None`` for flexible)."""
+        self._regions[region].size = size
+
+    def invalidate(self, region: str | None = None) -> None:
+        """Force *region* (or every region) to rebuild on its next update."""
+        names = self._keys if region is None else (region,)
+        for name in names:
+            self._keys[name] = _NEVER_BUILT
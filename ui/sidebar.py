@@ -12,6 +12,8 @@ from rich.console import Group
 from rich.panel import Panel
 from rich.text import Text
 
+from ui.theme import get_theme
+
 
 def _build_menu_item(shortcut: str, view_id: str, label: str, current_view: str) -> Text:
     """Build one navigation menu item.
@@ -29,11 +31,13 @@ def _build_menu_item(shortcut: str, view_id: str, label: str, current_view: str)
         A Rich ``Text`` object representing one menu line.
     """
     is_active = view_id == current_view
+    theme = get_theme()
+    text_style = theme["accent"] if is_active else theme["text"]
 
     item = Text()
-    item.append("> " if is_active else "  ", style="bold cyan" if is_active else "grey50")
-    item.append(f"{shortcut}. ", style="bold cyan" if is_active else "white")
-    item.append(label, style="bold cyan" if is_active else "white")
+    item.append("> " if is_active else "  ", style=theme["accent"] if is_active else theme["muted"])
+    item.append(f"{shortcut}. ", style=text_style)
+    item.append(label, style=text_style)
 
     return item
 
@@ -62,6 +66,6 @@ def build_sidebar(
     return Panel(
         content,
         title="Navigation",
-        border_style="blue",
+        border_style=get_theme()["border.panel"],
         padding=(0, 1),
     )
\ No newline at end of file
@@ -0,0 +1,293 @@
+"""
+ui/theme.py
+===========
+Theme registry for the dashboard renderables.
+
+A theme maps named roles (severity levels, node status, borders, labels,
+bar parts, ...) to Rich styles. Palettes are written as style strings and
+compiled to :class:`rich.style.Style` objects once, when the theme is
+created, so builders hand pre-parsed styles to Rich and no style string is
+parsed per frame.
+
+Severity styles are additionally compiled to a lookup table per
+percentage, so :meth:`Theme.severity` is a single index operation.
+
+The active theme can be swapped at runtime with :func:`set_theme`.
+Modules that cache rendered output register a callback with
+:func:`on_theme_change` to drop it when the theme changes.
+
+Typical usage::
+
+    from ui.theme import get_theme
+    theme = get_theme()
+    Text("CPU", style=theme["label"])
+"""
+
+from typing import Callable
+
+from rich.style import Style
+
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+#: Severity threshold for warning state (percent).
+WARN_THRESHOLD: int = 60
+
+#: Severity threshold for critical state (percent).
+CRIT_THRESHOLD: int = 85
+
+#: Default palette; every role a theme can define, with its default style.
+DEFAULT_PALETTE: dict[str, str] = {
+    # Text
+    "text": "white",
+    "title": "bold",
+    "label": "cyan",
+    "accent": "bold cyan",
+    "value": "yellow",
+    "node.role": "magenta",
+    "notice": "yellow",
+    "error": "red",
+    "ok": "green",
+    "muted": "grey50",
+    "subtle": "grey70",
+    # Severity of utilization percentages
+    "severity.ok": "green",
+    "severity.warn": "yellow",
+    "severity.crit": "bold red",
+    # Node readiness
+    "status.ready": "green",
+    "status.notready": "bold red",
+    # Prometheus health
+    "health.healthy": "green",
+    "health.degraded": "yellow",
+    "health.down": "bold red",
+    # Panel borders
+    "border.panel": "blue",
+    "border.header": "cyan",
+    "border.summary": "green",
+    "border.notice": "yellow",
+    "border.muted": "grey50",
+    # Block bars
+    "bar.fill": "white",
+    "bar.empty": "grey50",
+    "bar.track": "grey35",
+    "bar.bracket": "grey70",
+}
+
+#: Built-in palettes; roles missing from a palette use :data:`DEFAULT_PALETTE`.
+PALETTES: dict[str, dict[str, str]] = {
+    "default": {},
+    "light": {
+        "text": "black",
+        "label": "blue",
+        "accent": "bold blue",
+        "value": "dark_orange3",
+        "node.role": "dark_magenta",
+        "notice": "dark_orange3",
+        "error": "red3",
+        "ok": "green4",
+        "muted": "grey46",
+        "subtle": "grey35",
+        "severity.ok": "green4",
+        "severity.warn": "dark_orange3",
+        "severity.crit": "bold red3",
+        "status.ready": "green4",
+        "status.notready": "bold red3",
+        "health.healthy": "green4",
+        "health.degraded": "dark_orange3",
+        "health.down": "bold red3",
+        "border.panel": "blue",
+        "border.header": "blue",
+        "border.summary": "green4",
+        "border.notice": "dark_orange3",
+        "border.muted": "grey62",
+        "bar.fill": "grey23",
+        "bar.empty": "grey70",
+        "bar.track": "grey82",
+        "bar.bracket": "grey46",
+    },
+    "mono": {
+        "text": "default",
+        "title": "bold",
+        "label": "bold",
+        "accent": "bold reverse",
+        "value": "default",
+        "node.role": "italic",
+        "notice": "bold",
+        "error": "bold underline",
+        "ok": "default",
+        "muted": "dim",
+        "subtle": "default",
+        "severity.ok": "default",
+        "severity.warn": "bold",
+        "severity.crit": "bold reverse",
+        "status.ready": "default",
+        "status.notready": "bold reverse",
+        "health.healthy": "default",
+        "health.degraded": "bold",
+        "health.down": "bold reverse",
+        "border.panel": "default",
+        "border.header": "bold",
+        "border.summary": "default",
+        "border.notice": "bold",
+        "border.muted": "dim",
+        "bar.fill": "default",
+        "bar.empty": "dim",
+        "bar.track": "dim",
+        "bar.bracket": "dim",
+    },
+}
+
+#: Theme active at startup.
+DEFAULT_THEME: str = "default"
+
+
+# ---------------------------------------------------------------------------
+# Theme
+# ---------------------------------------------------------------------------
+
+
+class Theme:
+    """A palette compiled to Rich ``Style`` objects."""
+
+    def __init__(self, name: str, palette: dict[str, str]) -> None:
+        """Compile *palette* on top of :data:`DEFAULT_PALETTE`.
+
+        Args:
+            name: Theme name.
+            palette: Style string per role; missing roles use the default.
+
+        Raises:
+            ValueError: If *palette* names an unknown role.
+            rich.errors.StyleSyntaxError: If a style string is invalid.
+        """
+        unknown = set(palette) - set(DEFAULT_PALETTE)
+        if unknown:
+            raise ValueError(f"unknown theme roles: {', '.join(sorted(unknown))}")
+
+        self.name = name
+        self.styles: dict[str, Style] = {
+            role: Style.parse(palette.get(role, default))
+            for role, default in DEFAULT_PALETTE.items()
+        }
+
+        ok, warn, crit = (
+            self.styles["severity.ok"],
+            self.styles["severity.warn"],
+            self.styles["severity.crit"],
+        )
+        #: Severity style per integer percentage 0..100.
+        self._severity: tuple[Style, ...] = tuple(
+            crit if value >= CRIT_THRESHOLD else warn if value >= WARN_THRESHOLD else ok
+            for value in range(101)
+        )
+        #: Parsed ad-hoc style strings (see :meth:`resolve`).
+        self._parsed: dict[str, Style] = {}
+
+    def __getitem__(self, role: str) -> Style:
+        """Return the compiled style of *role*."""
+        return self.styles[role]
+
+    def severity(self, value: int) -> Style:
+        """Return the severity style for a utilization percentage."""
+        value = int(value)
+        return self._severity[0 if value < 0 else 100 if value > 100 else value]
+
+    def status(self, status: str) -> Style:
+        """Return the style of a node readiness status."""
+        return self.styles["status.ready" if status == "Ready" else "status.notready"]
+
+    def resolve(self, style: str | Style) -> Style:
+        """Return *style* as a ``Style``.
+
+        Role names resolve to the theme's style, other strings are parsed
+        once and cached, ``Style`` objects are returned unchanged.
+        """
+        if isinstance(style, Style):
+            return style
+        resolved = self.styles.get(style)
+        if resolved is None:
+            resolved = self._parsed.get(style)
+            if resolved is None:
+                resolved = self._parsed[style] = Style.parse(style)
+        return resolved
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+#: Registered palettes by theme name, in cycling order.
+_PALETTES: dict[str, dict[str, str]] = dict(PALETTES)
+
+#: Compiled themes by name (compiled on first use).
+_THEMES: dict[str, Theme] = {}
+
+#: Callbacks run after the active theme changed.
+_LISTENERS: list[Callable[[], None]] = []
+
+_active: Theme | None = None
+
+
+def register_theme(name: str, palette: dict[str, str]) -> None:
+    """Register (or replace) the palette of theme *name*.
+
+    Raises:
+        ValueError: If *palette* names an unknown role.
+    """
+    theme = Theme(name, palette)
+    _PALETTES[name] = dict(palette)
+    _THEMES[name] = theme
+    if _active is not None and _active.name == name:
+        set_theme(name)
+
+
+def theme_names() -> tuple[str, ...]:
+    """Return the registered theme names, in cycling order."""
+    return tuple(_PALETTES)
+
+
+def _compiled(name: str) -> Theme:
+    """Return the compiled theme *name*, compiling it on first use."""
+    theme = _THEMES.get(name)
+    if theme is None:
+        if name not in _PALETTES:
+            raise KeyError(f"unknown theme: {name!r}")
+        theme = _THEMES[name] = Theme(name, _PALETTES[name])
+    return theme
+
+
+def get_theme() -> Theme:
+    """Return the active theme."""
+    global _active
+    if _active is None:
+        _active = _compiled(DEFAULT_THEME)
+    return _active
+
+
+def set_theme(name: str) -> Theme:
+    """Activate theme *name* and notify the :func:`on_theme_change` listeners.
+
+    Raises:
+        KeyError: If no theme *name* is registered.
+    """
+    global _active
+    _active = _compiled(name)
+    for listener in _LISTENERS:
+        listener()
+    return _active
+
+
+def next_theme_name() -> str:
+    """Return the theme after the active one, in registration order."""
+    names = theme_names()
+    current = get_theme().name
+    position = names.index(current) if current in names else -1
+    return names[(position + 1) % len(names)]
+
+
+def on_theme_change(listener: Callable[[], None]) -> None:
+    """Call *listener* (without arguments) after every theme change."""
+    _LISTENERS.append(listener)